@@ -0,0 +1 @@
+"""Offline performance benchmarks for liq-metrics (run with ``python -m benchmarks``)."""
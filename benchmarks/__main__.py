@@ -0,0 +1,107 @@
+"""Offline benchmark runner.
+
+Usage (from the repository root)::
+
+    PYTHONPATH=src python -m benchmarks                  # sizes up to 100k, compare
+    PYTHONPATH=src python -m benchmarks --max-size 10000000
+    PYTHONPATH=src python -m benchmarks -k panel --check # exit 1 on regression
+    PYTHONPATH=src python -m benchmarks --update-baseline
+
+Each case/size is timed with :mod:`timeit`: the call count comes from
+``Timer.autorange`` and the reported time is the best per-call time over
+``--repeat`` rounds. Results are compared with ``benchmarks/baselines.json``.
+Baselines are machine-specific, so refresh them on the machine that runs the
+check.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import platform
+import sys
+import timeit
+from pathlib import Path
+
+from benchmarks.cases import CASES, SIZES
+
+BASELINE_PATH = Path(__file__).with_name("baselines.json")
+
+
+def run_case(name: str, size: int, repeat: int) -> float:
+    """Best per-call seconds for one case at one size."""
+    fn = CASES[name].setup(size)
+    timer = timeit.Timer(fn)
+    number, _ = timer.autorange()
+    return min(timer.repeat(repeat=repeat, number=number)) / number
+
+
+def _key(name: str, size: int) -> str:
+    return f"{name}[{size}]"
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks", description=__doc__)
+    parser.add_argument("-k", "--filter", default="", help="substring of case names to run")
+    parser.add_argument("--max-size", type=int, default=100_000)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument(
+        "--tolerance",
+        type=float,
+        default=0.25,
+        help="allowed slowdown vs baseline before flagging (0.25 = 25%%)",
+    )
+    parser.add_argument("--check", action="store_true", help="exit 1 if any case regressed")
+    parser.add_argument("--update-baseline", action="store_true")
+    parser.add_argument("--baseline", type=Path, default=BASELINE_PATH)
+    parser.add_argument("--json", type=Path, help="also write results to this file")
+    args = parser.parse_args(argv)
+
+    baseline: dict[str, float] = {}
+    if args.baseline.exists():
+        baseline = json.loads(args.baseline.read_text())["results"]
+
+    results: dict[str, float] = {}
+    regressions: list[str] = []
+    print(f"{'case':<40} {'seconds':>12} {'baseline':>12} {'ratio':>7}")
+    for name, case in CASES.items():
+        if args.filter not in name:
+            continue
+        for size in SIZES:
+            if size > min(case.max_size, args.max_size):
+                break
+            key = _key(name, size)
+            seconds = results[key] = run_case(name, size, args.repeat)
+            reference = baseline.get(key)
+            ratio = seconds / reference if reference else None
+            flag = ""
+            if ratio is not None and ratio > 1.0 + args.tolerance:
+                regressions.append(key)
+                flag = "  REGRESSION"
+            print(
+                f"{key:<40} {seconds:>12.6f} "
+                f"{reference if reference is not None else float('nan'):>12.6f} "
+                f"{ratio if ratio is not None else float('nan'):>7.2f}{flag}",
+                flush=True,
+            )
+
+    payload = {
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "results": results,
+    }
+    if args.json:
+        args.json.write_text(json.dumps(payload, indent=2) + "\n")
+    if args.update_baseline:
+        merged = {**baseline, **results}
+        payload["results"] = dict(sorted(merged.items()))
+        args.baseline.write_text(json.dumps(payload, indent=2) + "\n")
+        print(f"baseline updated: {args.baseline}")
+    if regressions:
+        print(f"{len(regressions)} regression(s): {', '.join(regressions)}")
+        return 1 if args.check else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
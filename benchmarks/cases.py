@@ -0,0 +1,103 @@
+"""Benchmark case registry.
+
+Each case builds its inputs for a given size outside the timed region and
+returns a zero-argument callable that runs the public function once.
+``max_size`` caps cases whose inputs are Decimal- or object-heavy; the
+runner's ``--max-size`` caps everything further.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from dataclasses import dataclass
+
+from benchmarks import generators
+from liq.metrics import (
+    PerformanceAnalyzer,
+    compute_cost_stress,
+    compute_curve_f_periods,
+    compute_metrics_panel,
+    compute_selector_economics,
+    compute_six_curves,
+    summarize_classification,
+    summarize_regression,
+)
+
+SIZES = (1_000, 10_000, 100_000, 1_000_000, 10_000_000)
+
+
+@dataclass(frozen=True)
+class BenchmarkCase:
+    name: str
+    setup: Callable[[int], Callable[[], object]]
+    max_size: int = SIZES[-1]
+
+
+def _analyze(size: int) -> Callable[[], object]:
+    curve, labels = generators.equity_curve(size)
+    analyzer = PerformanceAnalyzer()
+    return lambda: analyzer.analyze(curve, labels)
+
+
+def _panel(size: int) -> Callable[[], object]:
+    data = generators.panel_data(size)
+    return lambda: compute_metrics_panel(
+        trade_returns_net=data.trade_returns_net,
+        trade_returns_gross=data.trade_returns_gross,
+        daily_returns=data.daily_returns,
+        trade_events=data.trade_events,
+        benchmark_daily_returns=data.benchmark_daily_returns,
+    )
+
+
+def _classification(size: int) -> Callable[[], object]:
+    y_true, y_pred = generators.classification(size)
+    return lambda: summarize_classification(y_true, y_pred)
+
+
+def _regression(size: int) -> Callable[[], object]:
+    y_true, y_pred, log_var = generators.regression(size)
+    return lambda: summarize_regression(y_true, y_pred, log_var)
+
+
+def _selector(size: int) -> Callable[[], object]:
+    inputs = generators.selector(size)
+    return lambda: compute_selector_economics(**inputs)
+
+
+def _cost_stress(size: int) -> Callable[[], object]:
+    inputs = generators.cost_stress(size)
+    return lambda: compute_cost_stress(**inputs)
+
+
+def _six_curves(size: int) -> Callable[[], object]:
+    inputs = generators.six_curve_inputs(size)
+    return lambda: compute_six_curves(inputs)
+
+
+def _curve_f_periods(size: int) -> Callable[[], object]:
+    periods, events, policy = generators.curve_f_periods(size)
+    return lambda: compute_curve_f_periods(periods, events, policy)
+
+
+def _curve_f_periods_growing(size: int) -> Callable[[], object]:
+    # Periods grow with the event count (one per 100 events): exposes the
+    # periods x events product that a fixed period count hides.
+    periods, events, policy = generators.curve_f_periods(size, n_periods=max(1, size // 100))
+    return lambda: compute_curve_f_periods(periods, events, policy)
+
+
+CASES: dict[str, BenchmarkCase] = {
+    case.name: case
+    for case in (
+        BenchmarkCase("performance_analyze", _analyze, max_size=1_000_000),
+        BenchmarkCase("metrics_panel", _panel),
+        BenchmarkCase("summarize_classification", _classification),
+        BenchmarkCase("summarize_regression", _regression),
+        BenchmarkCase("selector_economics", _selector),
+        BenchmarkCase("cost_stress", _cost_stress),
+        BenchmarkCase("six_curves", _six_curves, max_size=1_000_000),
+        BenchmarkCase("curve_f_periods", _curve_f_periods, max_size=1_000_000),
+        BenchmarkCase("curve_f_periods_growing", _curve_f_periods_growing, max_size=10_000),
+    )
+}
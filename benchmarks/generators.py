@@ -0,0 +1,193 @@
+"""Seeded synthetic inputs for the benchmark suite.
+
+Every generator is deterministic for a given ``(size, seed)`` so timings are
+comparable across runs and machines.
+"""
+
+from __future__ import annotations
+
+import random
+from dataclasses import dataclass
+from datetime import UTC, date, datetime, timedelta
+from decimal import Decimal
+
+from liq.metrics.cost_stress import CostScenario, uniform_cost_scenarios
+from liq.metrics.six_curves import SixCurveInputs
+from liq.metrics.tax_curves import (
+    CurveFPeriod,
+    OpenTaxPosition,
+    RealizedTaxEvent,
+    TaxPolicy,
+    TaxRates,
+)
+
+SEED = 20240101
+_START = datetime(2020, 1, 1, tzinfo=UTC)
+_REGIMES = ("bull", "bear", "chop", "crisis")
+_TAX_POLICY = TaxPolicy(
+    rates=TaxRates(
+        short_term=Decimal("0.37"),
+        long_term=Decimal("0.20"),
+        qualified_dividend=Decimal("0.20"),
+        nonqualified_dividend=Decimal("0.37"),
+    ),
+    terminal_assumption="liquidate",
+)
+
+
+def equity_curve(
+    size: int, seed: int = SEED
+) -> tuple[list[tuple[datetime, Decimal]], list[tuple[datetime, str]]]:
+    """Minute-bar equity curve plus regime labels that switch every ~500 bars."""
+    rng = random.Random(seed)
+    value = 100_000.0
+    curve = []
+    labels = []
+    regime = _REGIMES[0]
+    for i in range(size):
+        ts = _START + timedelta(minutes=i)
+        value *= 1.0 + rng.gauss(0.00001, 0.001)
+        if rng.random() < 0.002:
+            regime = rng.choice(_REGIMES)
+        curve.append((ts, Decimal(repr(round(value, 2)))))
+        labels.append((ts, regime))
+    return curve, labels
+
+
+@dataclass(frozen=True)
+class PanelData:
+    trade_returns_net: list[float]
+    trade_returns_gross: list[float]
+    trade_events: list[str]
+    daily_returns: list[float]
+    benchmark_daily_returns: list[float]
+
+
+def panel_data(size: int, seed: int = SEED) -> PanelData:
+    """``size`` trades over ~10 trades per event and ``size / 4`` days."""
+    rng = random.Random(seed)
+    net = [rng.gauss(0.0004, 0.01) for _ in range(size)]
+    n_days = max(2, size // 4)
+    daily = [rng.gauss(0.0003, 0.008) for _ in range(n_days)]
+    n_events = max(1, size // 10)
+    return PanelData(
+        trade_returns_net=net,
+        trade_returns_gross=[r + 0.0003 for r in net],
+        trade_events=[f"evt{rng.randrange(n_events)}" for _ in range(size)],
+        daily_returns=daily,
+        benchmark_daily_returns=[0.7 * r + rng.gauss(0.0, 0.004) for r in daily],
+    )
+
+
+def classification(size: int, seed: int = SEED) -> tuple[list[int], list[int]]:
+    """Binary labels and ~70%-accurate predictions."""
+    rng = random.Random(seed)
+    y_true = [rng.randrange(2) for _ in range(size)]
+    y_pred = [y if rng.random() < 0.7 else 1 - y for y in y_true]
+    return y_true, y_pred
+
+
+def regression(size: int, seed: int = SEED) -> tuple[list[float], list[float], list[float]]:
+    """Targets, noisy predictions and predicted log-variances."""
+    rng = random.Random(seed)
+    y_true = [rng.gauss(0.0, 1.0) for _ in range(size)]
+    y_pred = [y + rng.gauss(0.0, 0.5) for y in y_true]
+    log_var = [rng.uniform(-2.0, 0.0) for _ in range(size)]
+    return y_true, y_pred, log_var
+
+
+def selector(size: int, seed: int = SEED) -> dict[str, list[float] | list[int]]:
+    """Reference / candidate decisions and net / gross outcomes per event."""
+    rng = random.Random(seed)
+    net = [rng.gauss(0.0002, 0.01) for _ in range(size)]
+    return {
+        "reference_decision": [int(rng.random() < 0.5) for _ in range(size)],
+        "candidate_decision": [int(rng.random() < 0.4) for _ in range(size)],
+        "net_outcomes": net,
+        "gross_outcomes": [r + 0.0002 for r in net],
+    }
+
+
+def cost_stress(size: int, seed: int = SEED) -> dict[str, object]:
+    """Gross returns, three cost components and a mixed scenario grid per trade."""
+    rng = random.Random(seed)
+    costs = [[abs(rng.gauss(0.0005, 0.0002)) for _ in range(size)] for _ in range(3)]
+    scenarios = uniform_cost_scenarios([0.0, 0.5, 1.0, 1.5, 2.0, 3.0, 5.0])
+    # Non-proportional multipliers: each is its own cost direction.
+    for i in range(8):
+        scenarios[f"skew{i}"] = CostScenario(1.0 + i, 1.0, 2.0 - i / 8)
+    return {
+        "trade_returns_gross": [rng.gauss(0.001, 0.01) for _ in range(size)],
+        "commission": costs[0],
+        "spread": costs[1],
+        "impact": costs[2],
+        "scenarios": scenarios,
+    }
+
+
+def six_curve_inputs(size: int, seed: int = SEED) -> SixCurveInputs:
+    """``size`` daily periods with realized tax events and open positions."""
+    rng = random.Random(seed)
+    dates = tuple(date(2000, 1, 1) + timedelta(days=i) for i in range(size))
+
+    def returns(sigma: float) -> tuple[Decimal, ...]:
+        return tuple(Decimal(f"{rng.gauss(0.0002, sigma):.6f}") for _ in range(size))
+
+    return SixCurveInputs(
+        dates=dates,
+        starting_capital=Decimal("1000000"),
+        baseline_returns=returns(0.01),
+        overlay_returns=returns(0.012),
+        sleeve_weight=Decimal("0.2"),
+        measured_costs=tuple(Decimal("0.0001") for _ in range(size)),
+        tax_policy=_TAX_POLICY,
+        tax_events=realized_events(max(1, size // 10), dates[0], dates[-1], rng),
+        open_positions=open_positions(20, rng),
+    )
+
+
+def curve_f_periods(
+    size: int, seed: int = SEED, *, n_periods: int = 12
+) -> tuple[list[CurveFPeriod], list[RealizedTaxEvent], TaxPolicy]:
+    """``n_periods`` consecutive 30-day periods over ``size`` realized tax events."""
+    rng = random.Random(seed)
+    start = date(2000, 1, 1)
+    events = realized_events(size, start, start + timedelta(days=30 * n_periods - 1), rng)
+    periods = [
+        CurveFPeriod(
+            label=f"p{k:05d}",
+            start=start + timedelta(days=30 * k),
+            end=start + timedelta(days=30 * k + 29),
+            pre_tax_nav=Decimal("1000000"),
+            open_positions=open_positions(20, rng),
+        )
+        for k in range(n_periods)
+    ]
+    return periods, events, _TAX_POLICY
+
+
+def realized_events(
+    size: int, start: date, end: date, rng: random.Random
+) -> tuple[RealizedTaxEvent, ...]:
+    span = (end - start).days
+    characters = ("short_term", "long_term", "qualified_dividend", "wash_sale_disallowed_loss")
+    return tuple(
+        RealizedTaxEvent(
+            event_date=start + timedelta(days=rng.randrange(span + 1)),
+            amount=Decimal(f"{rng.gauss(100.0, 500.0):.2f}"),
+            character=rng.choice(characters),
+        )
+        for _ in range(size)
+    )
+
+
+def open_positions(count: int, rng: random.Random) -> tuple[OpenTaxPosition, ...]:
+    return tuple(
+        OpenTaxPosition(
+            symbol=f"SYM{i}",
+            cost_basis=Decimal(f"{rng.uniform(1_000, 10_000):.2f}"),
+            market_value=Decimal(f"{rng.uniform(1_000, 10_000):.2f}"),
+            holding_period=rng.choice(("short_term", "long_term")),
+        )
+        for i in range(count)
+    )
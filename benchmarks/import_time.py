@@ -0,0 +1,56 @@
+"""Cold-start import cost of ``liq.metrics``.
+
+Each scenario runs in a fresh interpreter; the reported time is the best of
+``--repeat`` runs minus the best bare-interpreter start-up, so it isolates
+what the import itself costs.
+
+Usage (from the repository root)::
+
+    PYTHONPATH=src python -m benchmarks.import_time --json import_time.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+SCENARIOS = {
+    "package": "import liq.metrics",
+    "summarize_labels": "from liq.metrics import summarize_labels",
+    "metrics_panel": "from liq.metrics import compute_metrics_panel",
+    "everything": "from liq.metrics import *",
+}
+
+
+def best_startup(code: str, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        subprocess.run([sys.executable, "-c", code], check=True)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.import_time", description=__doc__)
+    parser.add_argument("--repeat", type=int, default=10)
+    parser.add_argument("--json", type=Path, help="write results to this file")
+    args = parser.parse_args(argv)
+
+    bare = best_startup("pass", args.repeat)
+    results = {}
+    for name, code in SCENARIOS.items():
+        results[name] = max(0.0, best_startup(code, args.repeat) - bare)
+        print(f"{name:<20} {results[name] * 1000:8.2f} ms", flush=True)
+    if args.json:
+        payload = {"interpreter_startup": bare, "import_seconds": results}
+        args.json.write_text(json.dumps(payload, indent=2) + "\n")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,134 @@
+"""Empirical complexity harness.
+
+Runs every benchmark case over geometric input sizes, records wall time
+(best of ``--repeat`` calls) and the ``tracemalloc`` peak of one call, then
+fits ``log(cost) = a + k * log(size)`` by least squares. ``k`` is the
+empirical exponent: ~1 for linear work, ~2 for quadratic. A case is flagged
+superlinear when its time exponent exceeds ``--threshold``.
+
+Usage (from the repository root)::
+
+    PYTHONPATH=src python -m benchmarks.scaling --json scaling.json
+    PYTHONPATH=src python -m benchmarks.scaling -k curve_f --check
+
+Peak memory is measured in a separate call, because tracing slows the
+interpreter down and would distort the timings. The smallest sizes are
+dominated by fixed overhead, so use at least three sizes spanning 10x or
+more.
+"""
+
+from __future__ import annotations
+
+import argparse
+import gc
+import json
+import math
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+from benchmarks.cases import CASES
+
+
+def geometric_sizes(start: int, stop: int, factor: int) -> list[int]:
+    sizes = []
+    size = start
+    while size <= stop:
+        sizes.append(size)
+        size *= factor
+    return sizes
+
+
+def fit_exponent(sizes: list[int], costs: list[float]) -> float | None:
+    """Least-squares slope of ``log(cost)`` on ``log(size)``; None if undefined."""
+    points = [
+        (math.log(s), math.log(c)) for s, c in zip(sizes, costs, strict=True) if s > 0 and c > 0
+    ]
+    if len(points) < 2:
+        return None
+    mean_x = math.fsum(x for x, _ in points) / len(points)
+    mean_y = math.fsum(y for _, y in points) / len(points)
+    sxx = math.fsum((x - mean_x) ** 2 for x, _ in points)
+    if sxx == 0:
+        return None
+    return math.fsum((x - mean_x) * (y - mean_y) for x, y in points) / sxx
+
+
+def measure(name: str, size: int, repeat: int) -> tuple[float, int]:
+    """Best wall seconds over ``repeat`` calls and the traced peak bytes of one call."""
+    fn = CASES[name].setup(size)
+    best = math.inf
+    for _ in range(repeat):
+        gc.collect()
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    gc.collect()
+    tracemalloc.start()
+    try:
+        fn()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return best, peak
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.scaling", description=__doc__)
+    parser.add_argument("-k", "--filter", default="", help="substring of case names to run")
+    parser.add_argument("--min-size", type=int, default=1_000)
+    parser.add_argument("--max-size", type=int, default=64_000)
+    parser.add_argument("--factor", type=int, default=4)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument(
+        "--threshold", type=float, default=1.25, help="time exponent above which to flag"
+    )
+    parser.add_argument("--check", action="store_true", help="exit 1 if any case is flagged")
+    parser.add_argument("--json", type=Path, help="write the report to this file")
+    args = parser.parse_args(argv)
+
+    report: dict[str, dict[str, object]] = {}
+    for name, case in CASES.items():
+        if args.filter not in name:
+            continue
+        sizes = geometric_sizes(args.min_size, min(args.max_size, case.max_size), args.factor)
+        seconds: list[float] = []
+        peaks: list[int] = []
+        for size in sizes:
+            elapsed, peak = measure(name, size, args.repeat)
+            seconds.append(elapsed)
+            peaks.append(peak)
+        time_exponent = fit_exponent(sizes, seconds)
+        memory_exponent = fit_exponent(sizes, [float(p) for p in peaks])
+        superlinear = time_exponent is not None and time_exponent > args.threshold
+        report[name] = {
+            "sizes": sizes,
+            "seconds": seconds,
+            "peak_bytes": peaks,
+            "time_exponent": time_exponent,
+            "memory_exponent": memory_exponent,
+            "superlinear": superlinear,
+        }
+        print(
+            f"{name:<28} time ~ n^{_fmt(time_exponent)}  memory ~ n^{_fmt(memory_exponent)}"
+            f"{'  SUPERLINEAR' if superlinear else ''}",
+            flush=True,
+        )
+
+    payload = {"threshold": args.threshold, "cases": report}
+    if args.json:
+        args.json.write_text(json.dumps(payload, indent=2) + "\n")
+    flagged = [name for name, entry in report.items() if entry["superlinear"]]
+    if flagged and args.check:
+        print(f"superlinear: {', '.join(flagged)}")
+        return 1
+    return 0
+
+
+def _fmt(exponent: float | None) -> str:
+    return "?" if exponent is None else f"{exponent:.2f}"
+
+
+if __name__ == "__main__":
+    sys.exit(main())
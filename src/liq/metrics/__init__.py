@@ -7,41 +7,130 @@ Functions:
     summarize_qa: Convert QA results to flat dictionaries for reporting.
     summarize_drift: Compute statistics for drift signals from feature pipelines.
     summarize_labels: Count triple-barrier/meta-label outcomes.
+
+Public names are loaded lazily (PEP 562): ``import liq.metrics`` imports no
+submodule, and the first access to a name imports only its defining module.
+Short-lived workers that need one helper therefore skip the tax, panel and
+columnar code, and optional backends never slow down cold start. Type
+checkers read the re-exports from ``__init__.pyi``.
 """
 
-from liq.metrics.drift import summarize_drift
-from liq.metrics.labels import summarize_labels
-from liq.metrics.panel import (
-    METRICS_PANEL_FIELDS,
-    InferenceInputs,
-    MetricsPanel,
-    compute_metrics_panel,
-    write_metrics_panel_csv,
-)
-from liq.metrics.performance import (
-    ComparisonResult,
-    PerformanceAnalyzer,
-    PerformanceReport,
-    RegimeMetrics,
-)
-from liq.metrics.prediction import summarize_classification, summarize_regression
-from liq.metrics.qa import QAResultLike, summarize_qa
-from liq.metrics.selector import SelectorEconomics, compute_selector_economics
-from liq.metrics.six_curves import SixCurveInputs, SixCurveResult, compute_six_curves
-from liq.metrics.tax_curves import (
-    CurveFPeriod,
-    CurveFResult,
-    OpenTaxPosition,
-    RealizedTaxEvent,
-    TaxPolicy,
-    TaxRates,
-    compute_curve_f,
-    compute_curve_f_periods,
-    event_tax,
-    mark_to_market_tax,
-    realized_tax,
-    terminal_open_position_tax,
-)
+from __future__ import annotations
+
+import importlib
+
+# Public name -> defining submodule, imported on first attribute access (PEP 562).
+_LAZY_ATTRS: dict[str, str] = {
+    "MetricsPanel": "liq.metrics.panel",
+    "InferenceInputs": "liq.metrics.panel",
+    "METRICS_PANEL_FIELDS": "liq.metrics.panel",
+    "compute_metrics_panel": "liq.metrics.panel",
+    "write_metrics_panel_csv": "liq.metrics.panel",
+    "EventCodes": "liq.metrics.panel",
+    "factorize_events": "liq.metrics.panel",
+    "compute_metrics_panel_columnar": "liq.metrics.columnar",
+    "compute_metrics_panel_from_tables": "liq.metrics.columnar",
+    "IncrementalMetricsPanel": "liq.metrics.incremental",
+    "QuantileSketch": "liq.metrics.sketch",
+    "CostScenario": "liq.metrics.cost_stress",
+    "CostStressResult": "liq.metrics.cost_stress",
+    "compute_cost_stress": "liq.metrics.cost_stress",
+    "cost_stress_net_returns": "liq.metrics.cost_stress",
+    "uniform_cost_scenarios": "liq.metrics.cost_stress",
+    "compute_inference_inputs": "liq.metrics.inference",
+    "clustered_tstat": "liq.metrics.inference",
+    "student_t_two_sided_pvalue": "liq.metrics.inference",
+    "NullPercentile": "liq.metrics.inference",
+    "null_percentile": "liq.metrics.inference",
+    "BacktestOverfitting": "liq.metrics.overfitting",
+    "deflated_sharpe_ratio": "liq.metrics.overfitting",
+    "deflated_sharpe_from_panel": "liq.metrics.overfitting",
+    "expected_max_sharpe": "liq.metrics.overfitting",
+    "probability_of_backtest_overfitting": "liq.metrics.overfitting",
+    "instrument": "liq.metrics.instrumentation",
+    "Backend": "liq.metrics.backend",
+    "available_backends": "liq.metrics.backend",
+    "get_backend": "liq.metrics.backend",
+    "register_backend": "liq.metrics.backend",
+    "use_backend": "liq.metrics.backend",
+    "Span": "liq.metrics.instrumentation",
+    "summarize_qa": "liq.metrics.qa",
+    "summarize_drift": "liq.metrics.drift",
+    "DriftMonitor": "liq.metrics.drift",
+    "DriftWindow": "liq.metrics.drift_windows",
+    "windowed_drift": "liq.metrics.drift_windows",
+    "DriftScores": "liq.metrics.histograms",
+    "FeatureReferences": "liq.metrics.histograms",
+    "ReferenceHistogram": "liq.metrics.histograms",
+    "population_stability_index": "liq.metrics.histograms",
+    "ks_distance": "liq.metrics.histograms",
+    "js_distance": "liq.metrics.histograms",
+    "summarize_labels": "liq.metrics.labels",
+    "summarize_classification": "liq.metrics.prediction",
+    "summarize_regression": "liq.metrics.prediction",
+    "QAResultLike": "liq.metrics.qa",
+    "SelectorEconomics": "liq.metrics.selector",
+    "SelectorEconomicsAccumulator": "liq.metrics.selector",
+    "SelectorBootstrap": "liq.metrics.selector",
+    "bootstrap_selector_economics": "liq.metrics.selector",
+    "ConfidenceInterval": "liq.metrics.bootstrap",
+    "bootstrap_column_sums": "liq.metrics.bootstrap",
+    "bootstrap_replicates": "liq.metrics.bootstrap",
+    "percentile_interval": "liq.metrics.bootstrap",
+    "resample_indices": "liq.metrics.bootstrap",
+    "ComparisonResult": "liq.metrics.performance",
+    "ComparisonMatrix": "liq.metrics.performance",
+    "RegimeDelta": "liq.metrics.performance",
+    "PerformanceAnalyzer": "liq.metrics.performance",
+    "PerformanceReport": "liq.metrics.performance",
+    "RegimeMetrics": "liq.metrics.performance",
+    "RegimeSegment": "liq.metrics.performance",
+    "FrequencyMetrics": "liq.metrics.performance",
+    "PERIODS_PER_YEAR": "liq.metrics.resample",
+    "ResampledEquityCurve": "liq.metrics.resample",
+    "resample_equity_curve": "liq.metrics.resample",
+    "MappedEquityCurve": "liq.metrics.mapped_curve",
+    "open_equity_curve": "liq.metrics.mapped_curve",
+    "CurveIndex": "liq.metrics.curve_index",
+    "DrawdownAnalysis": "liq.metrics.drawdown",
+    "DrawdownEpisode": "liq.metrics.drawdown",
+    "analyze_drawdowns": "liq.metrics.drawdown",
+    "compounded_equity": "liq.metrics.drawdown",
+    "max_drawdown": "liq.metrics.drawdown",
+    "underwater_curve": "liq.metrics.drawdown",
+    "SixCurveInputs": "liq.metrics.six_curves",
+    "SixCurveResult": "liq.metrics.six_curves",
+    "compute_six_curves": "liq.metrics.six_curves",
+    "compute_selector_economics": "liq.metrics.selector",
+    "PackedDecisions": "liq.metrics.selector",
+    "pack_decisions": "liq.metrics.selector",
+    "TaxRates": "liq.metrics.tax_curves",
+    "TaxPolicy": "liq.metrics.tax_curves",
+    "RealizedTaxEvent": "liq.metrics.tax_curves",
+    "OpenTaxPosition": "liq.metrics.tax_curves",
+    "CurveFResult": "liq.metrics.tax_curves",
+    "CurveFPeriod": "liq.metrics.tax_curves",
+    "event_tax": "liq.metrics.tax_curves",
+    "realized_tax": "liq.metrics.tax_curves",
+    "mark_to_market_tax": "liq.metrics.tax_curves",
+    "terminal_open_position_tax": "liq.metrics.tax_curves",
+    "compute_curve_f": "liq.metrics.tax_curves",
+    "compute_curve_f_periods": "liq.metrics.tax_curves",
+}
+
+
+def __getattr__(name: str) -> object:
+    module_name = _LAZY_ATTRS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value  # later lookups skip __getattr__
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *__all__})
+
 
 __all__ = [
     "MetricsPanel",
@@ -49,21 +138,84 @@ __all__ = [
     "METRICS_PANEL_FIELDS",
     "compute_metrics_panel",
     "write_metrics_panel_csv",
+    "EventCodes",
+    "factorize_events",
+    "compute_metrics_panel_columnar",
+    "compute_metrics_panel_from_tables",
+    "IncrementalMetricsPanel",
+    "QuantileSketch",
+    "CostScenario",
+    "CostStressResult",
+    "compute_cost_stress",
+    "cost_stress_net_returns",
+    "uniform_cost_scenarios",
+    "compute_inference_inputs",
+    "clustered_tstat",
+    "student_t_two_sided_pvalue",
+    "NullPercentile",
+    "null_percentile",
+    "BacktestOverfitting",
+    "deflated_sharpe_ratio",
+    "deflated_sharpe_from_panel",
+    "expected_max_sharpe",
+    "probability_of_backtest_overfitting",
+    "instrument",
+    "Span",
+    "Backend",
+    "available_backends",
+    "get_backend",
+    "register_backend",
+    "use_backend",
     "summarize_qa",
     "summarize_drift",
+    "DriftMonitor",
+    "DriftWindow",
+    "windowed_drift",
+    "DriftScores",
+    "FeatureReferences",
+    "ReferenceHistogram",
+    "population_stability_index",
+    "ks_distance",
+    "js_distance",
     "summarize_labels",
     "summarize_classification",
     "summarize_regression",
     "QAResultLike",
     "SelectorEconomics",
+    "SelectorEconomicsAccumulator",
+    "SelectorBootstrap",
+    "bootstrap_selector_economics",
+    "ConfidenceInterval",
+    "bootstrap_column_sums",
+    "bootstrap_replicates",
+    "percentile_interval",
+    "resample_indices",
     "ComparisonResult",
+    "ComparisonMatrix",
+    "RegimeDelta",
     "PerformanceAnalyzer",
     "PerformanceReport",
     "RegimeMetrics",
+    "RegimeSegment",
+    "FrequencyMetrics",
+    "PERIODS_PER_YEAR",
+    "ResampledEquityCurve",
+    "resample_equity_curve",
+    "MappedEquityCurve",
+    "open_equity_curve",
+    "CurveIndex",
+    "DrawdownAnalysis",
+    "DrawdownEpisode",
+    "analyze_drawdowns",
+    "compounded_equity",
+    "max_drawdown",
+    "underwater_curve",
     "SixCurveInputs",
     "SixCurveResult",
     "compute_six_curves",
     "compute_selector_economics",
+    "PackedDecisions",
+    "pack_decisions",
     "TaxRates",
     "TaxPolicy",
     "RealizedTaxEvent",
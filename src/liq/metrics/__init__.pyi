@@ -0,0 +1,244 @@
+"""Type stub for the lazily loaded ``liq.metrics`` namespace.
+
+``__init__.py`` resolves these names on first access (PEP 562), so type
+checkers read the re-exports from here instead.
+"""
+
+from liq.metrics.backend import (
+    Backend,
+    available_backends,
+    get_backend,
+    register_backend,
+    use_backend,
+)
+from liq.metrics.bootstrap import (
+    ConfidenceInterval,
+    bootstrap_column_sums,
+    bootstrap_replicates,
+    percentile_interval,
+    resample_indices,
+)
+from liq.metrics.columnar import (
+    compute_metrics_panel_columnar,
+    compute_metrics_panel_from_tables,
+)
+from liq.metrics.cost_stress import (
+    CostScenario,
+    CostStressResult,
+    compute_cost_stress,
+    cost_stress_net_returns,
+    uniform_cost_scenarios,
+)
+from liq.metrics.curve_index import (
+    CurveIndex,
+)
+from liq.metrics.drawdown import (
+    DrawdownAnalysis,
+    DrawdownEpisode,
+    analyze_drawdowns,
+    compounded_equity,
+    max_drawdown,
+    underwater_curve,
+)
+from liq.metrics.drift import (
+    DriftMonitor,
+    summarize_drift,
+)
+from liq.metrics.drift_windows import DriftWindow, windowed_drift
+from liq.metrics.histograms import (
+    DriftScores,
+    FeatureReferences,
+    ReferenceHistogram,
+    js_distance,
+    ks_distance,
+    population_stability_index,
+)
+from liq.metrics.incremental import (
+    IncrementalMetricsPanel,
+)
+from liq.metrics.inference import (
+    NullPercentile,
+    clustered_tstat,
+    compute_inference_inputs,
+    null_percentile,
+    student_t_two_sided_pvalue,
+)
+from liq.metrics.instrumentation import (
+    Span,
+    instrument,
+)
+from liq.metrics.labels import (
+    summarize_labels,
+)
+from liq.metrics.mapped_curve import (
+    MappedEquityCurve,
+    open_equity_curve,
+)
+from liq.metrics.overfitting import (
+    BacktestOverfitting,
+    deflated_sharpe_from_panel,
+    deflated_sharpe_ratio,
+    expected_max_sharpe,
+    probability_of_backtest_overfitting,
+)
+from liq.metrics.panel import (
+    METRICS_PANEL_FIELDS,
+    EventCodes,
+    InferenceInputs,
+    MetricsPanel,
+    compute_metrics_panel,
+    factorize_events,
+    write_metrics_panel_csv,
+)
+from liq.metrics.performance import (
+    ComparisonMatrix,
+    ComparisonResult,
+    FrequencyMetrics,
+    PerformanceAnalyzer,
+    PerformanceReport,
+    RegimeDelta,
+    RegimeMetrics,
+    RegimeSegment,
+)
+from liq.metrics.prediction import (
+    summarize_classification,
+    summarize_regression,
+)
+from liq.metrics.qa import (
+    QAResultLike,
+    summarize_qa,
+)
+from liq.metrics.resample import (
+    PERIODS_PER_YEAR,
+    ResampledEquityCurve,
+    resample_equity_curve,
+)
+from liq.metrics.selector import (
+    PackedDecisions,
+    SelectorBootstrap,
+    SelectorEconomics,
+    SelectorEconomicsAccumulator,
+    bootstrap_selector_economics,
+    compute_selector_economics,
+    pack_decisions,
+)
+from liq.metrics.six_curves import (
+    SixCurveInputs,
+    SixCurveResult,
+    compute_six_curves,
+)
+from liq.metrics.sketch import (
+    QuantileSketch,
+)
+from liq.metrics.tax_curves import (
+    CurveFPeriod,
+    CurveFResult,
+    OpenTaxPosition,
+    RealizedTaxEvent,
+    TaxPolicy,
+    TaxRates,
+    compute_curve_f,
+    compute_curve_f_periods,
+    event_tax,
+    mark_to_market_tax,
+    realized_tax,
+    terminal_open_position_tax,
+)
+
+__all__ = [
+    "MetricsPanel",
+    "InferenceInputs",
+    "METRICS_PANEL_FIELDS",
+    "compute_metrics_panel",
+    "write_metrics_panel_csv",
+    "EventCodes",
+    "factorize_events",
+    "compute_metrics_panel_columnar",
+    "compute_metrics_panel_from_tables",
+    "IncrementalMetricsPanel",
+    "QuantileSketch",
+    "CostScenario",
+    "CostStressResult",
+    "compute_cost_stress",
+    "cost_stress_net_returns",
+    "uniform_cost_scenarios",
+    "compute_inference_inputs",
+    "clustered_tstat",
+    "student_t_two_sided_pvalue",
+    "NullPercentile",
+    "null_percentile",
+    "BacktestOverfitting",
+    "deflated_sharpe_ratio",
+    "deflated_sharpe_from_panel",
+    "expected_max_sharpe",
+    "probability_of_backtest_overfitting",
+    "instrument",
+    "Span",
+    "Backend",
+    "available_backends",
+    "get_backend",
+    "register_backend",
+    "use_backend",
+    "summarize_qa",
+    "summarize_drift",
+    "DriftMonitor",
+    "DriftWindow",
+    "windowed_drift",
+    "DriftScores",
+    "FeatureReferences",
+    "ReferenceHistogram",
+    "population_stability_index",
+    "ks_distance",
+    "js_distance",
+    "summarize_labels",
+    "summarize_classification",
+    "summarize_regression",
+    "QAResultLike",
+    "SelectorEconomics",
+    "SelectorEconomicsAccumulator",
+    "SelectorBootstrap",
+    "bootstrap_selector_economics",
+    "ConfidenceInterval",
+    "bootstrap_column_sums",
+    "bootstrap_replicates",
+    "percentile_interval",
+    "resample_indices",
+    "ComparisonResult",
+    "ComparisonMatrix",
+    "RegimeDelta",
+    "PerformanceAnalyzer",
+    "PerformanceReport",
+    "RegimeMetrics",
+    "RegimeSegment",
+    "FrequencyMetrics",
+    "PERIODS_PER_YEAR",
+    "ResampledEquityCurve",
+    "resample_equity_curve",
+    "MappedEquityCurve",
+    "open_equity_curve",
+    "CurveIndex",
+    "DrawdownAnalysis",
+    "DrawdownEpisode",
+    "analyze_drawdowns",
+    "compounded_equity",
+    "max_drawdown",
+    "underwater_curve",
+    "SixCurveInputs",
+    "SixCurveResult",
+    "compute_six_curves",
+    "compute_selector_economics",
+    "PackedDecisions",
+    "pack_decisions",
+    "TaxRates",
+    "TaxPolicy",
+    "RealizedTaxEvent",
+    "OpenTaxPosition",
+    "CurveFResult",
+    "CurveFPeriod",
+    "event_tax",
+    "realized_tax",
+    "mark_to_market_tax",
+    "terminal_open_position_tax",
+    "compute_curve_f",
+    "compute_curve_f_periods",
+]
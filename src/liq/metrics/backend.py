@@ -0,0 +1,695 @@
+"""Pluggable compute backends for the numeric hot paths.
+
+``panel``, ``cost_stress``, ``performance``, ``prediction``, ``selector``,
+``six_curves``, ``histograms``, ``drift_windows`` and the resampling engines
+in ``bootstrap`` and ``inference`` run their inner loops through a
+:class:`Backend`. The base class is the pure-Python reference
+implementation and stays the source of truth; other
+backends override kernels with vectorized equivalents and must match the
+reference to floating-point round-off (``tests/test_backend.py``).
+
+Built-in backends:
+
+* ``python`` -- the reference (no dependencies).
+* ``numpy``  -- NumPy vector kernels (``pip install liq-metrics[numpy]``).
+* ``numba``  -- NumPy plus JIT-compiled loops for the sequential kernels
+  (``pip install liq-metrics[numba]``).
+
+Selection, first match wins: an active :func:`use_backend` block, then the
+``LIQ_METRICS_BACKEND`` environment variable, then ``python``. Accelerated
+backends are opt-in, so installing NumPy (for example as another package's
+dependency) never moves results by NumPy's round-off (pairwise summation,
+vectorized reductions) behind the caller's back. ``auto`` is the opt-in
+for "fastest available": it picks ``numpy`` when it imports and ``python``
+otherwise; ``numba`` is never picked automatically because its first call
+pays the JIT compile. Naming an unavailable backend explicitly raises
+:class:`ImportError`.
+
+The reference drawdown kernels delegate to :mod:`liq.metrics.drawdown`, and
+:meth:`liq.metrics.panel.EventCodes.segment_sums` calls
+:meth:`Backend.segment_sums`, so each algorithm has one pure-Python source.
+
+Kernels take any float sequence (lists, tuples, ``array``/``memoryview``
+columns) and return plain Python floats, ints and lists, so results never
+leak backend scalar types. The exceptions are intermediates meant to feed
+another kernel (``bar_returns``, ``select``, the null-draw matrices of
+``sign_flip_rows``, ``permuted_rows`` and ``row_segment_sums``) and the
+``pairwise_differences`` cube a comparison matrix keeps, which stay
+backend-native. Decimal money arithmetic (``six_curves``) has no
+vectorized equivalent that preserves exact cents, so the accelerated
+backends inherit the reference :meth:`Backend.compound`.
+"""
+
+from __future__ import annotations
+
+import importlib
+import math
+import os
+from array import array
+from bisect import bisect_left, bisect_right
+from collections import defaultdict
+from collections.abc import Callable, Iterable, Iterator, Sequence
+from contextlib import contextmanager
+from contextvars import ContextVar
+from decimal import Decimal
+from functools import reduce
+from itertools import accumulate, compress, repeat
+from operator import mul, sub
+from typing import Any
+
+from liq.metrics import drawdown
+
+ENV_VAR = "LIQ_METRICS_BACKEND"
+
+_CENT = Decimal("0.01")
+_ONE = Decimal("1")
+
+
+class Backend:
+    """Pure-Python reference kernels; subclass and override to accelerate."""
+
+    name = "python"
+
+    def as_array(self, values: Sequence[float]) -> Sequence[float]:
+        """Backend-native float vector, built once and reused across kernels."""
+        return values
+
+    def trade_summary(self, values: Sequence[float]) -> tuple[int, float, float, float]:
+        """``(wins, gross_profit, gross_loss, total)``; ``gross_loss`` is positive."""
+        wins = sum(1 for r in values if r > 0)
+        gross_profit = sum(r for r in values if r > 0)
+        gross_loss = -sum(r for r in values if r < 0)
+        return wins, gross_profit, gross_loss, sum(values)
+
+    def central_moments(self, values: Sequence[float]) -> tuple[float, float, float, float]:
+        """``(mean, m2, m3, m4)`` with population (``/ n``) central moments."""
+        n = len(values)
+        mean = sum(values) / n
+        m2 = sum((r - mean) ** 2 for r in values) / n
+        m3 = sum((r - mean) ** 3 for r in values) / n
+        m4 = sum((r - mean) ** 4 for r in values) / n
+        return mean, m2, m3, m4
+
+    def sorted_values(self, values: Sequence[float]) -> list[float]:
+        return sorted(values)
+
+    def largest(self, values: Sequence[float]) -> float:
+        return max(values)
+
+    def total(self, values: Sequence[float]) -> float:
+        return sum(values)
+
+    def compounded_max_drawdown(self, returns: Sequence[float]) -> float:
+        """Max drawdown (positive fraction) of the unit curve compounded from ``returns``."""
+        return drawdown.max_drawdown(accumulate(returns, _compound_step, initial=1.0))
+
+    def max_drawdown(self, values: Sequence[float]) -> float:
+        """Max drawdown (positive fraction) of a value curve."""
+        return drawdown.max_drawdown(values)
+
+    def compounded_return(self, returns: Sequence[float]) -> float:
+        """Total return of the unit curve compounded from ``returns``."""
+        return reduce(_compound_step, returns, 1.0) - 1.0
+
+    def segment_sums(
+        self, codes: Sequence[int], n_segments: int, values: Sequence[float]
+    ) -> list[float]:
+        """Sum of ``values`` per integer code in ``range(n_segments)``."""
+        sums = [0.0] * n_segments
+        for code, value in zip(codes, values, strict=True):
+            sums[code] += value
+        return sums
+
+    def covariance(
+        self, x: Sequence[float], mean_x: float, y: Sequence[float]
+    ) -> tuple[float, float, float]:
+        """``(mean_y, cov(x, y), var(y))`` with ``n - 1`` denominators."""
+        n = len(y)
+        mean_y = sum(y) / n
+        cov = sum((a - mean_x) * (b - mean_y) for a, b in zip(x, y, strict=True)) / (n - 1)
+        var_y = sum((b - mean_y) ** 2 for b in y) / (n - 1)
+        return mean_y, cov, var_y
+
+    def bar_returns(self, values: Sequence[float]) -> list[float]:
+        """Simple returns between consecutive values (0.0 after a zero value)."""
+        return [
+            (values[i] - values[i - 1]) / values[i - 1] if values[i - 1] != 0 else 0.0
+            for i in range(1, len(values))
+        ]
+
+    def sharpe_and_win_rate(self, returns: Sequence[float]) -> tuple[float | None, float | None]:
+        """Per-bar Sharpe (``None`` below two returns or at zero spread) and win rate."""
+        sharpe: float | None = None
+        if len(returns) >= 2:
+            mean_ret = sum(returns) / len(returns)
+            var = sum((r - mean_ret) ** 2 for r in returns) / (len(returns) - 1)
+            std = math.sqrt(var) if var > 0 else 0.0
+            sharpe = mean_ret / std if std > 0 else None
+        win_rate: float | None = None
+        if returns:
+            win_rate = sum(1 for r in returns if r > 0) / len(returns)
+        return sharpe, win_rate
+
+    def confusion_counts(
+        self, y_true: Sequence[int], y_pred: Sequence[int]
+    ) -> tuple[list[int], list[int], list[int], list[int]]:
+        """Sorted labels with aligned true-positive, false-positive and false-negative counts."""
+        tp: defaultdict[int, int] = defaultdict(int)
+        fp: defaultdict[int, int] = defaultdict(int)
+        fn: defaultdict[int, int] = defaultdict(int)
+        for yt, yp in zip(y_true, y_pred, strict=False):
+            if yt == yp:
+                tp[yt] += 1
+            else:
+                fp[yp] += 1
+                fn[yt] += 1
+        labels = sorted(set(y_true) | set(y_pred))
+        return (
+            labels,
+            [tp[label] for label in labels],
+            [fp[label] for label in labels],
+            [fn[label] for label in labels],
+        )
+
+    def pearson_corr(self, x: Sequence[float], y: Sequence[float]) -> float:
+        if len(x) < 2:
+            return 0.0
+        mean_x = math.fsum(x) / len(x)
+        mean_y = math.fsum(y) / len(y)
+        cov = math.fsum((xi - mean_x) * (yi - mean_y) for xi, yi in zip(x, y, strict=False))
+        var_x = math.fsum((xi - mean_x) ** 2 for xi in x)
+        var_y = math.fsum((yi - mean_y) ** 2 for yi in y)
+        denom = math.sqrt(var_x * var_y)
+        if denom == 0:
+            return 0.0
+        return cov / denom
+
+    def gaussian_nll(
+        self, x: Sequence[float], mean: Sequence[float], log_var: Sequence[float]
+    ) -> float:
+        total = 0.0
+        for xt, mu, lv in zip(x, mean, log_var, strict=False):
+            var = math.exp(lv)
+            total += 0.5 * (lv + ((xt - mu) ** 2) / var + math.log(2 * math.pi))
+        return total / len(x)
+
+    def coverage(
+        self, x: Sequence[float], mean: Sequence[float], log_var: Sequence[float], sigma: int
+    ) -> float:
+        count = 0
+        for xt, mu, lv in zip(x, mean, log_var, strict=False):
+            std = math.exp(0.5 * lv)
+            if abs(xt - mu) <= sigma * std:
+                count += 1
+        return count / len(x)
+
+    def masked_sum(self, values: Sequence[float], selectors: bytes) -> float:
+        """Sum of ``values`` where the aligned selector byte is 1."""
+        return sum(compress(values, selectors))
+
+    def select(self, values: Sequence[float], selectors: bytes) -> Sequence[float]:
+        """The ``values`` whose aligned selector byte is 1, in order."""
+        return list(compress(values, selectors))
+
+    def masked_moments(
+        self, values: Sequence[float], selectors: bytes
+    ) -> tuple[float, float, float]:
+        """``(total, mean, m2)`` of the series equal to ``values`` where selected, else 0."""
+        length = len(values)
+        selected = list(compress(values, selectors))
+        total = sum(selected)
+        mean = total / length
+        squares = sum((value - mean) ** 2 for value in selected)
+        return total, mean, squares + (length - len(selected)) * mean**2
+
+    def bin_counts(self, values: Sequence[float], edges: Sequence[float]) -> list[int]:
+        """Counts per bin ``(edges[i - 1], edges[i]]``; the outer bins are open-ended."""
+        ordered = sorted(values)
+        cumulative = [bisect_right(ordered, edge) for edge in edges]
+        cumulative.append(len(ordered))
+        return [hi - lo for lo, hi in zip([0, *cumulative], cumulative, strict=False)]
+
+    def bin_indices(self, values: Sequence[float], edges: Sequence[float]) -> list[int]:
+        """Bin of each value under the :meth:`bin_counts` layout."""
+        return [bisect_left(edges, value) for value in values]
+
+    def pairwise_differences(
+        self, left: Sequence[Sequence[float]], right: Sequence[Sequence[float]]
+    ) -> list[list[list[float]]]:
+        """``out[i][j][k] = left[i][k] - right[j][k]`` (NaN marks missing values)."""
+        return [
+            [[a - b for a, b in zip(row, other, strict=True)] for other in right] for row in left
+        ]
+
+    def resample_sums(
+        self, columns: Sequence[Sequence[float]], index_rows: Sequence[Sequence[int]]
+    ) -> list[list[float]]:
+        """``out[r][c] = sum(columns[c][i] for i in index_rows[r])``, one row per resample."""
+        return [
+            [sum(map(column.__getitem__, indices)) for column in columns] for indices in index_rows
+        ]
+
+    def scenario_gross_losses(
+        self,
+        gross: Sequence[float],
+        costs: Sequence[Sequence[float]],
+        weights: Sequence[Sequence[float]],
+    ) -> list[float]:
+        """Gross loss (positive) of ``gross - sum(w[c] * costs[c])`` for each weight row ``w``."""
+        if any(len(column) != len(gross) for column in costs):
+            raise ValueError("gross and cost columns must have equal length")
+        losses = []
+        for row in weights:
+            net: Iterable[float] = gross
+            for w, column in zip(row, costs, strict=True):
+                net = map(sub, net, map(mul, column, repeat(w)))
+            losses.append(0.0 - sum(value for value in net if value < 0))
+        return losses
+
+    def sharpe_ratios(self, rows: Sequence[Sequence[float]]) -> list[float | None]:
+        """Per-period sample Sharpe of each row (``None`` below two values or at zero spread)."""
+        ratios: list[float | None] = []
+        for row in rows:
+            n = len(row)
+            if n < 2:
+                ratios.append(None)
+                continue
+            mean = sum(row) / n
+            variance = sum((r - mean) ** 2 for r in row) / (n - 1)
+            ratios.append(mean / math.sqrt(variance) if variance > 0 else None)
+        return ratios
+
+    def row_segment_sums(
+        self, rows: Sequence[Sequence[float]], codes: Sequence[int], n_segments: int
+    ) -> Sequence[Sequence[float]]:
+        """:meth:`segment_sums` of every row under one shared code vector."""
+        return [self.segment_sums(codes, n_segments, row) for row in rows]
+
+    def sign_flip_rows(self, values: Sequence[float], flips: bytes) -> Sequence[Sequence[float]]:
+        """Rows of ``values`` negated where the aligned ``flips`` byte is odd."""
+        n = len(values)
+        return [
+            [
+                -value if flip & 1 else value
+                for value, flip in zip(values, flips[start : start + n], strict=True)
+            ]
+            for start in range(0, len(flips), n or 1)
+        ]
+
+    def permuted_rows(self, values: Sequence[float], keys: bytes) -> Sequence[Sequence[float]]:
+        """Rows of ``values`` in stable order of ``len(values)`` native uint64 ``keys`` each."""
+        n = len(values)
+        ranks = array("Q", keys)
+        rows = []
+        for start in range(0, len(ranks), n or 1):
+            row_keys = ranks[start : start + n]
+            rows.append([values[i] for i in sorted(range(n), key=row_keys.__getitem__)])
+        return rows
+
+    def compound(self, start: Decimal, returns: Sequence[Decimal]) -> tuple[Decimal, ...]:
+        """NAV path compounded from Decimal returns, each step rounded to cents."""
+        nav = start
+        series: list[Decimal] = []
+        for r in returns:
+            nav = nav * (_ONE + r)
+            series.append(nav.quantize(_CENT))
+        return tuple(series)
+
+
+class NumpyBackend(Backend):
+    """NumPy vector kernels."""
+
+    name = "numpy"
+
+    def __init__(self) -> None:
+        self._np: Any = importlib.import_module("numpy")
+
+    def as_array(self, values: Sequence[float]) -> Any:
+        return self._np.asarray(values, dtype=self._np.float64)
+
+    def trade_summary(self, values: Sequence[float]) -> tuple[int, float, float, float]:
+        a = self.as_array(values)
+        positive = a[a > 0]
+        return (
+            int(positive.size),
+            float(positive.sum()),
+            -float(a[a < 0].sum()),
+            float(a.sum()),
+        )
+
+    def central_moments(self, values: Sequence[float]) -> tuple[float, float, float, float]:
+        a = self.as_array(values)
+        mean = float(a.mean())
+        d = a - mean
+        d2 = d * d
+        return mean, float(d2.mean()), float((d2 * d).mean()), float((d2 * d2).mean())
+
+    def sorted_values(self, values: Sequence[float]) -> list[float]:
+        return self._np.sort(self.as_array(values)).tolist()
+
+    def largest(self, values: Sequence[float]) -> float:
+        return float(self.as_array(values).max())
+
+    def total(self, values: Sequence[float]) -> float:
+        return float(self.as_array(values).sum())
+
+    def compounded_max_drawdown(self, returns: Sequence[float]) -> float:
+        np = self._np
+        equity = np.empty(len(returns) + 1)
+        equity[0] = 1.0
+        np.cumprod(1.0 + self.as_array(returns), out=equity[1:])
+        return self.max_drawdown(equity)
+
+    def compounded_return(self, returns: Sequence[float]) -> float:
+        return float((1.0 + self.as_array(returns)).prod()) - 1.0
+
+    def max_drawdown(self, values: Sequence[float]) -> float:
+        np = self._np
+        a = self.as_array(values)
+        if not a.size:
+            return 0.0
+        peak = np.maximum.accumulate(a)
+        depth = np.divide(peak - a, peak, out=np.zeros_like(a), where=peak > 0)
+        return max(0.0, float(depth.max()))
+
+    def segment_sums(
+        self, codes: Sequence[int], n_segments: int, values: Sequence[float]
+    ) -> list[float]:
+        np = self._np
+        weights = self.as_array(values)
+        if len(codes) != len(weights):
+            raise ValueError("codes and values must have equal length")
+        index = np.asarray(codes, dtype=np.intp)
+        return np.bincount(index, weights=weights, minlength=n_segments).tolist()
+
+    def covariance(
+        self, x: Sequence[float], mean_x: float, y: Sequence[float]
+    ) -> tuple[float, float, float]:
+        b = self.as_array(y)
+        n = b.size
+        mean_y = float(b.mean())
+        dy = b - mean_y
+        dx = self.as_array(x) - mean_x
+        return mean_y, float(dx @ dy) / (n - 1), float(dy @ dy) / (n - 1)
+
+    def bar_returns(self, values: Sequence[float]) -> Any:
+        np = self._np
+        a = self.as_array(values)
+        prev = a[:-1]
+        return np.divide(a[1:] - prev, prev, out=np.zeros_like(prev), where=prev != 0)
+
+    def sharpe_and_win_rate(self, returns: Sequence[float]) -> tuple[float | None, float | None]:
+        a = self.as_array(returns)
+        n = a.size
+        sharpe: float | None = None
+        if n >= 2:
+            std = float(a.std(ddof=1))
+            sharpe = float(a.mean()) / std if std > 0 else None
+        win_rate = int((a > 0).sum()) / n if n else None
+        return sharpe, win_rate
+
+    def confusion_counts(
+        self, y_true: Sequence[int], y_pred: Sequence[int]
+    ) -> tuple[list[int], list[int], list[int], list[int]]:
+        np = self._np
+        n = len(y_true)
+        labels, inverse = np.unique(
+            np.concatenate((np.asarray(y_true), np.asarray(y_pred))), return_inverse=True
+        )
+        true_idx = inverse[:n]
+        pred_idx = inverse[n:]
+        hit = true_idx == pred_idx
+        k = labels.size
+        return (
+            labels.tolist(),
+            np.bincount(true_idx[hit], minlength=k).tolist(),
+            np.bincount(pred_idx[~hit], minlength=k).tolist(),
+            np.bincount(true_idx[~hit], minlength=k).tolist(),
+        )
+
+    def pearson_corr(self, x: Sequence[float], y: Sequence[float]) -> float:
+        if len(x) < 2:
+            return 0.0
+        dx = self.as_array(x)
+        dy = self.as_array(y)
+        dx = dx - dx.mean()
+        dy = dy - dy.mean()
+        denom = math.sqrt(float(dx @ dx) * float(dy @ dy))
+        if denom == 0:
+            return 0.0
+        return float(dx @ dy) / denom
+
+    def gaussian_nll(
+        self, x: Sequence[float], mean: Sequence[float], log_var: Sequence[float]
+    ) -> float:
+        np = self._np
+        lv = self.as_array(log_var)
+        err = self.as_array(x) - self.as_array(mean)
+        terms = 0.5 * (lv + err * err / np.exp(lv) + math.log(2 * math.pi))
+        return float(terms.mean())
+
+    def coverage(
+        self, x: Sequence[float], mean: Sequence[float], log_var: Sequence[float], sigma: int
+    ) -> float:
+        np = self._np
+        err = np.abs(self.as_array(x) - self.as_array(mean))
+        inside = err <= sigma * np.exp(0.5 * self.as_array(log_var))
+        return int(inside.sum()) / err.size
+
+    def masked_sum(self, values: Sequence[float], selectors: bytes) -> float:
+        a = self.as_array(values)
+        return float(a[self._mask(selectors, a.size)].sum())
+
+    def select(self, values: Sequence[float], selectors: bytes) -> Any:
+        a = self.as_array(values)
+        return a[self._mask(selectors, a.size)]
+
+    def masked_moments(
+        self, values: Sequence[float], selectors: bytes
+    ) -> tuple[float, float, float]:
+        np = self._np
+        a = self.as_array(values)
+        series = np.where(self._mask(selectors, a.size), a, 0.0)
+        total = float(series.sum())
+        mean = total / a.size
+        d = series - mean
+        return total, mean, float(d @ d)
+
+    def bin_counts(self, values: Sequence[float], edges: Sequence[float]) -> list[int]:
+        np = self._np
+        index = np.searchsorted(self.as_array(edges), self.as_array(values), side="left")
+        return np.bincount(index, minlength=len(edges) + 1).tolist()
+
+    def pairwise_differences(
+        self, left: Sequence[Sequence[float]], right: Sequence[Sequence[float]]
+    ) -> Any:
+        np = self._np
+        width = len(left[0]) if len(left) else len(right[0]) if len(right) else 0
+        a = np.asarray(left, dtype=np.float64).reshape(len(left), width)
+        b = np.asarray(right, dtype=np.float64).reshape(len(right), width)
+        return a[:, None, :] - b[None, :, :]
+
+    def resample_sums(
+        self, columns: Sequence[Sequence[float]], index_rows: Sequence[Sequence[int]]
+    ) -> list[list[float]]:
+        np = self._np
+        data = np.asarray(columns, dtype=np.float64)
+        index = np.asarray(index_rows, dtype=np.intp)
+        if not index.size:
+            return [[0.0] * len(columns) for _ in index_rows]
+        # Per-resample draw counts of every row, then one matrix product for
+        # all columns: (resamples x n) @ (n x columns).
+        n_resamples, n = index.shape[0], data.shape[1]
+        flat = (index + n * np.arange(n_resamples)[:, None]).ravel()
+        counts = np.bincount(flat, minlength=n_resamples * n).reshape(n_resamples, n)
+        return (counts @ data.T).tolist()
+
+    def scenario_gross_losses(
+        self,
+        gross: Sequence[float],
+        costs: Sequence[Sequence[float]],
+        weights: Sequence[Sequence[float]],
+    ) -> list[float]:
+        np = self._np
+        g = self.as_array(gross)
+        c = np.asarray(costs, dtype=np.float64).reshape(len(costs), g.size)
+        w = np.asarray(weights, dtype=np.float64).reshape(len(weights), len(costs))
+        # (scenarios x components) @ (components x trades): every scenario's nets at once.
+        net = g - w @ c
+        return (0.0 - np.minimum(net, 0.0).sum(axis=1)).tolist()
+
+    def sharpe_ratios(self, rows: Sequence[Sequence[float]]) -> list[float | None]:
+        a = self._np.asarray(rows, dtype=self._np.float64)
+        if a.ndim != 2 or a.shape[1] < 2:
+            return [None] * len(rows)
+        mean = a.mean(axis=1)
+        d = a - mean[:, None]
+        variance = (d * d).sum(axis=1) / (a.shape[1] - 1)
+        return [
+            m / math.sqrt(v) if v > 0 else None
+            for m, v in zip(mean.tolist(), variance.tolist(), strict=True)
+        ]
+
+    def row_segment_sums(
+        self, rows: Sequence[Sequence[float]], codes: Sequence[int], n_segments: int
+    ) -> Any:
+        np = self._np
+        a = np.asarray(rows, dtype=np.float64).reshape(len(rows), len(codes))
+        # Offset each row's codes into its own block of segments: one bincount.
+        offsets = n_segments * np.arange(a.shape[0])[:, None]
+        flat = (np.asarray(codes, dtype=np.intp)[None, :] + offsets).ravel()
+        sums = np.bincount(flat, weights=a.ravel(), minlength=a.shape[0] * n_segments)
+        return sums.reshape(a.shape[0], n_segments)
+
+    def sign_flip_rows(self, values: Sequence[float], flips: bytes) -> Any:
+        np = self._np
+        a = self.as_array(values)
+        signs = 1.0 - 2.0 * (np.frombuffer(flips, dtype=np.uint8) & 1)
+        return signs.reshape(-1, a.size) * a
+
+    def permuted_rows(self, values: Sequence[float], keys: bytes) -> Any:
+        np = self._np
+        a = self.as_array(values)
+        ranks = np.frombuffer(keys, dtype=np.uint64).reshape(-1, a.size)
+        return a[ranks.argsort(axis=1, kind="stable")]
+
+    def bin_indices(self, values: Sequence[float], edges: Sequence[float]) -> list[int]:
+        return self._np.searchsorted(
+            self.as_array(edges), self.as_array(values), side="left"
+        ).tolist()
+
+    def _mask(self, selectors: bytes, length: int) -> Any:
+        np = self._np
+        mask = np.frombuffer(selectors, dtype=np.uint8).astype(bool)
+        if mask.size < length:  # compress() stops at the shorter input
+            mask = np.concatenate((mask, np.zeros(length - mask.size, dtype=bool)))
+        return mask[:length]
+
+
+def _compound_step(value: float, r: float) -> float:
+    return value * (1.0 + r)
+
+
+def _drawdown_loop(values: Any) -> float:
+    peak = values[0]
+    worst = 0.0
+    for i in range(1, values.shape[0]):
+        value = values[i]
+        if value > peak:
+            peak = value
+        elif peak > 0:
+            depth = (peak - value) / peak
+            if depth > worst:
+                worst = depth
+    return worst
+
+
+def _segment_loop(codes: Any, n_segments: int, values: Any) -> Any:
+    sums = [0.0] * n_segments
+    for i in range(codes.shape[0]):
+        sums[codes[i]] += values[i]
+    return sums
+
+
+class NumbaBackend(NumpyBackend):
+    """NumPy kernels plus JIT-compiled loops for the sequential scans."""
+
+    name = "numba"
+
+    def __init__(self) -> None:
+        super().__init__()
+        numba = importlib.import_module("numba")
+        self._drawdown = numba.njit(cache=True)(_drawdown_loop)
+        self._segments = numba.njit(cache=True)(_segment_loop)
+
+    def max_drawdown(self, values: Sequence[float]) -> float:
+        a = self.as_array(values)
+        return float(self._drawdown(a)) if a.size else 0.0
+
+    def segment_sums(
+        self, codes: Sequence[int], n_segments: int, values: Sequence[float]
+    ) -> list[float]:
+        weights = self.as_array(values)
+        if len(codes) != len(weights):
+            raise ValueError("codes and values must have equal length")
+        index = self._np.asarray(codes, dtype=self._np.intp)
+        return list(self._segments(index, n_segments, weights))
+
+
+_FACTORIES: dict[str, Callable[[], Backend]] = {
+    "python": Backend,
+    "numpy": NumpyBackend,
+    "numba": NumbaBackend,
+}
+_INSTANCES: dict[str, Backend] = {}
+_AUTO_ORDER = ("numpy", "python")
+_ACTIVE: ContextVar[Backend | None] = ContextVar("liq_metrics_backend", default=None)
+
+
+def register_backend(name: str, factory: Callable[[], Backend]) -> None:
+    """Register (or replace) a backend; ``factory`` may raise ImportError if unavailable."""
+    _FACTORIES[name] = factory
+    _INSTANCES.pop(name, None)
+
+
+def _load(name: str) -> Backend:
+    backend = _INSTANCES.get(name)
+    if backend is None:
+        factory = _FACTORIES.get(name)
+        if factory is None:
+            raise ValueError(f"unknown backend {name!r}; expected one of {sorted(_FACTORIES)}")
+        backend = _INSTANCES[name] = factory()
+    return backend
+
+
+def available_backends() -> list[str]:
+    """Registered backends whose dependencies import in this environment."""
+    names = []
+    for name in _FACTORIES:
+        try:
+            _load(name)
+        except ImportError:
+            continue
+        names.append(name)
+    return names
+
+
+def get_backend(name: str | None = None) -> Backend:
+    """Resolve ``name``, else the :func:`use_backend` override, else ``$LIQ_METRICS_BACKEND``."""
+    if name is None:
+        active = _ACTIVE.get()
+        if active is not None:
+            return active
+        name = os.environ.get(ENV_VAR) or "python"
+    name = name.strip().lower()
+    if name != "auto":
+        return _load(name)
+    for candidate in _AUTO_ORDER:
+        try:
+            return _load(candidate)
+        except ImportError:
+            continue
+    return _load("python")  # pragma: no cover - python is always in _AUTO_ORDER
+
+
+@contextmanager
+def use_backend(backend: str | Backend) -> Iterator[Backend]:
+    """Run the enclosed calls on ``backend`` (scoped to this thread / asyncio task)."""
+    resolved = get_backend(backend) if isinstance(backend, str) else backend
+    token = _ACTIVE.set(resolved)
+    try:
+        yield resolved
+    finally:
+        _ACTIVE.reset(token)
+
+
+__all__ = [
+    "ENV_VAR",
+    "Backend",
+    "NumbaBackend",
+    "NumpyBackend",
+    "available_backends",
+    "get_backend",
+    "register_backend",
+    "use_backend",
+]
@@ -0,0 +1,218 @@
+"""Seeded, chunked bootstrap resampling.
+
+The engine draws resample index vectors (iid, circular block, or stationary
+block), hands each one to a caller statistic, and collects the replicate
+tuples. Work is split into fixed-size chunks of resamples so memory stays
+bounded by ``chunk_size`` index vectors; each chunk gets its own seed drawn
+from the master seed, so results are identical whether chunks run in-process
+or across a process pool.
+
+Statistics receive the raw columns plus one index vector and should gather
+with ``map(column.__getitem__, indices)`` so the per-resample work stays in
+C-level builtins (``sum``, ``math.fsum``) rather than Python loops. Statistics
+that only need resampled totals should use :func:`bootstrap_column_sums`
+instead, which reduces a whole chunk of index vectors at once through the
+backend ``resample_sums`` kernel (a ``chunk_size x n`` index matrix on NumPy).
+"""
+
+from __future__ import annotations
+
+import math
+import random
+from collections.abc import Callable, Iterator, Sequence
+from dataclasses import dataclass
+from typing import Literal
+
+from liq.metrics.backend import get_backend
+from liq.metrics.estimators import quantile
+from liq.metrics.parallel import task_map
+
+ResampleMethod = Literal["iid", "circular", "stationary"]
+Replicate = tuple[float | None, ...]
+Statistic = Callable[[Sequence[Sequence[float]], Sequence[int]], Replicate]
+
+
+@dataclass(frozen=True, slots=True)
+class ConfidenceInterval:
+    """Point estimate with a two-sided percentile bootstrap interval."""
+
+    estimate: float | None
+    low: float | None
+    high: float | None
+
+
+@dataclass(frozen=True)
+class _BootstrapJob:
+    columns: tuple[Sequence[float], ...]
+    statistic: Statistic | None
+    size: int
+    method: ResampleMethod
+    block_length: int
+
+
+def resample_indices(
+    size: int,
+    *,
+    method: ResampleMethod = "iid",
+    block_length: int = 1,
+    rng: random.Random,
+) -> list[int]:
+    """Draw one resample of ``size`` indices into a length-``size`` series.
+
+    ``circular`` concatenates fixed ``block_length`` blocks that wrap around
+    the end of the series; ``stationary`` (Politis-Romano) draws geometric
+    block lengths with mean ``block_length``.
+    """
+    if size <= 0:
+        raise ValueError("resample size must be positive")
+    if block_length < 1:
+        raise ValueError(f"block_length must be >= 1, got {block_length}")
+    if method not in ("iid", "circular", "stationary"):
+        raise ValueError(f"unknown resample method: {method}")
+    if method == "iid" or block_length == 1:
+        return rng.choices(range(size), k=size)
+
+    log_continue = math.log1p(-1.0 / block_length)
+    indices: list[int] = []
+    while len(indices) < size:
+        start = rng.randrange(size)
+        if method == "circular":
+            length = block_length
+        else:
+            length = 1 + int(math.log(1.0 - rng.random()) / log_continue)
+        length = min(length, size - len(indices))
+        end = start + length
+        indices.extend(range(start, min(end, size)))
+        if end > size:
+            indices.extend(range(end - size))
+    return indices
+
+
+def bootstrap_replicates(
+    columns: Sequence[Sequence[float]],
+    statistic: Statistic,
+    *,
+    n_resamples: int,
+    method: ResampleMethod = "iid",
+    block_length: int = 1,
+    seed: int = 0,
+    chunk_size: int = 1_000,
+    workers: int | None = None,
+) -> list[Replicate]:
+    """Evaluate ``statistic`` on ``n_resamples`` seeded resamples of aligned columns.
+
+    Args:
+        columns: Equal-length columns resampled with a shared index vector.
+        statistic: Function of ``(columns, indices)`` returning one replicate
+            tuple. Must be a module-level function when ``workers`` is set.
+        n_resamples: Number of bootstrap replicates.
+        method: ``iid``, ``circular`` or ``stationary`` resampling.
+        block_length: Fixed (circular) or mean (stationary) block length.
+        seed: Master seed; replicates are reproducible for a given seed and
+            ``chunk_size`` regardless of ``workers``.
+        chunk_size: Resamples drawn per chunk of work.
+        workers: Process-pool size; ``None`` or ``1`` runs in-process.
+    """
+    job = _bootstrap_job(columns, statistic, method, block_length, n_resamples, chunk_size)
+    tasks = list(_chunk_tasks(n_resamples, chunk_size, seed))
+    with task_map(_run_chunk, job, workers if len(tasks) > 1 else None) as run:
+        return [replicate for chunk in run(tasks) for replicate in chunk]
+
+
+def bootstrap_column_sums(
+    columns: Sequence[Sequence[float]],
+    *,
+    n_resamples: int,
+    method: ResampleMethod = "iid",
+    block_length: int = 1,
+    seed: int = 0,
+    chunk_size: int = 1_000,
+    workers: int | None = None,
+) -> list[list[float]]:
+    """Resampled column totals: ``out[r][c]`` sums column ``c`` over resample ``r``.
+
+    Draws the same index vectors as :func:`bootstrap_replicates` for equal
+    arguments, but reduces each chunk with one backend ``resample_sums``
+    call, so sum-based statistics (means, raw-sum Sharpe ratios) skip the
+    per-resample, per-column Python gathers. ``chunk_size`` bounds the
+    ``chunk_size x n`` index matrix a chunk materializes.
+    """
+    job = _bootstrap_job(columns, None, method, block_length, n_resamples, chunk_size)
+    tasks = list(_chunk_tasks(n_resamples, chunk_size, seed))
+    with task_map(_run_sums_chunk, job, workers if len(tasks) > 1 else None) as run:
+        return [row for chunk in run(tasks) for row in chunk]
+
+
+def percentile_interval(
+    estimate: float | None,
+    replicates: Sequence[float | None],
+    *,
+    confidence: float = 0.95,
+) -> ConfidenceInterval:
+    """Percentile interval over the defined (non-None) replicate values."""
+    if not 0.0 < confidence < 1.0:
+        raise ValueError(f"confidence must be in (0, 1), got {confidence}")
+    defined = sorted(value for value in replicates if value is not None)
+    if not defined:
+        return ConfidenceInterval(estimate=estimate, low=None, high=None)
+    tail = (1.0 - confidence) / 2.0
+    return ConfidenceInterval(
+        estimate=estimate,
+        low=quantile(defined, tail),
+        high=quantile(defined, 1.0 - tail),
+    )
+
+
+def _bootstrap_job(
+    columns: Sequence[Sequence[float]],
+    statistic: Statistic | None,
+    method: ResampleMethod,
+    block_length: int,
+    n_resamples: int,
+    chunk_size: int,
+) -> _BootstrapJob:
+    if not columns or len({len(column) for column in columns}) != 1:
+        raise ValueError("bootstrap columns must be non-empty and align")
+    if n_resamples < 1:
+        raise ValueError(f"n_resamples must be positive, got {n_resamples}")
+    if chunk_size < 1:
+        raise ValueError(f"chunk_size must be positive, got {chunk_size}")
+    return _BootstrapJob(
+        columns=tuple(columns),
+        statistic=statistic,
+        size=len(columns[0]),
+        method=method,
+        block_length=block_length,
+    )
+
+
+def _chunk_tasks(n_resamples: int, chunk_size: int, seed: int) -> Iterator[tuple[int, int]]:
+    master = random.Random(seed)
+    for start in range(0, n_resamples, chunk_size):
+        yield master.getrandbits(64), min(chunk_size, n_resamples - start)
+
+
+def _chunk_indices(job: _BootstrapJob, task: tuple[int, int]) -> Iterator[list[int]]:
+    chunk_seed, count = task
+    rng = random.Random(chunk_seed)
+    for _ in range(count):
+        yield resample_indices(job.size, method=job.method, block_length=job.block_length, rng=rng)
+
+
+def _run_chunk(job: _BootstrapJob, task: tuple[int, int]) -> list[Replicate]:
+    assert job.statistic is not None
+    return [job.statistic(job.columns, indices) for indices in _chunk_indices(job, task)]
+
+
+def _run_sums_chunk(job: _BootstrapJob, task: tuple[int, int]) -> list[list[float]]:
+    return get_backend().resample_sums(job.columns, list(_chunk_indices(job, task)))
+
+
+__all__ = [
+    "ConfidenceInterval",
+    "ResampleMethod",
+    "bootstrap_column_sums",
+    "bootstrap_replicates",
+    "percentile_interval",
+    "resample_indices",
+]
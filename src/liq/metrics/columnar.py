@@ -0,0 +1,182 @@
+"""Columnar inputs for :func:`~liq.metrics.panel.compute_metrics_panel`.
+
+Trade logs usually arrive as Arrow / Parquet columns. Converting each column
+to a Python list before computing the panel dominated runtime, so this
+adapter hands the panel zero-copy ``memoryview`` columns instead:
+
+* pyarrow ``Array`` / ``ChunkedArray`` of float64 — the data buffer is cast
+  in place (``null`` values are rejected);
+* any buffer-protocol float64 object (``array.array('d')``, NumPy arrays,
+  ``bytes`` of packed doubles) — cast in place;
+* dictionary-encoded pyarrow event columns — the integer index buffer is
+  used directly as :class:`~liq.metrics.panel.EventCodes`, so per-event
+  P&L is a single segment-sum pass with no string hashing.
+
+pyarrow is never imported: arrays are recognized by their ``buffers()`` /
+``indices`` attributes, so the adapter costs nothing when it is not installed.
+Plain Python sequences pass through unchanged.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Mapping, Sequence
+from typing import Any
+
+from liq.metrics.panel import (
+    EventCodes,
+    InferenceInputs,
+    MetricsPanel,
+    compute_metrics_panel,
+    factorize_events,
+)
+
+_INT_FORMATS = {"b", "B", "h", "H", "i", "I", "l", "L", "q", "Q"}
+_ARROW_INT_FORMATS = {
+    "int8": "b",
+    "uint8": "B",
+    "int16": "h",
+    "uint16": "H",
+    "int32": "i",
+    "uint32": "I",
+    "int64": "q",
+    "uint64": "Q",
+}
+
+
+def float_column(values: Any, *, name: str = "values") -> Sequence[float]:
+    """Zero-copy float64 view of an Arrow array or buffer-protocol object.
+
+    Python sequences are returned as-is.
+    """
+    values = _combine_chunks(values)
+    if _is_arrow_array(values):
+        if str(values.type) != "double":
+            raise TypeError(f"{name} must be an Arrow float64 column, got {values.type}")
+        return _arrow_view(values, "d", name)
+    try:
+        view = memoryview(values)
+    except TypeError:
+        return values
+    if view.format == "d" and view.ndim == 1:
+        return view
+    if view.format in {"B", "b", "c"} and view.c_contiguous:
+        return view.cast("B").cast("d")
+    raise TypeError(f"{name} must hold float64 values, got buffer format {view.format!r}")
+
+
+def event_codes(events: Any, *, name: str = "trade_events") -> EventCodes:
+    """Dense integer event codes for an event column.
+
+    Dictionary-encoded Arrow columns reuse their index buffer (codes are
+    dictionary positions, so unused dictionary entries simply sum to zero).
+    Integer buffers are taken as codes already. Anything else is factorized
+    by first appearance.
+    """
+    events = _combine_chunks(events)
+    if _is_arrow_array(events) and hasattr(events, "indices"):
+        indices = events.indices
+        fmt = _ARROW_INT_FORMATS.get(str(indices.type))
+        if fmt is None:  # pragma: no cover - Arrow dictionary indices are integers
+            raise TypeError(f"{name} has unsupported index type {indices.type}")
+        labels = tuple(events.dictionary.to_pylist())
+        return EventCodes(
+            codes=_checked_codes(_arrow_view(indices, fmt, name), len(labels), name), labels=labels
+        )
+    if _is_arrow_array(events):
+        return factorize_events(events.to_pylist())
+    try:
+        view = memoryview(events)
+    except TypeError:
+        return factorize_events(events)
+    if view.format not in _INT_FORMATS or view.ndim != 1:
+        raise TypeError(f"{name} buffer must hold integer codes, got {view.format!r}")
+    n_labels = max(view) + 1 if len(view) else 0
+    return EventCodes(codes=_checked_codes(view, n_labels, name), labels=tuple(range(n_labels)))
+
+
+def _checked_codes(view: memoryview, n_labels: int, name: str) -> memoryview:
+    """``view`` if every code indexes a label; negative codes would wrap silently."""
+    if len(view) and (min(view) < 0 or max(view) >= n_labels):
+        raise ValueError(f"{name} codes must be in [0, {n_labels}), got {min(view)}..{max(view)}")
+    return view
+
+
+def compute_metrics_panel_columnar(
+    *,
+    trade_returns_net: Any,
+    trade_returns_gross: Any,
+    daily_returns: Any,
+    trade_events: Any = None,
+    benchmark_daily_returns: Any = None,
+    inference: InferenceInputs | None = None,
+    cost_stress: Mapping[str, float] | None = None,
+    portfolio_incremental_sharpe: float | None = None,
+) -> MetricsPanel:
+    """``compute_metrics_panel`` over Arrow / buffer columns without list conversion."""
+    return compute_metrics_panel(
+        trade_returns_net=float_column(trade_returns_net, name="trade_returns_net"),
+        trade_returns_gross=float_column(trade_returns_gross, name="trade_returns_gross"),
+        daily_returns=float_column(daily_returns, name="daily_returns"),
+        trade_events=None if trade_events is None else event_codes(trade_events),
+        benchmark_daily_returns=(
+            None
+            if benchmark_daily_returns is None
+            else float_column(benchmark_daily_returns, name="benchmark_daily_returns")
+        ),
+        inference=inference,
+        cost_stress=cost_stress,
+        portfolio_incremental_sharpe=portfolio_incremental_sharpe,
+    )
+
+
+def compute_metrics_panel_from_tables(
+    trades: Any,
+    daily: Any,
+    *,
+    net_column: str = "net_return",
+    gross_column: str = "gross_return",
+    event_column: str | None = None,
+    daily_column: str = "return",
+    benchmark_column: str | None = None,
+    inference: InferenceInputs | None = None,
+    cost_stress: Mapping[str, float] | None = None,
+    portfolio_incremental_sharpe: float | None = None,
+) -> MetricsPanel:
+    """Panel from a trades table and a daily table (pyarrow ``Table`` or column mapping)."""
+    return compute_metrics_panel_columnar(
+        trade_returns_net=trades[net_column],
+        trade_returns_gross=trades[gross_column],
+        daily_returns=daily[daily_column],
+        trade_events=None if event_column is None else trades[event_column],
+        benchmark_daily_returns=None if benchmark_column is None else daily[benchmark_column],
+        inference=inference,
+        cost_stress=cost_stress,
+        portfolio_incremental_sharpe=portfolio_incremental_sharpe,
+    )
+
+
+def _is_arrow_array(values: Any) -> bool:
+    return hasattr(values, "buffers") and hasattr(values, "null_count")
+
+
+def _combine_chunks(values: Any) -> Any:
+    # ChunkedArray (e.g. a Table column); single-chunk columns combine without copying.
+    if hasattr(values, "combine_chunks") and hasattr(values, "num_chunks"):
+        return values.combine_chunks()
+    return values
+
+
+def _arrow_view(array: Any, fmt: str, name: str) -> memoryview:
+    if array.null_count:
+        raise ValueError(f"{name} contains {array.null_count} null values")
+    data = array.buffers()[1]
+    view = memoryview(data).cast("B").cast(fmt)
+    return view[array.offset : array.offset + len(array)]
+
+
+__all__ = [
+    "compute_metrics_panel_columnar",
+    "compute_metrics_panel_from_tables",
+    "event_codes",
+    "float_column",
+]
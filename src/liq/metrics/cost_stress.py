@@ -0,0 +1,215 @@
+"""Cost-stress scenarios for :attr:`MetricsPanel.cost_stress`.
+
+A scenario scales each per-trade cost component (commission, spread,
+impact) by its own multiplier, so scenario net returns are
+``gross - m_c * commission - m_s * spread - m_i * impact``. Net totals and
+per-trade Sharpe are linear / quadratic in the multipliers: the engine
+computes the component sums and their co-moment matrix once, and every
+scenario's total and Sharpe then costs O(1).
+
+The profit factor depends on per-trade signs. Scenarios whose multipliers
+are proportional (every :func:`uniform_cost_scenarios` entry) share a cost
+direction ``k``: trade ``i`` loses at scale ``m`` exactly when its breakeven
+``g_i / k_i`` lies below ``m``. Breakevens are sorted once per direction
+shared by two or more scenarios, with prefix sums of ``g`` and ``k``, so each
+of those scenarios' gross loss is one bisection, ``O(log n)``. A direction
+used by a single scenario would not amortize the ``O(n log n)`` sort; those
+scenarios are netted together as one (scenarios x trades) matrix on the
+active :mod:`liq.metrics.backend`, ``O(n)`` each.
+"""
+
+from __future__ import annotations
+
+import math
+from bisect import bisect_left, bisect_right
+from collections import Counter
+from collections.abc import Iterable, Mapping, Sequence
+from dataclasses import dataclass
+from itertools import accumulate
+
+from liq.metrics.backend import get_backend
+
+
+@dataclass(frozen=True)
+class CostScenario:
+    """Per-component cost multipliers (1.0 = measured costs)."""
+
+    commission: float = 1.0
+    spread: float = 1.0
+    impact: float = 1.0
+
+    @classmethod
+    def uniform(cls, multiplier: float) -> CostScenario:
+        """Scale every component by the same multiplier."""
+        return cls(commission=multiplier, spread=multiplier, impact=multiplier)
+
+
+@dataclass(frozen=True)
+class CostStressResult:
+    """Trade-level outcome of one cost scenario."""
+
+    net_return: float
+    sharpe: float | None
+    profit_factor: float
+
+
+def uniform_cost_scenarios(
+    multipliers: Iterable[float], *, prefix: str = "cost_x"
+) -> dict[str, CostScenario]:
+    """Scenario ids (``cost_x1``, ``cost_x2.5``, ...) for uniform multipliers."""
+    return {
+        f"{prefix}{multiplier:g}": CostScenario.uniform(multiplier) for multiplier in multipliers
+    }
+
+
+def compute_cost_stress(
+    *,
+    trade_returns_gross: Sequence[float],
+    commission: Sequence[float],
+    spread: Sequence[float],
+    impact: Sequence[float],
+    scenarios: Mapping[str, CostScenario],
+) -> dict[str, CostStressResult]:
+    """Evaluate every cost scenario over the same trades.
+
+    Args:
+        trade_returns_gross: Fractional gross return per trade.
+        commission: Commission cost per trade, as a positive return drag.
+        spread: Half-spread cost per trade, as a positive return drag.
+        impact: Market-impact cost per trade, as a positive return drag.
+        scenarios: Multipliers per scenario id.
+
+    Returns:
+        Net total return, per-trade Sharpe and profit factor per scenario id.
+    """
+    n = len(trade_returns_gross)
+    if n == 0:
+        raise ValueError("trade returns must not be empty")
+    columns = (trade_returns_gross, commission, spread, impact)
+    for name, column in zip(("commission", "spread", "impact"), columns[1:], strict=True):
+        if len(column) != n:
+            raise ValueError(
+                f"{name} costs must align with trade returns, got {len(column)} for {n} trades"
+            )
+
+    totals = [math.fsum(column) for column in columns]
+    means = [total / n for total in totals]
+    centered = [
+        [value - mean for value in column] for column, mean in zip(columns, means, strict=True)
+    ]
+    # Co-moment matrix of (gross, commission, spread, impact) deviations.
+    comoments = [
+        [math.fsum(a * b for a, b in zip(centered[i], centered[j], strict=True)) for j in range(4)]
+        for i in range(4)
+    ]
+
+    summaries: dict[str, tuple[float, float | None, float, tuple[float, float, float]]] = {}
+    for scenario_id, scenario in scenarios.items():
+        # Net = w . (gross, commission, spread, impact) with w = (1, -m_c, -m_s, -m_i).
+        weights = (1.0, -scenario.commission, -scenario.spread, -scenario.impact)
+        net_total = sum(w * total for w, total in zip(weights, totals, strict=True))
+        sharpe: float | None = None
+        if n >= 2:
+            terms = [weights[i] * weights[j] * comoments[i][j] for i in range(4) for j in range(4)]
+            squares = math.fsum(terms)
+            # Cancellation across components leaves round-off for constant net series.
+            if squares > 1e-12 * math.fsum(map(abs, terms)):
+                sharpe = net_total / n / math.sqrt(squares / (n - 1))
+        multipliers = _multipliers(scenario)
+        scale = max(map(abs, multipliers)) or 1.0
+        direction = (multipliers[0] / scale, multipliers[1] / scale, multipliers[2] / scale)
+        summaries[scenario_id] = (net_total, sharpe, scale, direction)
+
+    shared = Counter(direction for *_, direction in summaries.values())
+    curves: dict[tuple[float, float, float], _LossCurve] = {}
+    gross_losses: dict[str, float] = {}
+    single: list[str] = []
+    for scenario_id, (_, _, scale, direction) in summaries.items():
+        if shared[direction] < 2:
+            single.append(scenario_id)
+            continue
+        curve = curves.get(direction)
+        if curve is None:
+            costs = [
+                direction[0] * c + direction[1] * s + direction[2] * i
+                for c, s, i in zip(commission, spread, impact, strict=True)
+            ]
+            curve = curves[direction] = _LossCurve.build(trade_returns_gross, costs)
+        gross_losses[scenario_id] = curve.gross_loss(scale)
+    if single:
+        losses = get_backend().scenario_gross_losses(
+            trade_returns_gross,
+            (commission, spread, impact),
+            [_multipliers(scenarios[scenario_id]) for scenario_id in single],
+        )
+        gross_losses.update(zip(single, losses, strict=True))
+
+    results: dict[str, CostStressResult] = {}
+    for scenario_id, (net_total, sharpe, _, _) in summaries.items():
+        gross_loss = gross_losses[scenario_id]
+        # Gross profit minus gross loss is the net total.
+        gross_profit = net_total + gross_loss
+        results[scenario_id] = CostStressResult(
+            net_return=net_total,
+            sharpe=sharpe,
+            profit_factor=gross_profit / gross_loss if gross_loss > 0 else math.inf,
+        )
+    return results
+
+
+def _multipliers(scenario: CostScenario) -> tuple[float, float, float]:
+    return scenario.commission, scenario.spread, scenario.impact
+
+
+@dataclass(frozen=True)
+class _LossCurve:
+    """Gross loss of the trade nets ``g - m * k`` as a function of ``m``."""
+
+    # Trades with k > 0 lose for m above their breakeven g / k, trades with
+    # k < 0 below it; both sorted by breakeven with prefix sums of g and k.
+    rising: tuple[list[float], list[float], list[float]]
+    falling: tuple[list[float], list[float], list[float]]
+    # Trades with k == 0 lose -g whatever the scale.
+    fixed: float
+
+    @classmethod
+    def build(cls, gross: Sequence[float], costs: Sequence[float]) -> _LossCurve:
+        rising = sorted((g / k, g, k) for g, k in zip(gross, costs, strict=True) if k > 0)
+        falling = sorted((g / k, g, k) for g, k in zip(gross, costs, strict=True) if k < 0)
+        fixed = -math.fsum(g for g, k in zip(gross, costs, strict=True) if k == 0 and g < 0)
+        return cls(rising=_prefixed(rising), falling=_prefixed(falling), fixed=fixed)
+
+    def gross_loss(self, m: float) -> float:
+        # A losing trade contributes -(g - m * k) = m * k - g.
+        ratios, g_sums, k_sums = self.rising
+        lo = bisect_left(ratios, m)
+        loss = m * k_sums[lo] - g_sums[lo]
+        ratios, g_sums, k_sums = self.falling
+        hi = bisect_right(ratios, m)
+        loss += m * (k_sums[-1] - k_sums[hi]) - (g_sums[-1] - g_sums[hi])
+        return self.fixed + max(loss, 0.0)
+
+
+def _prefixed(
+    rows: list[tuple[float, float, float]],
+) -> tuple[list[float], list[float], list[float]]:
+    """Breakevens plus prefix sums (leading 0.0) of g and k."""
+    return (
+        [ratio for ratio, _, _ in rows],
+        list(accumulate((g for _, g, _ in rows), initial=0.0)),
+        list(accumulate((k for _, _, k in rows), initial=0.0)),
+    )
+
+
+def cost_stress_net_returns(results: Mapping[str, CostStressResult]) -> dict[str, float]:
+    """Scenario id → net total return, the ``cost_stress`` panel mapping."""
+    return {scenario_id: result.net_return for scenario_id, result in results.items()}
+
+
+__all__ = [
+    "CostScenario",
+    "CostStressResult",
+    "compute_cost_stress",
+    "cost_stress_net_returns",
+    "uniform_cost_scenarios",
+]
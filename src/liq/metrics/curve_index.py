@@ -0,0 +1,169 @@
+"""Precomputed index for repeated time-range queries over one equity curve.
+
+:class:`CurveIndex` answers "what were the return / Sharpe / max drawdown
+between X and Y" without re-running
+:class:`~liq.metrics.performance.PerformanceAnalyzer` on a slice:
+
+* total return comes from the two endpoint values — O(1);
+* Sharpe and win rate come from prefix sums of bar returns, squared returns
+  and wins — O(1). Returns are centered on the curve-wide mean before
+  summing, which keeps the variance difference well conditioned;
+* max drawdown comes from a sparse table of ``(max, min, max drawdown)``
+  blocks over power-of-two ranges. A query merges the O(log n) disjoint
+  blocks covering the range left to right.
+
+The build costs O(n log n) time and memory. Values must be strictly positive
+(equity, NAV), which is what lets blocks merge with ``1 - min / max``.
+"""
+
+from __future__ import annotations
+
+import math
+from bisect import bisect_left, bisect_right
+from collections.abc import Sequence
+from datetime import datetime
+from decimal import Decimal
+from itertools import accumulate
+
+from liq.metrics.performance import RegimeMetrics
+
+
+class CurveIndex:
+    """Range-query index over a timestamped equity curve.
+
+    Ranges are inclusive bar indices ``[start, end]`` or inclusive datetime
+    bounds; metrics follow :class:`~liq.metrics.performance.RegimeMetrics`
+    conventions (per-bar Sharpe, negative max drawdown).
+    """
+
+    def __init__(self, timestamps: Sequence[datetime], values: Sequence[float]) -> None:
+        n = len(values)
+        if len(timestamps) != n:
+            raise ValueError(f"timestamps ({len(timestamps)}) and values ({n}) must align")
+        if n == 0:
+            raise ValueError("cannot index an empty equity curve")
+        values = [float(v) for v in values]
+        if min(values) <= 0:
+            raise ValueError("CurveIndex requires strictly positive equity values")
+        if any(b < a for a, b in zip(timestamps, timestamps[1:], strict=False)):
+            raise ValueError("equity curve timestamps must be sorted")
+        self.timestamps = list(timestamps)
+        self.values = values
+
+        returns = [(b - a) / a for a, b in zip(values, values[1:], strict=False)]
+        self._mean_return = math.fsum(returns) / len(returns) if returns else 0.0
+        centered = [r - self._mean_return for r in returns]
+        # Prefix arrays over returns: element k covers returns[0:k].
+        self._sums = list(accumulate(centered, initial=0.0))
+        self._squares = list(accumulate((d * d for d in centered), initial=0.0))
+        self._wins = list(accumulate((r > 0 for r in returns), initial=0))
+
+        # Sparse table: level k holds blocks values[i : i + 2**k].
+        self._maxes = [values]
+        self._mins = [values]
+        self._drawdowns = [[0.0] * n]
+        width = 1
+        while 2 * width <= n:
+            maxes, mins, dds = self._maxes[-1], self._mins[-1], self._drawdowns[-1]
+            count = n - 2 * width + 1
+            self._maxes.append([max(maxes[i], maxes[i + width]) for i in range(count)])
+            self._mins.append([min(mins[i], mins[i + width]) for i in range(count)])
+            self._drawdowns.append(
+                [
+                    max(dds[i], dds[i + width], 1.0 - mins[i + width] / maxes[i])
+                    for i in range(count)
+                ]
+            )
+            width *= 2
+
+    @classmethod
+    def from_equity_curve(cls, equity_curve: Sequence[tuple[datetime, Decimal]]) -> CurveIndex:
+        """Index a ``(datetime, Decimal)`` equity curve."""
+        return cls([ts for ts, _ in equity_curve], [float(v) for _, v in equity_curve])
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+    def bar_range(self, start: datetime | None = None, end: datetime | None = None) -> range:
+        """Bar indices whose timestamps fall in ``[start, end]`` (open-ended if ``None``)."""
+        lo = 0 if start is None else bisect_left(self.timestamps, start)
+        hi = len(self.timestamps) if end is None else bisect_right(self.timestamps, end)
+        return range(lo, hi)
+
+    def total_return(self, start: int, end: int) -> float:
+        """Return from bar ``start`` to bar ``end``."""
+        self._check(start, end)
+        return (self.values[end] - self.values[start]) / self.values[start]
+
+    def sharpe(self, start: int, end: int) -> float | None:
+        """Per-bar Sharpe of the returns inside ``[start, end]``; ``None`` as in the analyzer."""
+        self._check(start, end)
+        m = end - start
+        if m < 2:
+            return None
+        total = self._sums[end] - self._sums[start]
+        squares = self._squares[end] - self._squares[start]
+        spread = squares - total * total / m
+        # Round-off of the prefix differences stands in for zero variance.
+        if spread <= 1e-12 * squares:
+            return None
+        mean = self._mean_return + total / m
+        return mean / math.sqrt(spread / (m - 1))
+
+    def max_drawdown(self, start: int, end: int) -> float:
+        """Maximum drawdown inside ``[start, end]`` as a negative fraction."""
+        self._check(start, end)
+        peak = 0.0  # values are positive, so 0.0 marks "no block merged yet"
+        worst = 0.0
+        i = start
+        remaining = end - start + 1
+        while remaining:
+            level = remaining.bit_length() - 1
+            block_drawdown = self._drawdowns[level][i]
+            if peak:
+                block_drawdown = max(block_drawdown, 1.0 - self._mins[level][i] / peak)
+            worst = max(worst, block_drawdown)
+            peak = max(peak, self._maxes[level][i])
+            i += 1 << level
+            remaining -= 1 << level
+        return 0.0 - worst
+
+    def range_metrics(self, start: int, end: int, *, regime: str = "range") -> RegimeMetrics:
+        """Analyzer-equivalent metrics for bars ``start`` through ``end``."""
+        self._check(start, end)
+        m = end - start
+        return RegimeMetrics(
+            regime=regime,
+            total_return=self.total_return(start, end),
+            sharpe_ratio=self.sharpe(start, end),
+            max_drawdown=self.max_drawdown(start, end),
+            num_bars=m + 1,
+            win_rate=(self._wins[end] - self._wins[start]) / m if m else None,
+        )
+
+    def metrics(
+        self,
+        start: datetime | None = None,
+        end: datetime | None = None,
+        *,
+        regime: str = "range",
+    ) -> RegimeMetrics:
+        """Metrics for the bars timestamped within ``[start, end]``."""
+        bars = self.bar_range(start, end)
+        if not bars:
+            return RegimeMetrics(
+                regime=regime,
+                total_return=0.0,
+                sharpe_ratio=None,
+                max_drawdown=0.0,
+                num_bars=0,
+                win_rate=None,
+            )
+        return self.range_metrics(bars.start, bars.stop - 1, regime=regime)
+
+    def _check(self, start: int, end: int) -> None:
+        if not 0 <= start <= end < len(self.values):
+            raise IndexError(f"bar range [{start}, {end}] outside curve of {len(self.values)}")
+
+
+__all__ = ["CurveIndex"]
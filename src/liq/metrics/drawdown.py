@@ -0,0 +1,141 @@
+"""Shared drawdown engine for equity / NAV curves.
+
+One pass over a value curve yields the underwater curve, every drawdown
+episode (peak, trough, recovery, depth, duration) and the maximum drawdown,
+so callers stop re-scanning curves for each drawdown statistic.
+
+Conventions: the underwater curve is ``(value - running_peak) / running_peak``
+(``<= 0``); episode depths and :func:`max_drawdown` are positive fractions.
+Bars whose running peak is not positive count as zero drawdown.
+"""
+
+from __future__ import annotations
+
+import heapq
+from collections.abc import Iterable, Sequence
+from dataclasses import dataclass
+from itertools import accumulate
+
+
+@dataclass(frozen=True)
+class DrawdownEpisode:
+    """One peak-to-recovery drawdown; indices refer to the analyzed curve."""
+
+    start: int  # index of the peak the episode is measured from
+    trough: int
+    recovery: int | None  # first index back at the peak; None if unrecovered
+    depth: float  # positive fraction, e.g. 0.10 for a 10% drawdown
+    duration: int  # bars from peak to recovery (or to the last bar)
+
+
+@dataclass(frozen=True)
+class DrawdownAnalysis:
+    """Underwater curve plus the episode index of one curve."""
+
+    underwater: tuple[float, ...]
+    episodes: tuple[DrawdownEpisode, ...]
+    max_drawdown: float
+
+    def top(self, k: int) -> list[DrawdownEpisode]:
+        """The ``k`` deepest episodes, deepest first."""
+        return heapq.nlargest(k, self.episodes, key=_depth)
+
+
+def _depth(episode: DrawdownEpisode) -> float:
+    return episode.depth
+
+
+def underwater_curve(values: Sequence[float]) -> list[float]:
+    """Drawdown from the running peak at every bar (``<= 0``)."""
+    return [
+        (value - peak) / peak if peak > 0 else 0.0
+        for value, peak in zip(values, accumulate(values, max), strict=True)
+    ]
+
+
+def max_drawdown(values: Iterable[float]) -> float:
+    """Maximum drawdown of a value curve as a positive fraction."""
+    peak = None
+    worst = 0.0
+    for value in values:
+        if peak is None or value > peak:
+            peak = value
+        elif peak > 0:
+            depth = (peak - value) / peak
+            if depth > worst:
+                worst = depth
+    return worst
+
+
+def compounded_equity(returns: Iterable[float], start: float = 1.0) -> list[float]:
+    """Equity curve (including the starting value) compounded from fractional returns."""
+    equity = [start]
+    for r in returns:
+        equity.append(equity[-1] * (1.0 + r))
+    return equity
+
+
+def analyze_drawdowns(values: Sequence[float]) -> DrawdownAnalysis:
+    """Underwater curve, episode index and maximum drawdown in one pass."""
+    underwater: list[float] = []
+    episodes: list[DrawdownEpisode] = []
+    peak = 0.0
+    peak_index = 0
+    trough_index = 0
+    trough_depth = 0.0
+    in_episode = False
+    worst = 0.0
+
+    for index, value in enumerate(values):
+        if index == 0 or value >= peak:
+            if in_episode:
+                episodes.append(
+                    DrawdownEpisode(
+                        start=peak_index,
+                        trough=trough_index,
+                        recovery=index,
+                        depth=trough_depth,
+                        duration=index - peak_index,
+                    )
+                )
+                in_episode = False
+            peak = value
+            peak_index = index
+            underwater.append(0.0)
+            continue
+        dd = (value - peak) / peak if peak > 0 else 0.0
+        underwater.append(dd)
+        if dd == 0.0:
+            continue
+        if not in_episode:
+            in_episode = True
+            trough_index = index
+            trough_depth = -dd
+        elif -dd > trough_depth:
+            trough_index = index
+            trough_depth = -dd
+        worst = max(worst, trough_depth)
+
+    if in_episode:
+        episodes.append(
+            DrawdownEpisode(
+                start=peak_index,
+                trough=trough_index,
+                recovery=None,
+                depth=trough_depth,
+                duration=len(underwater) - 1 - peak_index,
+            )
+        )
+    return DrawdownAnalysis(
+        underwater=tuple(underwater), episodes=tuple(episodes), max_drawdown=worst
+    )
+
+
+__all__ = [
+    "DrawdownAnalysis",
+    "DrawdownEpisode",
+    "analyze_drawdowns",
+    "compounded_equity",
+    "max_drawdown",
+    "underwater_curve",
+]
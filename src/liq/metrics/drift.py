@@ -1,17 +1,39 @@
-"""Drift metrics ingestion."""
+"""Drift metrics ingestion.
+
+:func:`summarize_drift` reduces one batch of drift statistics to max / mean.
+:class:`DriftMonitor` is its streaming counterpart for pipelines that emit
+millions of per-feature statistics: constant memory (running moments, a
+bounded top-k heap of the most drifted features and a
+:class:`~liq.metrics.sketch.QuantileSketch`), fed in batches and mergeable
+across workers. Its :meth:`DriftMonitor.summary` carries the
+``summarize_drift`` keys.
+"""
 
 from __future__ import annotations
 
-from collections.abc import Iterable
+import heapq
+import math
+from collections.abc import Hashable, Iterable, Mapping
+from itertools import count, islice
+
+from liq.metrics.sketch import QuantileSketch
+from liq.metrics.validation import ValidationMode, as_sequence, check_types
+
+DEFAULT_QUANTILES = (0.5, 0.9, 0.99)
+_BATCH = 65_536
 
 
-def summarize_drift(statistics: Iterable[float]) -> dict[str, float]:
+def summarize_drift(
+    statistics: Iterable[float], *, validate: ValidationMode = "full"
+) -> dict[str, float]:
     """Compute basic statistics for drift signals.
 
     Calculates max and mean of drift statistics from feature pipelines.
 
     Args:
         statistics: An iterable of numeric drift values (floats or ints).
+        validate: ``"full"``, ``"sample"`` or ``"off"``; see
+            :mod:`liq.metrics.validation`.
 
     Returns:
         A dictionary with 'max' and 'mean' keys. Returns {'max': 0.0, 'mean': 0.0}
@@ -26,17 +48,194 @@ def summarize_drift(statistics: Iterable[float]) -> dict[str, float]:
         >>> summarize_drift([])
         {'max': 0.0, 'mean': 0.0}
     """
-    stats = list(statistics)
+    stats = as_sequence(statistics)
 
-    if not stats:
+    if len(stats) == 0:
         return {"max": 0.0, "mean": 0.0}
 
-    # Validate all elements are numeric
-    for i, val in enumerate(stats):
-        if not isinstance(val, (int, float)):
-            raise TypeError(
-                f"All statistics must be numeric (int or float), "
-                f"got {type(val).__name__} at index {i}"
+    check_types(
+        stats,
+        (int, float),
+        message="All statistics must be numeric (int or float), got {type} at index {index}",
+        mode=validate,
+    )
+
+    return {"max": float(max(stats)), "mean": float(sum(stats) / len(stats))}
+
+
+class DriftMonitor:
+    """Streaming, mergeable summary of drift statistics.
+
+    Tracks count, mean, variance (Chan's parallel update per batch), min and
+    max, the ``top_k`` features with the largest statistic seen (a bounded
+    min-heap, one entry per feature), and approximate quantiles from a
+    :class:`~liq.metrics.sketch.QuantileSketch` (exact until it first
+    compacts). Memory is ``O(top_k + sketch_k)`` however many statistics are
+    ingested.
+    """
+
+    def __init__(
+        self,
+        *,
+        top_k: int = 10,
+        sketch_k: int = 512,
+        quantiles: Iterable[float] = DEFAULT_QUANTILES,
+        seed: int | None = 0,
+    ) -> None:
+        if top_k < 0:
+            raise ValueError(f"top_k must be non-negative, got {top_k}")
+        self.top_k = top_k
+        self.quantiles = tuple(quantiles)
+        if not all(0.0 <= q <= 1.0 for q in self.quantiles):
+            raise ValueError(f"quantiles must be in [0, 1], got {self.quantiles}")
+        self.count = 0
+        self.mean = 0.0
+        self._m2 = 0.0
+        self.min = math.inf
+        self.max = -math.inf
+        self._sketch = QuantileSketch(sketch_k, seed=seed)
+        self._heap: list[tuple[float, int, Hashable]] = []
+        self._best: dict[Hashable, float] = {}
+        self._order = count()
+
+    @property
+    def variance(self) -> float:
+        """Sample variance (0.0 below two statistics)."""
+        return self._m2 / (self.count - 1) if self.count > 1 else 0.0
+
+    def update(self, statistic: float, feature: Hashable | None = None) -> None:
+        """Add one statistic, optionally attributed to ``feature``."""
+        if feature is None:
+            self.extend((statistic,))
+        else:
+            self.extend({feature: statistic})
+
+    def extend(
+        self,
+        statistics: Iterable[float] | Mapping[Hashable, float],
+        *,
+        validate: ValidationMode = "full",
+    ) -> None:
+        """Add a batch of statistics.
+
+        A mapping attributes each statistic to its feature key for the top-k
+        ranking; a plain iterable contributes to everything but the ranking.
+        Iterables are consumed in bounded slices, never materialized whole.
+        """
+        if isinstance(statistics, Mapping):
+            items = iter(statistics.items())
+            while chunk := list(islice(items, _BATCH)):
+                batch = [statistic for _, statistic in chunk]
+                self._add_batch(batch, validate)
+                for feature, statistic in chunk:
+                    self._offer(feature, statistic)
+            return
+        iterator = iter(statistics)
+        while batch := list(islice(iterator, _BATCH)):
+            self._add_batch(batch, validate)
+
+    def merge(self, other: DriftMonitor) -> None:
+        """Fold another monitor (e.g. from a parallel worker) into this one.
+
+        Raises:
+            ValueError: If the monitors' quantile sketches have different
+                ``sketch_k``; this monitor is left unchanged.
+        """
+        if other._sketch.k != self._sketch.k:
+            raise ValueError(
+                f"cannot merge monitors with sketch_k={self._sketch.k} and {other._sketch.k}"
             )
+        self._merge_moments(other.count, other.mean, other._m2)
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+        self._sketch.merge(other._sketch)
+        for feature, statistic in other._best.items():
+            self._offer(feature, statistic)
+
+    def quantile(self, p: float) -> float:
+        """Approximate ``p``-quantile of the statistics seen."""
+        return self._sketch.quantile(p)
+
+    def top_features(self) -> list[tuple[Hashable, float]]:
+        """The ``top_k`` most drifted features and their largest statistic, largest first."""
+        ranked = sorted(self._heap, key=lambda entry: (-entry[0], entry[1]))
+        return [(feature, statistic) for statistic, _, feature in ranked]
+
+    def summary(self) -> dict[str, float]:
+        """``summarize_drift`` keys (``max``, ``mean``) plus the streaming statistics.
+
+        Adds ``count``, ``min``, ``variance``, ``std`` and one ``p<q>`` key per
+        configured quantile (``p50``, ``p99``, ``p99.9``). An empty monitor
+        reports zeros, like ``summarize_drift([])``.
+        """
+        if not self.count:
+            return {
+                "max": 0.0,
+                "mean": 0.0,
+                "count": 0.0,
+                "min": 0.0,
+                "variance": 0.0,
+                "std": 0.0,
+                **{_quantile_key(q): 0.0 for q in self.quantiles},
+            }
+        return {
+            "max": float(self.max),
+            "mean": self.mean,
+            "count": float(self.count),
+            "min": float(self.min),
+            "variance": self.variance,
+            "std": math.sqrt(self.variance),
+            **{_quantile_key(q): float(self._sketch.quantile(q)) for q in self.quantiles},
+        }
+
+    def _add_batch(self, batch: list[float], validate: ValidationMode) -> None:
+        check_types(
+            batch,
+            (int, float),
+            message="All statistics must be numeric (int or float), got {type} at index {index}",
+            mode=validate,
+        )
+        n = len(batch)
+        mean = sum(batch) / n
+        m2 = sum((value - mean) ** 2 for value in batch)
+        self._merge_moments(n, mean, m2)
+        self.min = min(self.min, min(batch))
+        self.max = max(self.max, max(batch))
+        self._sketch.extend(batch)
+
+    def _merge_moments(self, n: int, mean: float, m2: float) -> None:
+        if not n:
+            return
+        total = self.count + n
+        delta = mean - self.mean
+        self._m2 += m2 + delta * delta * self.count * n / total
+        self.mean += delta * n / total
+        self.count = total
+
+    def _offer(self, feature: Hashable, statistic: float) -> None:
+        """Keep ``feature`` in the top-k heap if its statistic ranks."""
+        if not self.top_k:
+            return
+        best = self._best.get(feature)
+        if best is not None:
+            if statistic > best:
+                self._best[feature] = statistic
+                for i, entry in enumerate(self._heap):
+                    if entry[2] == feature:
+                        self._heap[i] = (statistic, entry[1], feature)
+                        break
+                heapq.heapify(self._heap)
+            return
+        entry = (statistic, next(self._order), feature)
+        if len(self._heap) < self.top_k:
+            heapq.heappush(self._heap, entry)
+        elif statistic > self._heap[0][0]:
+            evicted = heapq.heapreplace(self._heap, entry)
+            del self._best[evicted[2]]
+        else:
+            return
+        self._best[feature] = statistic
+
 
-    return {"max": float(max(stats)), "mean": sum(stats) / len(stats)}
+def _quantile_key(q: float) -> str:
+    return f"p{q * 100:g}"
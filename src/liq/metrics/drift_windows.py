@@ -0,0 +1,178 @@
+"""Windowed drift over a (time × features) matrix.
+
+:func:`windowed_drift` slides a window down the rows of a matrix (one row
+per timestamp, one column per feature) and scores every feature in every
+window against a reference histogram (see :mod:`liq.metrics.histograms`):
+
+* **fixed** reference -- cached :class:`~liq.metrics.histograms.FeatureReferences`,
+  or quantile histograms of the leading ``reference_rows`` rows;
+* **rolling** reference -- the ``reference_rows`` rows immediately before
+  each window, binned on edges fixed by the initial reference.
+
+Each column is binned once (the backend ``bin_indices`` kernel). As the
+window advances, only the rows that enter and leave it touch the live and
+rolling-reference bin counts, so a window costs ``O(step + bins)`` per
+feature instead of rebinning ``window`` rows. Each window's per-feature
+statistics are reduced with :func:`~liq.metrics.drift.summarize_drift`.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Hashable, Sequence
+from dataclasses import dataclass
+from typing import Any
+
+from liq.metrics.backend import get_backend
+from liq.metrics.drift import summarize_drift
+from liq.metrics.histograms import (
+    DEFAULT_EPSILON,
+    DRIFT_METRICS,
+    DriftMetric,
+    FeatureReferences,
+    ReferenceHistogram,
+    drift_scores,
+)
+from liq.metrics.validation import all_finite
+
+
+@dataclass(frozen=True)
+class DriftWindow:
+    """Drift of one window of rows ``[start, stop)``."""
+
+    start: int
+    stop: int
+    statistics: dict[Hashable, float]
+    summary: dict[str, float]
+
+
+def windowed_drift(
+    matrix: Sequence[Sequence[float]],
+    *,
+    window: int,
+    step: int | None = None,
+    features: Sequence[Hashable] | None = None,
+    reference: FeatureReferences | None = None,
+    reference_rows: int | None = None,
+    rolling: bool = False,
+    metric: DriftMetric = "psi",
+    bins: int = 10,
+    epsilon: float = DEFAULT_EPSILON,
+) -> list[DriftWindow]:
+    """Per-window, per-feature drift statistics.
+
+    Args:
+        matrix: One row per timestamp, one column per feature (nested
+            sequences or a 2-D NumPy array).
+        window: Rows per live window.
+        step: Rows the window advances by; defaults to ``window`` (tumbling
+            windows). Smaller steps give overlapping windows.
+        features: Column keys; defaults to the column indices. Must match the
+            keys of ``reference`` when that is given.
+        reference: Cached reference histograms. Without it the leading
+            ``reference_rows`` rows are the reference and windows start after
+            them.
+        reference_rows: Size of the reference block (and of the rolling
+            reference).
+        rolling: Compare each window with the ``reference_rows`` rows just
+            before it instead of a fixed reference. Bin edges come from
+            ``reference`` or from the leading ``reference_rows`` rows.
+        metric: Statistic reported per feature: ``"psi"``, ``"ks"`` or ``"js"``.
+        bins: Quantile bins per feature when histograms are built here.
+        epsilon: PSI floor for empty bins.
+
+    Returns:
+        One :class:`DriftWindow` per full window, in time order; windows that
+        would run past the last row are dropped.
+    """
+    if metric not in DRIFT_METRICS:
+        raise ValueError(f"metric must be one of {DRIFT_METRICS}, got {metric!r}")
+    if window < 1:
+        raise ValueError(f"window must be positive, got {window}")
+    step = window if step is None else step
+    if step < 1:
+        raise ValueError(f"step must be positive, got {step}")
+    if reference is None and reference_rows is None:
+        raise ValueError("pass reference histograms or reference_rows")
+    if rolling and reference_rows is None:
+        raise ValueError("a rolling reference needs reference_rows")
+    if reference_rows is not None and reference_rows < 1:
+        raise ValueError(f"reference_rows must be positive, got {reference_rows}")
+    lag = reference_rows or 0
+
+    columns = _columns(matrix)
+    keys = list(range(len(columns))) if features is None else list(features)
+    if len(keys) != len(columns):
+        raise ValueError(f"expected {len(columns)} feature keys, got {len(keys)}")
+    n_rows = len(columns[0]) if columns else 0
+
+    if reference is not None:
+        missing = [feature for feature in keys if feature not in reference.histograms]
+        if missing:
+            raise KeyError(f"no reference histogram for features {missing[:5]}")
+        histograms = [reference[feature] for feature in keys]
+    else:
+        if n_rows < lag:
+            raise ValueError(f"need at least {lag} rows, got {n_rows}")
+        histograms = [ReferenceHistogram.from_values(column[:lag], bins=bins) for column in columns]
+    first = 0 if reference is not None and not rolling else lag
+    starts = range(first, n_rows - window + 1, step)
+    if not starts:
+        return []
+
+    backend = get_backend()
+    statistics: list[dict[Hashable, float]] = [{} for _ in starts]
+    for feature, column, histogram in zip(keys, columns, histograms, strict=True):
+        if not all_finite(column):
+            raise ValueError(f"matrix values of feature {feature!r} must be finite")
+        indices = backend.bin_indices(column, histogram.edges)
+        live = _SlidingCounts(indices, len(histogram.counts))
+        lagged = _SlidingCounts(indices, len(histogram.counts)) if rolling else None
+        for slot, start in zip(statistics, starts, strict=True):
+            live.move(start, start + window)
+            if lagged is not None:
+                lagged.move(start - lag, start)
+            scores = drift_scores(
+                histogram.counts if lagged is None else lagged.counts,
+                live.counts,
+                epsilon=epsilon,
+            )
+            slot[feature] = scores.metric(metric)
+    return [
+        DriftWindow(
+            start=start,
+            stop=start + window,
+            statistics=stats,
+            summary=summarize_drift(list(stats.values()), validate="off"),
+        )
+        for start, stats in zip(starts, statistics, strict=True)
+    ]
+
+
+class _SlidingCounts:
+    """Bin counts of ``indices[start:stop]``, updated as the range moves forward."""
+
+    def __init__(self, indices: Sequence[int], n_bins: int) -> None:
+        self.indices = indices
+        self.counts = [0] * n_bins
+        self.start = 0
+        self.stop = 0
+
+    def move(self, start: int, stop: int) -> None:
+        counts = self.counts
+        indices = self.indices
+        for i in indices[self.start : min(self.stop, start)]:
+            counts[i] -= 1
+        for i in indices[max(self.stop, start) : stop]:
+            counts[i] += 1
+        self.start = start
+        self.stop = stop
+
+
+def _columns(matrix: Any) -> list[Sequence[float]]:
+    """Feature columns of a row-major matrix."""
+    if getattr(matrix, "ndim", None) == 2:
+        return list(matrix.T)
+    return list(zip(*matrix, strict=True))
+
+
+__all__ = ["DriftWindow", "windowed_drift"]
@@ -0,0 +1,45 @@
+"""Small estimators shared across the metric modules.
+
+* :func:`quantile` -- the linear-interpolation quantile the panel reports
+  (tail losses) and the bootstrap intervals and quantile sketch reuse.
+* :func:`sums_sharpe` -- sample Sharpe ratio from raw sums, for resampling
+  engines that aggregate ``sum`` / ``sum of squares`` per block instead of
+  rescanning the series.
+"""
+
+from __future__ import annotations
+
+import math
+from collections.abc import Sequence
+
+# Relative floor below which a raw-sum variance is cancellation round-off.
+_CANCELLATION = 1e-12
+
+
+def quantile(sorted_values: Sequence[float], p: float) -> float:
+    """Linear-interpolation quantile of pre-sorted values."""
+    index = p * (len(sorted_values) - 1)
+    lo = math.floor(index)
+    hi = math.ceil(index)
+    if lo == hi:
+        return sorted_values[lo]
+    return sorted_values[lo] + (sorted_values[hi] - sorted_values[lo]) * (index - lo)
+
+
+def sums_sharpe(count: int, total: float, total_sq: float) -> float | None:
+    """Sample Sharpe from ``count``, ``sum(x)`` and ``sum(x * x)``.
+
+    Returns None below two observations or for a (numerically) constant
+    series: the raw-sum variance ``(sum(x^2) - sum(x)^2 / n) / (n - 1)``
+    leaves round-off rather than zero when every value is equal.
+    """
+    if count < 2:
+        return None
+    mean = total / count
+    variance = (total_sq - total * mean) / (count - 1)
+    if variance <= _CANCELLATION * total_sq / count:
+        return None
+    return mean / math.sqrt(variance)
+
+
+__all__ = ["quantile", "sums_sharpe"]
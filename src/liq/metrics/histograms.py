@@ -0,0 +1,298 @@
+"""Distribution drift on binned histograms.
+
+A :class:`ReferenceHistogram` is built once per feature from reference data
+(quantile bin edges, so every reference bin holds about the same mass) and
+is small enough to cache and persist (:meth:`ReferenceHistogram.to_dict`).
+Live data is then binned against the cached edges with the active
+:mod:`~liq.metrics.backend` (one sort plus a bisection per edge in pure
+Python, ``searchsorted`` + ``bincount`` on NumPy) and compared without
+touching the reference data again:
+
+* ``psi`` -- population stability index, ``sum((q - p) * ln(q / p))`` with
+  empty-bin proportions floored at ``epsilon``;
+* ``ks``  -- Kolmogorov-Smirnov distance between the binned CDFs (a lower
+  bound on the unbinned KS statistic);
+* ``js``  -- Jensen-Shannon distance (square root of the base-2 divergence,
+  in ``[0, 1]``).
+
+:class:`FeatureReferences` holds the histograms of many features and scores
+a live batch per feature; :meth:`DriftScores.metric` picks one statistic per
+feature to feed :func:`~liq.metrics.drift.summarize_drift` or a
+:class:`~liq.metrics.drift.DriftMonitor`.
+"""
+
+from __future__ import annotations
+
+import math
+import statistics
+from collections.abc import Hashable, Iterable, Mapping, Sequence
+from dataclasses import dataclass
+from itertools import accumulate
+from typing import Any, Literal
+
+from liq.metrics.backend import get_backend
+from liq.metrics.validation import all_finite, as_sequence
+
+DriftMetric = Literal["psi", "ks", "js"]
+
+DRIFT_METRICS: tuple[DriftMetric, ...] = ("psi", "ks", "js")
+DEFAULT_EPSILON = 1e-4
+
+
+@dataclass(frozen=True)
+class DriftScores:
+    """Drift of one live distribution against its reference."""
+
+    psi: float
+    ks: float
+    js: float
+
+    def metric(self, name: DriftMetric) -> float:
+        if name not in DRIFT_METRICS:
+            raise ValueError(f"metric must be one of {DRIFT_METRICS}, got {name!r}")
+        return getattr(self, name)
+
+
+@dataclass(frozen=True)
+class ReferenceHistogram:
+    """Bin edges and reference counts for one feature.
+
+    Bin ``i`` holds values in ``(edges[i - 1], edges[i]]``; the first and last
+    bins are open-ended, so there are ``len(edges) + 1`` bins.
+    """
+
+    edges: tuple[float, ...]
+    counts: tuple[int, ...]
+
+    def __post_init__(self) -> None:
+        if len(self.counts) != len(self.edges) + 1:
+            raise ValueError(
+                f"expected {len(self.edges) + 1} counts for {len(self.edges)} edges, "
+                f"got {len(self.counts)}"
+            )
+        if any(b <= a for a, b in zip(self.edges, self.edges[1:], strict=False)):
+            raise ValueError("edges must be strictly increasing")
+        if not sum(self.counts):
+            raise ValueError("reference histogram must not be empty")
+
+    @classmethod
+    def from_values(
+        cls,
+        values: Iterable[float],
+        *,
+        bins: int = 10,
+        edges: Sequence[float] | None = None,
+    ) -> ReferenceHistogram:
+        """Histogram of reference ``values`` on ``edges`` or on ``bins`` quantile bins.
+
+        Quantile edges that coincide (heavily repeated values) are merged, so
+        the histogram may have fewer than ``bins`` bins.
+        """
+        reference = _finite(values, "reference values")
+        if edges is None:
+            if bins < 2:
+                raise ValueError(f"bins must be at least 2, got {bins}")
+            if len(reference) < 2:
+                raise ValueError("quantile edges need at least two reference values")
+            cuts = statistics.quantiles(reference, n=bins, method="inclusive")
+            edges = tuple(dict.fromkeys(cuts))
+            top = max(reference)
+            if edges[-1] == top:  # keep the top bin non-empty
+                below = [value for value in reference if value < top]
+                edges = edges[:-1] or ((max(below),) if below else edges)
+        return cls(edges=tuple(edges), counts=tuple(get_backend().bin_counts(reference, edges)))
+
+    @classmethod
+    def from_dict(cls, data: Mapping[str, Sequence[float]]) -> ReferenceHistogram:
+        return cls(edges=tuple(data["edges"]), counts=tuple(int(c) for c in data["counts"]))
+
+    def to_dict(self) -> dict[str, list[float] | list[int]]:
+        """JSON-ready form for caching the reference between runs."""
+        return {"edges": list(self.edges), "counts": list(self.counts)}
+
+    @property
+    def total(self) -> int:
+        return sum(self.counts)
+
+    def bin_counts(self, values: Iterable[float]) -> list[int]:
+        """Counts of live ``values`` in this histogram's bins."""
+        return get_backend().bin_counts(_finite(values, "live values"), self.edges)
+
+    def compare(self, values: Iterable[float], *, epsilon: float = DEFAULT_EPSILON) -> DriftScores:
+        """Drift of live ``values`` against this reference."""
+        return self.compare_counts(self.bin_counts(values), epsilon=epsilon)
+
+    def compare_counts(
+        self, counts: Sequence[int], *, epsilon: float = DEFAULT_EPSILON
+    ) -> DriftScores:
+        """Drift of pre-binned live ``counts`` (aligned with this histogram's bins)."""
+        if len(counts) != len(self.counts):
+            raise ValueError(f"expected {len(self.counts)} bin counts, got {len(counts)}")
+        return drift_scores(self.counts, counts, epsilon=epsilon)
+
+
+class FeatureReferences:
+    """Cached reference histograms keyed by feature."""
+
+    def __init__(self, histograms: Mapping[Hashable, ReferenceHistogram] | None = None) -> None:
+        self.histograms: dict[Hashable, ReferenceHistogram] = dict(histograms or {})
+
+    @classmethod
+    def from_columns(
+        cls, columns: Mapping[Hashable, Iterable[float]], *, bins: int = 10
+    ) -> FeatureReferences:
+        """Build one quantile-binned histogram per reference column."""
+        return cls(
+            {
+                feature: ReferenceHistogram.from_values(values, bins=bins)
+                for feature, values in columns.items()
+            }
+        )
+
+    @classmethod
+    def from_dict(cls, data: Mapping[str, Mapping[str, Any]]) -> FeatureReferences:
+        histograms: dict[Hashable, ReferenceHistogram] = {}
+        for name, h in data.items():
+            feature = _feature_key(h["feature"]) if "feature" in h else name
+            histograms[feature] = ReferenceHistogram.from_dict(h)
+        return cls(histograms)
+
+    def to_dict(self) -> dict[str, dict[str, Any]]:
+        """JSON-ready form that :meth:`from_dict` restores with the original keys.
+
+        ``str`` features are the JSON keys. Other features (``int``,
+        ``float``, ``bool``, ``None`` and tuples of these or ``str``) are keyed
+        by their ``repr`` and carry the key itself in a ``"feature"`` entry.
+
+        Raises:
+            TypeError: If a feature key has no JSON form.
+            ValueError: If two features serialize to the same JSON key.
+        """
+        data: dict[str, dict[str, Any]] = {}
+        for feature, h in self.histograms.items():
+            entry: dict[str, Any] = h.to_dict()
+            if isinstance(feature, str):
+                name = feature
+            else:
+                entry["feature"] = _json_key(feature)
+                name = repr(feature)
+            if name in data:
+                raise ValueError(f"features collide on serialized key {name!r}")
+            data[name] = entry
+        return data
+
+    def __len__(self) -> int:
+        return len(self.histograms)
+
+    def __getitem__(self, feature: Hashable) -> ReferenceHistogram:
+        return self.histograms[feature]
+
+    def compare(
+        self,
+        live: Mapping[Hashable, Iterable[float]],
+        *,
+        epsilon: float = DEFAULT_EPSILON,
+    ) -> dict[Hashable, DriftScores]:
+        """Score every live column against its cached reference."""
+        missing = [feature for feature in live if feature not in self.histograms]
+        if missing:
+            raise KeyError(f"no reference histogram for features {missing[:5]}")
+        return {
+            feature: self.histograms[feature].compare(values, epsilon=epsilon)
+            for feature, values in live.items()
+        }
+
+    def drift_statistics(
+        self,
+        live: Mapping[Hashable, Iterable[float]],
+        *,
+        metric: DriftMetric = "psi",
+        epsilon: float = DEFAULT_EPSILON,
+    ) -> dict[Hashable, float]:
+        """One drift statistic per feature, ready for ``DriftMonitor.extend``."""
+        scores = self.compare(live, epsilon=epsilon)
+        return {feature: score.metric(metric) for feature, score in scores.items()}
+
+
+def _json_key(feature: Hashable) -> Any:
+    if feature is None or isinstance(feature, (str, int, float)):
+        return feature
+    if isinstance(feature, tuple):
+        return [_json_key(part) for part in feature]
+    raise TypeError(f"feature key {feature!r} of type {type(feature).__name__} is not serializable")
+
+
+def _feature_key(value: Any) -> Hashable:
+    """Inverse of :func:`_json_key`: JSON arrays come back as tuples."""
+    if isinstance(value, list):
+        return tuple(_feature_key(part) for part in value)
+    return value
+
+
+def drift_scores(
+    reference: Sequence[int], live: Sequence[int], *, epsilon: float = DEFAULT_EPSILON
+) -> DriftScores:
+    """PSI, KS and JS between two aligned bin-count vectors."""
+    reference_total = sum(reference)
+    live_total = sum(live)
+    if not reference_total:
+        raise ValueError("reference histogram must not be empty")
+    if not live_total:
+        raise ValueError("live histogram must not be empty")
+    p = [c / reference_total for c in reference]
+    q = [c / live_total for c in live]
+    return DriftScores(
+        psi=population_stability_index(p, q, epsilon=epsilon),
+        ks=ks_distance(p, q),
+        js=js_distance(p, q),
+    )
+
+
+def population_stability_index(
+    reference: Sequence[float], live: Sequence[float], *, epsilon: float = DEFAULT_EPSILON
+) -> float:
+    """PSI between two aligned bin-proportion vectors."""
+    total = 0.0
+    for p, q in zip(reference, live, strict=True):
+        p = max(p, epsilon)
+        q = max(q, epsilon)
+        total += (q - p) * math.log(q / p)
+    return total
+
+
+def ks_distance(reference: Sequence[float], live: Sequence[float]) -> float:
+    """Largest gap between the cumulative bin proportions."""
+    return max(abs(a - b) for a, b in zip(accumulate(reference), accumulate(live), strict=True))
+
+
+def js_distance(reference: Sequence[float], live: Sequence[float]) -> float:
+    """Jensen-Shannon distance (base 2) between two bin-proportion vectors."""
+    divergence = 0.0
+    for p, q in zip(reference, live, strict=True):
+        m = 0.5 * (p + q)
+        if p > 0:
+            divergence += 0.5 * p * math.log2(p / m)
+        if q > 0:
+            divergence += 0.5 * q * math.log2(q / m)
+    return math.sqrt(max(divergence, 0.0))
+
+
+def _finite(values: Iterable[float], name: str) -> Sequence[float]:
+    sequence = as_sequence(values)
+    if not all_finite(sequence):
+        raise ValueError(f"{name} must be finite")
+    return sequence
+
+
+__all__ = [
+    "DEFAULT_EPSILON",
+    "DRIFT_METRICS",
+    "DriftMetric",
+    "DriftScores",
+    "FeatureReferences",
+    "ReferenceHistogram",
+    "drift_scores",
+    "js_distance",
+    "ks_distance",
+    "population_stability_index",
+]
@@ -0,0 +1,229 @@
+"""Incremental metrics panel for live / paper-trading books.
+
+:class:`IncrementalMetricsPanel` keeps the running state behind every
+:func:`~liq.metrics.panel.compute_metrics_panel` field, so a book can record
+each fill and each daily close and read an up-to-date
+:class:`~liq.metrics.panel.MetricsPanel` without rescanning history:
+
+* trade counts, wins, profit / loss pools and net / gross sums;
+* per-event P&L with a lazy max-heap for the largest event, rebuilt once
+  stale entries outnumber live events;
+* the first four central moments of daily returns (Pébay's one-pass
+  updates), plus benchmark co-moments for alpha / beta;
+* compounded equity, running peak and max drawdown;
+* a :class:`~liq.metrics.sketch.QuantileSketch` for the tail losses. It is
+  exact until it first compacts, so panels match the batch computation for
+  histories up to ``sketch_k`` days.
+
+Updates are O(1) amortized (O(log events) when events are tracked).
+"""
+
+from __future__ import annotations
+
+import heapq
+import math
+from collections.abc import Iterable, Mapping
+
+from liq.metrics.panel import InferenceInputs, MetricsPanel, _contribution
+from liq.metrics.sketch import QuantileSketch
+
+
+class IncrementalMetricsPanel:
+    """Running metrics panel fed one trade / one day at a time."""
+
+    def __init__(self, *, sketch_k: int = 2048) -> None:
+        # Trades
+        self.n_trades = 0
+        self._wins = 0
+        self._gross_profit = 0.0
+        self._gross_loss = 0.0
+        self._net_sum = 0.0
+        self._gross_sum = 0.0
+        self._track_events: bool | None = None
+        self._event_pnl: dict[str, float] = {}
+        self._event_heap: list[tuple[float, str]] = []
+        # Days
+        self.n_days = 0
+        self._mean = 0.0
+        self._m2 = 0.0
+        self._m3 = 0.0
+        self._m4 = 0.0
+        self._daily_sum = 0.0
+        self._daily_max = -math.inf
+        self._equity = 1.0
+        self._peak = 1.0
+        self._max_drawdown = 0.0
+        self._tails = QuantileSketch(sketch_k)
+        # Benchmark
+        self._track_benchmark: bool | None = None
+        self._bench_mean = 0.0
+        self._bench_m2 = 0.0
+        self._co_moment = 0.0
+
+    def add_trade(self, net: float, gross: float, *, event: str | None = None) -> None:
+        """Record one closed trade's net and gross fractional return."""
+        self._track_events = _consistent(self._track_events, event is not None, "trade event")
+        self.n_trades += 1
+        self._net_sum += net
+        self._gross_sum += gross
+        if net > 0:
+            self._wins += 1
+            self._gross_profit += net
+        elif net < 0:
+            self._gross_loss -= net
+        if event is not None:
+            pnl = self._event_pnl.get(event, 0.0) + net
+            self._event_pnl[event] = pnl
+            heap = self._event_heap
+            heapq.heappush(heap, (-pnl, event))
+            if len(heap) > 2 * len(self._event_pnl) + 16:
+                # Mostly stale entries: rebuild from the live P&L so state
+                # stays O(events) rather than O(trades).
+                heap[:] = [(-value, key) for key, value in self._event_pnl.items()]
+                heapq.heapify(heap)
+
+    def add_trades(
+        self,
+        net: Iterable[float],
+        gross: Iterable[float],
+        events: Iterable[str] | None = None,
+    ) -> None:
+        """Record several trades (aligned net / gross / optional event columns)."""
+        if events is None:
+            for n, g in zip(net, gross, strict=True):
+                self.add_trade(n, g)
+        else:
+            for n, g, e in zip(net, gross, events, strict=True):
+                self.add_trade(n, g, event=e)
+
+    def add_day(self, daily_return: float, *, benchmark: float | None = None) -> None:
+        """Record one daily portfolio return (and the matched benchmark return)."""
+        self._track_benchmark = _consistent(
+            self._track_benchmark, benchmark is not None, "benchmark daily return"
+        )
+        n1 = self.n_days
+        n = n1 + 1
+        self.n_days = n
+        delta = daily_return - self._mean
+        delta_n = delta / n
+        delta_n2 = delta_n * delta_n
+        term1 = delta * delta_n * n1
+        self._m4 += (
+            term1 * delta_n2 * (n * n - 3 * n + 3)
+            + 6.0 * delta_n2 * self._m2
+            - 4.0 * delta_n * self._m3
+        )
+        self._m3 += term1 * delta_n * (n - 2) - 3.0 * delta_n * self._m2
+        self._m2 += term1
+        self._mean += delta_n
+        if benchmark is not None:
+            bench_delta = benchmark - self._bench_mean
+            self._bench_mean += bench_delta / n
+            self._bench_m2 += bench_delta * (benchmark - self._bench_mean)
+            self._co_moment += delta * (benchmark - self._bench_mean)
+
+        self._daily_sum += daily_return
+        if daily_return > self._daily_max:
+            self._daily_max = daily_return
+        self._equity *= 1.0 + daily_return
+        if self._equity > self._peak:
+            self._peak = self._equity
+        elif self._peak > 0:
+            self._max_drawdown = max(self._max_drawdown, (self._peak - self._equity) / self._peak)
+        self._tails.update(daily_return)
+
+    def add_days(
+        self, daily_returns: Iterable[float], benchmark: Iterable[float] | None = None
+    ) -> None:
+        """Record several days (aligned with ``benchmark`` when given)."""
+        if benchmark is None:
+            for r in daily_returns:
+                self.add_day(r)
+        else:
+            for r, b in zip(daily_returns, benchmark, strict=True):
+                self.add_day(r, benchmark=b)
+
+    def panel(
+        self,
+        *,
+        inference: InferenceInputs | None = None,
+        cost_stress: Mapping[str, float] | None = None,
+        portfolio_incremental_sharpe: float | None = None,
+    ) -> MetricsPanel:
+        """Current panel; same conventions as ``compute_metrics_panel``."""
+        if self.n_trades == 0:
+            raise ValueError("trade returns must not be empty")
+        if self.n_days == 0:
+            raise ValueError("daily returns must not be empty")
+        n_days = self.n_days
+        m2 = self._m2 / n_days
+        m3 = self._m3 / n_days
+        m4 = self._m4 / n_days
+
+        sharpe: float | None = None
+        if n_days >= 2:
+            sample_var = self._m2 / (n_days - 1)
+            if sample_var > 0:
+                sharpe = self._mean / math.sqrt(sample_var)
+
+        alpha: float | None = None
+        beta: float | None = None
+        if self._track_benchmark and n_days >= 2 and self._bench_m2 / (n_days - 1) > 0:
+            beta = self._co_moment / self._bench_m2
+            alpha = self._mean - beta * self._bench_mean
+
+        mean_trade = self._net_sum / self.n_trades
+        inf = inference or InferenceInputs()
+        return MetricsPanel(
+            n_trades=self.n_trades,
+            n_days=n_days,
+            gross_return=self._gross_sum,
+            net_return=self._net_sum,
+            net_bps_per_trade=mean_trade * 10_000,
+            profit_factor=(
+                self._gross_profit / self._gross_loss if self._gross_loss > 0 else math.inf
+            ),
+            win_rate=self._wins / self.n_trades,
+            mean_trade_return=mean_trade,
+            skew=m3 / m2**1.5 if m2 > 0 else 0.0,
+            excess_kurtosis=m4 / m2**2 - 3.0 if m2 > 0 else 0.0,
+            max_drawdown=self._max_drawdown,
+            tail_loss_95=self._tails.quantile(0.05),
+            tail_loss_99=self._tails.quantile(0.01),
+            max_single_day_contribution=_contribution(self._daily_max, self._daily_sum),
+            max_single_event_contribution=(
+                _contribution(self._largest_event_pnl(), self._net_sum)
+                if self._track_events
+                else None
+            ),
+            sharpe=sharpe,
+            mean_trade_return_ci_low=inf.mean_trade_return_ci_low,
+            mean_trade_return_ci_high=inf.mean_trade_return_ci_high,
+            day_clustered_tstat=inf.day_clustered_tstat,
+            day_clustered_pvalue=inf.day_clustered_pvalue,
+            event_clustered_tstat=inf.event_clustered_tstat,
+            event_clustered_pvalue=inf.event_clustered_pvalue,
+            deflated_sharpe=inf.deflated_sharpe,
+            pbo=inf.pbo,
+            null_percentile=inf.null_percentile,
+            benchmark_alpha_per_period=alpha,
+            benchmark_beta=beta,
+            portfolio_incremental_sharpe=portfolio_incremental_sharpe,
+            cost_stress=dict(cost_stress) if cost_stress is not None else None,
+        )
+
+    def _largest_event_pnl(self) -> float:
+        heap = self._event_heap
+        # Entries go stale when an event's P&L changes; drop them lazily.
+        while -heap[0][0] != self._event_pnl[heap[0][1]]:
+            heapq.heappop(heap)
+        return -heap[0][0]
+
+
+def _consistent(tracked: bool | None, present: bool, name: str) -> bool:
+    if tracked is not None and tracked != present:
+        raise ValueError(f"{name} must be given for every update or for none")
+    return present
+
+
+__all__ = ["IncrementalMetricsPanel"]
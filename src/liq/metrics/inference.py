@@ -0,0 +1,362 @@
+"""In-package inference statistics for :class:`~liq.metrics.panel.InferenceInputs`.
+
+Fills the caller-supplied inference fields of the metrics panel without
+external dependencies:
+
+* ``mean_trade_return_ci_low/high`` — percentile bootstrap of the mean trade
+  return using the seeded, chunked engine in :mod:`liq.metrics.bootstrap`
+  (stationary or circular blocks preserve serial dependence between trades).
+* ``day/event_clustered_tstat/pvalue`` — t-test of the mean trade return with
+  a cluster-robust (CR1) standard error; p-values are two-sided Student-t
+  with ``G - 1`` degrees of freedom for ``G`` clusters.
+* ``null_percentile`` — percentile of the observed panel Sharpe within a
+  sign-flip or label-permutation null, drawn in seeded batches (optionally on
+  a process pool) with early stopping once the percentile is pinned down.
+  Each batch is a ``(batch x units)`` draw matrix reduced to daily returns
+  and Sharpe ratios by the :mod:`liq.metrics.backend` kernels the panel uses.
+"""
+
+from __future__ import annotations
+
+import math
+import random
+from collections.abc import Hashable, Sequence
+from dataclasses import dataclass, replace
+from statistics import NormalDist
+from typing import Literal
+
+from liq.metrics.backend import Backend, get_backend
+from liq.metrics.bootstrap import ResampleMethod, bootstrap_column_sums, percentile_interval
+from liq.metrics.panel import InferenceInputs
+from liq.metrics.parallel import task_map
+
+NullMethod = Literal["sign_flip", "permutation"]
+
+
+@dataclass(frozen=True)
+class NullPercentile:
+    """Observed panel Sharpe located within a simulated null distribution."""
+
+    observed_sharpe: float | None
+    percentile: float | None
+    half_width: float | None
+    n_permutations: int
+    stopped_early: bool
+
+
+def clustered_tstat(
+    values: Sequence[float], clusters: Sequence[Hashable]
+) -> tuple[float | None, float | None]:
+    """Cluster-robust t-statistic and two-sided p-value for ``mean(values) == 0``.
+
+    Uses the CR1 variance ``G / (G - 1) * sum_g (sum_{i in g} e_i)^2 / n^2``
+    with residuals ``e_i = values[i] - mean``. With one observation per
+    cluster this reduces to the classical one-sample t-test. Returns
+    ``(None, None)`` with fewer than two clusters or zero variance.
+    """
+    if len(values) != len(clusters):
+        raise ValueError(
+            f"clusters must align with values, got {len(clusters)} for {len(values)} values"
+        )
+    n = len(values)
+    if n == 0:
+        return None, None
+    mean = math.fsum(values) / n
+    cluster_residuals: dict[Hashable, float] = {}
+    for cluster, value in zip(clusters, values, strict=True):
+        cluster_residuals[cluster] = cluster_residuals.get(cluster, 0.0) + (value - mean)
+    n_clusters = len(cluster_residuals)
+    if n_clusters < 2:
+        return None, None
+    variance = (
+        n_clusters
+        / (n_clusters - 1)
+        * math.fsum(total * total for total in cluster_residuals.values())
+        / n**2
+    )
+    if variance <= 0:
+        return None, None
+    tstat = mean / math.sqrt(variance)
+    return tstat, student_t_two_sided_pvalue(tstat, n_clusters - 1)
+
+
+def student_t_two_sided_pvalue(tstat: float, df: float) -> float:
+    """Two-sided p-value ``P(|T| >= |tstat|)`` for Student's t with ``df`` degrees."""
+    if df <= 0:
+        raise ValueError(f"degrees of freedom must be positive, got {df}")
+    return _regularized_incomplete_beta(df / 2.0, 0.5, df / (df + tstat * tstat))
+
+
+def compute_inference_inputs(
+    trade_returns: Sequence[float],
+    *,
+    trade_days: Sequence[Hashable] | None = None,
+    trade_events: Sequence[Hashable] | None = None,
+    n_resamples: int = 10_000,
+    confidence: float = 0.95,
+    method: ResampleMethod = "stationary",
+    block_length: int | None = None,
+    seed: int = 0,
+    chunk_size: int = 1_000,
+    workers: int | None = None,
+    base: InferenceInputs | None = None,
+) -> InferenceInputs:
+    """Compute the bootstrap CI and clustered t-stats for one run's trades.
+
+    Args:
+        trade_returns: Fractional net return per trade, in time order.
+        trade_days: Optional day id per trade for day-clustered inference.
+        trade_events: Optional event id per trade for event-clustered inference.
+        n_resamples: Bootstrap replicates for the mean-return interval.
+        confidence: Two-sided interval coverage.
+        method: ``iid``, ``circular`` or ``stationary`` resampling.
+        block_length: Block length; defaults to ``round(n ** (1/3))``.
+        seed: Master seed for reproducible intervals.
+        chunk_size: Resamples per chunk (bounds memory).
+        workers: Process-pool size for large ``n_resamples``.
+        base: Existing inputs (e.g. DSR / PBO) to carry through unchanged.
+    """
+    returns = tuple(float(value) for value in trade_returns)
+    if not returns:
+        raise ValueError("trade returns must not be empty")
+    if block_length is None:
+        block_length = max(1, round(len(returns) ** (1.0 / 3.0)))
+
+    sums = bootstrap_column_sums(
+        (returns,),
+        n_resamples=n_resamples,
+        method=method,
+        block_length=block_length,
+        seed=seed,
+        chunk_size=chunk_size,
+        workers=workers,
+    )
+    interval = percentile_interval(
+        math.fsum(returns) / len(returns),
+        [row[0] / len(returns) for row in sums],
+        confidence=confidence,
+    )
+    day_tstat, day_pvalue = (
+        clustered_tstat(returns, trade_days) if trade_days is not None else (None, None)
+    )
+    event_tstat, event_pvalue = (
+        clustered_tstat(returns, trade_events) if trade_events is not None else (None, None)
+    )
+    return replace(
+        base or InferenceInputs(),
+        mean_trade_return_ci_low=interval.low,
+        mean_trade_return_ci_high=interval.high,
+        day_clustered_tstat=day_tstat,
+        day_clustered_pvalue=day_pvalue,
+        event_clustered_tstat=event_tstat,
+        event_clustered_pvalue=event_pvalue,
+    )
+
+
+def null_percentile(
+    trade_returns: Sequence[float],
+    *,
+    trade_days: Sequence[Hashable],
+    trade_events: Sequence[Hashable] | None = None,
+    n_days: int | None = None,
+    method: NullMethod = "sign_flip",
+    n_permutations: int = 10_000,
+    batch_size: int = 500,
+    seed: int = 0,
+    workers: int | None = None,
+    tolerance: float | None = None,
+    confidence: float = 0.95,
+) -> NullPercentile:
+    """Percentile of the observed daily Sharpe under a resampled null.
+
+    Trades collapse into units — one per event when ``trade_events`` is given,
+    otherwise one per trade — each carrying its P&L and the day of its first
+    trade. ``sign_flip`` multiplies each unit by a random sign (null of zero
+    mean, symmetric P&L); ``permutation`` shuffles unit P&L across the unit day
+    slots (null of no timing skill). Each draw is re-aggregated to daily
+    returns and scored with the panel Sharpe (the backend ``sharpe_ratios``
+    kernel), one batch matrix at a time.
+
+    Args:
+        trade_returns: Fractional net return per trade.
+        trade_days: Day id per trade.
+        trade_events: Optional event id per trade; events flip/move as a whole.
+        n_days: Total days in the panel (no-trade days count as zero returns);
+            defaults to the number of distinct trade days.
+        method: ``sign_flip`` or ``permutation``.
+        n_permutations: Maximum null draws.
+        batch_size: Draws per seeded batch (the unit of pool work); bounds
+            the ``batch_size x units`` draw matrix.
+        seed: Master seed; results do not depend on ``workers``.
+        workers: Process-pool size; ``None`` runs in-process.
+        tolerance: Stop once the half-width of the percentile's Wilson score
+            interval is at or below this value (checked after each round of
+            batches). Unlike the Wald band, it stays positive when every draw
+            falls on one side of the observed Sharpe.
+        confidence: Coverage of the early-stopping band.
+
+    The percentile counts ties as half; null draws with undefined Sharpe are
+    dropped.
+    """
+    if len(trade_days) != len(trade_returns):
+        raise ValueError(
+            f"trade_days must align with trade returns, got {len(trade_days)} "
+            f"for {len(trade_returns)} trades"
+        )
+    if trade_events is not None and len(trade_events) != len(trade_returns):
+        raise ValueError(
+            f"trade_events must align with trade returns, got {len(trade_events)} "
+            f"for {len(trade_returns)} trades"
+        )
+    if not trade_returns:
+        raise ValueError("trade returns must not be empty")
+    if method not in ("sign_flip", "permutation"):
+        raise ValueError(f"unknown null method: {method}")
+    if n_permutations < 1 or batch_size < 1:
+        raise ValueError("n_permutations and batch_size must be positive")
+
+    job = _null_units(trade_returns, trade_days, trade_events, n_days, method)
+    observed = _daily_sharpes(get_backend(), job, [job.pnl])[0]
+    if observed is None:
+        return NullPercentile(None, None, None, 0, stopped_early=False)
+
+    master = random.Random(seed)
+    tasks = [
+        (master.getrandbits(64), min(batch_size, n_permutations - start))
+        for start in range(0, n_permutations, batch_size)
+    ]
+    z = NormalDist().inv_cdf(0.5 + confidence / 2.0)
+    wave = max(1, workers or 1)
+    below = 0.0
+    drawn = 0
+    stopped_early = False
+    half_width: float | None = None
+    with task_map(_null_batch, job, workers) as run:
+        for start in range(0, len(tasks), wave):
+            for batch_sharpes in run(tasks[start : start + wave]):
+                for value in batch_sharpes:
+                    if value < observed:
+                        below += 1.0
+                    elif value == observed:
+                        below += 0.5
+                drawn += len(batch_sharpes)
+            if drawn:
+                half_width = _wilson_half_width(below / drawn, drawn, z)
+                if tolerance is not None and half_width <= tolerance and start + wave < len(tasks):
+                    stopped_early = True
+                    break
+    return NullPercentile(
+        observed_sharpe=observed,
+        percentile=below / drawn if drawn else None,
+        half_width=half_width,
+        n_permutations=drawn,
+        stopped_early=stopped_early,
+    )
+
+
+def _wilson_half_width(fraction: float, n: int, z: float) -> float:
+    """Half-width of the Wilson score interval for a proportion over ``n`` draws."""
+    z2 = z * z
+    spread = math.sqrt(fraction * (1.0 - fraction) / n + z2 / (4.0 * n * n))
+    return z * spread / (1.0 + z2 / n)
+
+
+@dataclass(frozen=True)
+class _NullJob:
+    pnl: tuple[float, ...]
+    unit_days: tuple[int, ...]
+    n_days: int
+    method: NullMethod
+
+
+def _null_units(
+    trade_returns: Sequence[float],
+    trade_days: Sequence[Hashable],
+    trade_events: Sequence[Hashable] | None,
+    n_days: int | None,
+    method: NullMethod,
+) -> _NullJob:
+    day_codes: dict[Hashable, int] = {}
+    unit_index: dict[Hashable, int] = {}
+    pnl: list[float] = []
+    unit_days: list[int] = []
+    keys = trade_events if trade_events is not None else range(len(trade_returns))
+    for key, day, value in zip(keys, trade_days, trade_returns, strict=True):
+        day_code = day_codes.setdefault(day, len(day_codes))
+        unit = unit_index.get(key)
+        if unit is None:
+            unit_index[key] = len(pnl)
+            pnl.append(float(value))
+            unit_days.append(day_code)
+        else:
+            pnl[unit] += float(value)
+    total_days = len(day_codes) if n_days is None else n_days
+    if total_days < len(day_codes):
+        raise ValueError(f"n_days ({n_days}) is smaller than the distinct trade days")
+    return _NullJob(tuple(pnl), tuple(unit_days), total_days, method)
+
+
+def _daily_sharpes(
+    backend: Backend, job: _NullJob, draws: Sequence[Sequence[float]]
+) -> list[float | None]:
+    """Panel Sharpe of the daily series built from each row of unit P&L."""
+    return backend.sharpe_ratios(backend.row_segment_sums(draws, job.unit_days, job.n_days))
+
+
+def _null_batch(job: _NullJob, task: tuple[int, int]) -> list[float]:
+    batch_seed, count = task
+    rng = random.Random(batch_seed)
+    backend = get_backend()
+    n_units = len(job.pnl)
+    # Random bytes are drawn here, not by the backend, so every backend sees
+    # the same null draws for a given seed.
+    if job.method == "sign_flip":
+        draws = backend.sign_flip_rows(job.pnl, rng.randbytes(count * n_units))
+    else:
+        draws = backend.permuted_rows(job.pnl, rng.randbytes(8 * count * n_units))
+    return [sharpe for sharpe in _daily_sharpes(backend, job, draws) if sharpe is not None]
+
+
+def _regularized_incomplete_beta(a: float, b: float, x: float) -> float:
+    """``I_x(a, b)`` via the Lentz continued fraction (Numerical Recipes 6.4)."""
+    if x <= 0.0:
+        return 0.0
+    if x >= 1.0:
+        return 1.0
+    log_front = (
+        math.lgamma(a + b) - math.lgamma(a) - math.lgamma(b) + a * math.log(x) + b * math.log1p(-x)
+    )
+    if x < (a + 1.0) / (a + b + 2.0):
+        return math.exp(log_front) * _beta_continued_fraction(a, b, x) / a
+    return 1.0 - math.exp(log_front) * _beta_continued_fraction(b, a, 1.0 - x) / b
+
+
+def _beta_continued_fraction(a: float, b: float, x: float) -> float:
+    tiny = 1e-300
+    c = 1.0
+    d = 1.0 - (a + b) * x / (a + 1.0)
+    d = 1.0 / (d if abs(d) > tiny else tiny)
+    h = d
+    for m in range(1, 500):
+        for numerator in (
+            m * (b - m) * x / ((a + 2 * m - 1.0) * (a + 2 * m)),
+            -(a + m) * (a + b + m) * x / ((a + 2 * m) * (a + 2 * m + 1.0)),
+        ):
+            d = 1.0 + numerator * d
+            d = 1.0 / (d if abs(d) > tiny else tiny)
+            c = 1.0 + numerator / c
+            c = c if abs(c) > tiny else tiny
+            h *= d * c
+        if abs(d * c - 1.0) < 1e-15:
+            break
+    return h
+
+
+__all__ = [
+    "NullMethod",
+    "NullPercentile",
+    "clustered_tstat",
+    "compute_inference_inputs",
+    "null_percentile",
+    "student_t_two_sided_pvalue",
+]
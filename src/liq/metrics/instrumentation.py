@@ -0,0 +1,184 @@
+"""Opt-in per-stage timing of metric hot paths.
+
+Hot paths (``compute_metrics_panel``, ``PerformanceAnalyzer.analyze``,
+``compute_six_curves``, ``compute_curve_f``) mark their stages with
+:func:`stage`. Nothing is recorded unless a caller opts in:
+
+.. code-block:: python
+
+    from liq.metrics.instrumentation import instrument
+
+    with instrument(exporter=print_spans) as recorder:
+        panel = compute_metrics_panel(...)
+    recorder.totals()  # {"metrics_panel.moments": 0.012, ...}
+
+The active recorder lives in a :class:`~contextvars.ContextVar`, so
+recording is scoped to the current thread / asyncio task. When no recorder
+is active, :func:`stage` returns a shared no-op context manager after one
+``ContextVar.get``. Stages are coarse (one per pass, never per element), so
+this is free in practice.
+
+Spans follow the OpenTelemetry shape (name, start/end nanoseconds, parent,
+attributes such as ``count``). An exporter is any callable that takes the
+finished spans; ``instrument`` calls it once on exit, which is where an
+OpenTelemetry bridge or a local stub plugs in.
+"""
+
+from __future__ import annotations
+
+import functools
+import time
+from collections.abc import Callable, Iterator, Mapping, Sequence
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from types import TracebackType
+from typing import ParamSpec, TypeVar
+
+P = ParamSpec("P")
+R = TypeVar("R")
+
+
+@dataclass(frozen=True)
+class Span:
+    """One finished stage."""
+
+    name: str
+    start_ns: int
+    end_ns: int
+    parent: str | None = None
+    attributes: Mapping[str, int | float | str] = field(default_factory=dict)
+
+    @property
+    def seconds(self) -> float:
+        return (self.end_ns - self.start_ns) / 1e9
+
+
+SpanExporter = Callable[[Sequence[Span]], None]
+
+
+class Recorder:
+    """Collects spans for the duration of an :func:`instrument` block."""
+
+    def __init__(self) -> None:
+        self.spans: list[Span] = []
+        self._stack: list[str] = []
+
+    def totals(self) -> dict[str, float]:
+        """Total seconds per stage name (stages may run more than once)."""
+        totals: dict[str, float] = {}
+        for span in self.spans:
+            totals[span.name] = totals.get(span.name, 0.0) + span.seconds
+        return totals
+
+
+_RECORDER: ContextVar[Recorder | None] = ContextVar("liq_metrics_recorder", default=None)
+
+
+class _NoopStage:
+    __slots__ = ()
+
+    def __enter__(self) -> None:
+        return None
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        return None
+
+
+_NOOP = _NoopStage()
+
+
+class _ActiveStage:
+    __slots__ = ("_recorder", "_name", "_attributes", "_start")
+
+    def __init__(
+        self, recorder: Recorder, name: str, attributes: dict[str, int | float | str]
+    ) -> None:
+        self._recorder = recorder
+        self._name = name
+        self._attributes = attributes
+        self._start = 0
+
+    def __enter__(self) -> None:
+        self._recorder._stack.append(self._name)
+        self._start = time.perf_counter_ns()
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        end = time.perf_counter_ns()
+        stack = self._recorder._stack
+        stack.pop()
+        if exc_type is not None:
+            self._attributes["error"] = exc_type.__name__
+        self._recorder.spans.append(
+            Span(
+                name=self._name,
+                start_ns=self._start,
+                end_ns=end,
+                parent=stack[-1] if stack else None,
+                attributes=self._attributes,
+            )
+        )
+
+
+def stage(name: str, **attributes: int | float | str) -> _NoopStage | _ActiveStage:
+    """Context manager timing one stage; a shared no-op unless instrumentation is on."""
+    recorder = _RECORDER.get()
+    if recorder is None:
+        return _NOOP
+    return _ActiveStage(recorder, name, attributes)
+
+
+def traced(name: str) -> Callable[[Callable[P, R]], Callable[P, R]]:
+    """Decorator recording a whole call as stage ``name`` when instrumentation is on."""
+
+    def decorate(fn: Callable[P, R]) -> Callable[P, R]:
+        @functools.wraps(fn)
+        def wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
+            recorder = _RECORDER.get()
+            if recorder is None:
+                return fn(*args, **kwargs)
+            with _ActiveStage(recorder, name, {}):
+                return fn(*args, **kwargs)
+
+        return wrapper
+
+    return decorate
+
+
+def is_enabled() -> bool:
+    """True inside an :func:`instrument` block."""
+    return _RECORDER.get() is not None
+
+
+@contextmanager
+def instrument(exporter: SpanExporter | None = None) -> Iterator[Recorder]:
+    """Record stage spans for the enclosed calls; hand them to ``exporter`` on exit."""
+    recorder = Recorder()
+    token = _RECORDER.set(recorder)
+    try:
+        yield recorder
+    finally:
+        _RECORDER.reset(token)
+        if exporter is not None:
+            exporter(list(recorder.spans))
+
+
+__all__ = [
+    "Recorder",
+    "Span",
+    "SpanExporter",
+    "instrument",
+    "is_enabled",
+    "stage",
+    "traced",
+]
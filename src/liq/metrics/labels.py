@@ -3,9 +3,13 @@
 from __future__ import annotations
 
 from collections.abc import Iterable
+from itertools import repeat
+from operator import gt, lt
 
+from liq.metrics.validation import ValidationMode, as_sequence, check_types
 
-def summarize_labels(labels: Iterable[int]) -> dict[str, int]:
+
+def summarize_labels(labels: Iterable[int], *, validate: ValidationMode = "full") -> dict[str, int]:
     """Count triple-barrier or meta-label outcomes.
 
     Categorizes labels into positive (>0), negative (<0), and neutral (0).
@@ -13,6 +17,8 @@ def summarize_labels(labels: Iterable[int]) -> dict[str, int]:
     Args:
         labels: An iterable of integer labels representing trade outcomes.
             Typically 1 for profit, -1 for loss, 0 for neutral/timeout.
+        validate: ``"full"``, ``"sample"`` or ``"off"``; see
+            :mod:`liq.metrics.validation`.
 
     Returns:
         A dictionary with counts for 'positive', 'negative', and 'neutral'.
@@ -26,17 +32,19 @@ def summarize_labels(labels: Iterable[int]) -> dict[str, int]:
         >>> summarize_labels([])
         {'positive': 0, 'negative': 0, 'neutral': 0}
     """
-    counts: dict[str, int] = {"positive": 0, "negative": 0, "neutral": 0}
-
-    for i, lbl in enumerate(labels):
-        if not isinstance(lbl, int) or isinstance(lbl, bool):
-            raise TypeError(f"All labels must be integers, got {type(lbl).__name__} at index {i}")
-
-        if lbl > 0:
-            counts["positive"] += 1
-        elif lbl < 0:
-            counts["negative"] += 1
-        else:
-            counts["neutral"] += 1
-
-    return counts
+    values = as_sequence(labels)
+    check_types(
+        values,
+        int,
+        rejected=bool,
+        message="All labels must be integers, got {type} at index {index}",
+        mode=validate,
+    )
+
+    positive = int(sum(map(gt, values, repeat(0))))
+    negative = int(sum(map(lt, values, repeat(0))))
+    return {
+        "positive": positive,
+        "negative": negative,
+        "neutral": len(values) - positive - negative,
+    }
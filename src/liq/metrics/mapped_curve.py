@@ -0,0 +1,179 @@
+"""Memory-mapped (timestamp, value) equity curves.
+
+Multi-GB curves stored as binary records are mapped read-only with
+:mod:`mmap` and exposed as strided ``memoryview`` columns — no copy, no
+per-bar Python objects until a window is walked. Two layouts are supported:
+
+* ``records`` — raw little-endian records of ``int64`` timestamp followed by
+  ``float64`` value (16 bytes per bar), optionally after a fixed header.
+* ``.npy`` — a 1-D structured array with two 8-byte fields, an ``int64`` or
+  ``datetime64`` timestamp and a ``float64`` value (e.g. NumPy dtype
+  ``[("ts", "<M8[ns]"), ("value", "<f8")]``).
+
+Pair with :meth:`liq.metrics.performance.PerformanceAnalyzer.analyze_mapped`
+to compute aggregate metrics in fixed-size windows with bounded RSS.
+"""
+
+from __future__ import annotations
+
+import ast
+import mmap
+import sys
+from collections.abc import Iterator
+from datetime import UTC, datetime, timedelta
+from decimal import Decimal
+from pathlib import Path
+from types import TracebackType
+from typing import Literal
+
+TimestampUnit = Literal["s", "ms", "us", "ns"]
+
+_RECORD_SIZE = 16
+_NPY_MAGIC = b"\x93NUMPY"
+_EPOCH = datetime(1970, 1, 1, tzinfo=UTC)
+_MICROS_PER_UNIT = {"s": 1_000_000, "ms": 1_000, "us": 1, "ns": None}
+_DATETIME_UNITS: dict[str, TimestampUnit] = {
+    "<M8[s]": "s",
+    "<M8[ms]": "ms",
+    "<M8[us]": "us",
+    "<M8[ns]": "ns",
+}
+_TIMESTAMP_DESCRS = {"<i8", *_DATETIME_UNITS}
+
+
+class MappedEquityCurve:
+    """Read-only timestamp / value columns over a memory-mapped file.
+
+    ``timestamps`` (int64) and ``values`` (float64) are strided views into the
+    mapping; slicing them is free and iterating them yields Python numbers
+    one bar at a time. Use as a context manager (or call :meth:`close`) to
+    release the mapping.
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        *,
+        offset: int = 0,
+        unit: TimestampUnit = "ns",
+    ) -> None:
+        if sys.byteorder != "little":  # pragma: no cover - little-endian CI only
+            raise OSError("memory-mapped equity curves require a little-endian platform")
+        self.path = Path(path)
+        self.unit = unit
+        with self.path.open("rb") as fh:
+            size = fh.seek(0, 2)
+            if size == 0 or size == offset:
+                raise ValueError(f"equity curve file {self.path} holds no records")
+            self._mmap = mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ)
+        body = size - offset
+        if body % _RECORD_SIZE:
+            self._mmap.close()
+            raise ValueError(
+                f"{self.path}: {body} bytes after the header is not a multiple of "
+                f"{_RECORD_SIZE}-byte (int64, float64) records"
+            )
+        self._raw = memoryview(self._mmap)[offset:]
+        self.timestamps = self._raw.cast("q")[0::2]
+        self.values = self._raw.cast("d")[1::2]
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+    def __enter__(self) -> MappedEquityCurve:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Release the column views and unmap the file."""
+        for view in (self.timestamps, self.values, self._raw):
+            view.release()
+        self._mmap.close()
+
+    def iter_value_chunks(self, chunk_size: int) -> Iterator[memoryview]:
+        """Yield consecutive ``values`` windows of at most ``chunk_size`` bars."""
+        if chunk_size < 1:
+            raise ValueError(f"chunk_size must be positive, got {chunk_size}")
+        for start in range(0, len(self.values), chunk_size):
+            yield self.values[start : start + chunk_size]
+
+    def timestamp_at(self, index: int) -> datetime:
+        """Timestamp of bar ``index`` as an aware UTC datetime."""
+        return _to_datetime(self.timestamps[index], self.unit)
+
+    def to_equity_curve(self) -> list[tuple[datetime, Decimal]]:
+        """Materialize the classic ``(datetime, Decimal)`` list (small curves only)."""
+        return [
+            (_to_datetime(ts, self.unit), Decimal(repr(value)))
+            for ts, value in zip(self.timestamps, self.values, strict=True)
+        ]
+
+
+def open_equity_curve(
+    path: Path | str,
+    *,
+    header_bytes: int = 0,
+    unit: TimestampUnit = "ns",
+) -> MappedEquityCurve:
+    """Map an equity curve file; ``.npy`` headers are parsed automatically.
+
+    Args:
+        path: ``.npy`` file or raw ``(int64, float64)`` record file.
+        header_bytes: Bytes to skip before the first raw record.
+        unit: Epoch unit of raw / ``int64`` timestamps (``datetime64`` fields
+            carry their own unit).
+    """
+    path = Path(path)
+    if path.suffix == ".npy":
+        header_bytes, unit = _npy_layout(path, unit)
+    if unit not in _MICROS_PER_UNIT:
+        raise ValueError(f"unsupported timestamp unit: {unit}")
+    return MappedEquityCurve(path, offset=header_bytes, unit=unit)
+
+
+def _npy_layout(path: Path, unit: TimestampUnit) -> tuple[int, TimestampUnit]:
+    """Data offset and timestamp unit of a supported structured ``.npy`` file."""
+    with path.open("rb") as fh:
+        prefix = fh.read(12)
+        if not prefix.startswith(_NPY_MAGIC):
+            raise ValueError(f"{path} is not an .npy file")
+        major = prefix[6]
+        if major == 1:
+            header_len = int.from_bytes(prefix[8:10], "little")
+            start = 10
+        else:
+            header_len = int.from_bytes(prefix[8:12], "little")
+            start = 12
+        fh.seek(start)
+        header = ast.literal_eval(fh.read(header_len).decode("latin1"))
+    descr = header.get("descr")
+    if (
+        header.get("fortran_order")
+        or len(header.get("shape", ())) != 1
+        or not isinstance(descr, list)
+        or len(descr) != 2
+        or descr[0][1] not in _TIMESTAMP_DESCRS
+        or descr[1][1] != "<f8"
+    ):
+        raise ValueError(
+            f"{path}: expected a 1-D structured array of (int64 | datetime64, float64), "
+            f"got descr={descr!r} shape={header.get('shape')!r}"
+        )
+    # datetime64 fields carry their own unit; raw int64 keeps the caller's.
+    return start + header_len, _DATETIME_UNITS.get(descr[0][1], unit)
+
+
+def _to_datetime(value: int, unit: TimestampUnit) -> datetime:
+    per_unit = _MICROS_PER_UNIT[unit]
+    micros = value // 1_000 if per_unit is None else value * per_unit
+    return _EPOCH + timedelta(microseconds=micros)
+
+
+__all__ = ["MappedEquityCurve", "TimestampUnit", "open_equity_curve"]
@@ -0,0 +1,214 @@
+"""Multiple-testing corrections: deflated Sharpe ratio and PBO.
+
+Native implementations of the two selection-bias statistics carried in
+:class:`~liq.metrics.panel.InferenceInputs`:
+
+* :func:`deflated_sharpe_ratio` — Bailey & López de Prado (2014). The
+  probability that the observed per-period Sharpe exceeds the expected
+  maximum Sharpe of ``n_trials`` unskilled trials, adjusted for the skew and
+  kurtosis of the returns. :func:`deflated_sharpe_from_panel` reuses the
+  moments ``compute_metrics_panel`` already computed.
+* :func:`probability_of_backtest_overfitting` — combinatorially symmetric
+  cross-validation (CSCV, Bailey et al. 2017) over a trials × periods matrix.
+  Per-trial, per-partition sums are computed once, so each split costs
+  ``O(trials × partitions)`` instead of rescanning every period; splits can
+  be fanned out to a process pool.
+"""
+
+from __future__ import annotations
+
+import math
+from collections.abc import Iterator, Sequence
+from dataclasses import dataclass
+from itertools import combinations, islice
+from statistics import NormalDist
+
+from liq.metrics.estimators import sums_sharpe
+from liq.metrics.panel import MetricsPanel
+from liq.metrics.parallel import task_map
+
+_EULER_GAMMA = 0.5772156649015329
+_NORMAL = NormalDist()
+
+
+@dataclass(frozen=True)
+class BacktestOverfitting:
+    """CSCV outcome: PBO plus the per-split logits of the chosen trial's OOS rank."""
+
+    pbo: float
+    n_splits: int
+    logits: tuple[float, ...]
+
+
+def expected_max_sharpe(n_trials: int, trial_sharpe_variance: float) -> float:
+    """Expected maximum Sharpe across ``n_trials`` independent zero-skill trials."""
+    if n_trials < 1:
+        raise ValueError(f"n_trials must be positive, got {n_trials}")
+    if trial_sharpe_variance < 0:
+        raise ValueError("trial_sharpe_variance must be non-negative")
+    if n_trials == 1:
+        return 0.0
+    return math.sqrt(trial_sharpe_variance) * (
+        (1.0 - _EULER_GAMMA) * _NORMAL.inv_cdf(1.0 - 1.0 / n_trials)
+        + _EULER_GAMMA * _NORMAL.inv_cdf(1.0 - 1.0 / (n_trials * math.e))
+    )
+
+
+def deflated_sharpe_ratio(
+    *,
+    sharpe: float,
+    n_observations: int,
+    skew: float,
+    excess_kurtosis: float,
+    n_trials: int,
+    trial_sharpe_variance: float,
+) -> float | None:
+    """Deflated Sharpe ratio of a per-period Sharpe estimate.
+
+    Args:
+        sharpe: Observed per-period (non-annualized) Sharpe ratio.
+        n_observations: Number of return observations behind ``sharpe``.
+        skew: Skewness of the returns.
+        excess_kurtosis: Excess kurtosis of the returns.
+        n_trials: Number of independent configurations tried.
+        trial_sharpe_variance: Variance of per-period Sharpe across trials.
+
+    Returns:
+        Probability in ``[0, 1]``; ``None`` with fewer than two observations
+        or a non-positive Sharpe standard-error term.
+    """
+    if n_observations < 2:
+        return None
+    benchmark = expected_max_sharpe(n_trials, trial_sharpe_variance)
+    denominator = 1.0 - skew * sharpe + (excess_kurtosis + 2.0) / 4.0 * sharpe**2
+    if denominator <= 0:
+        return None
+    z = (sharpe - benchmark) * math.sqrt(n_observations - 1) / math.sqrt(denominator)
+    return _NORMAL.cdf(z)
+
+
+def deflated_sharpe_from_panel(
+    panel: MetricsPanel, *, n_trials: int, trial_sharpe_variance: float
+) -> float | None:
+    """Deflated Sharpe of a panel's daily Sharpe using its own moments."""
+    if panel.sharpe is None:
+        return None
+    return deflated_sharpe_ratio(
+        sharpe=panel.sharpe,
+        n_observations=panel.n_days,
+        skew=panel.skew,
+        excess_kurtosis=panel.excess_kurtosis,
+        n_trials=n_trials,
+        trial_sharpe_variance=trial_sharpe_variance,
+    )
+
+
+def probability_of_backtest_overfitting(
+    performance: Sequence[Sequence[float]],
+    *,
+    n_partitions: int = 16,
+    workers: int | None = None,
+    chunk_size: int = 512,
+) -> BacktestOverfitting:
+    """PBO via combinatorially symmetric cross-validation.
+
+    Args:
+        performance: One row per trial, one column per period (e.g. daily
+            returns); rows must share the period axis.
+        n_partitions: Even number ``S`` of contiguous period blocks; every
+            ``S/2``-block combination is an in-sample split (``C(16, 8)`` =
+            12,870 splits for the default).
+        workers: Process-pool size for the splits; ``None`` runs in-process.
+        chunk_size: Splits per unit of pool work.
+
+    Each split picks the trial with the best in-sample Sharpe and records the
+    logit of its relative out-of-sample rank; PBO is the fraction of splits
+    where that trial lands at or below the OOS median.
+    """
+    n_trials = len(performance)
+    if n_trials < 2:
+        raise ValueError("PBO requires at least two trials")
+    n_periods = len(performance[0])
+    if any(len(row) != n_periods for row in performance):
+        raise ValueError("all trials must cover the same periods")
+    if n_partitions < 2 or n_partitions % 2:
+        raise ValueError(f"n_partitions must be an even number >= 2, got {n_partitions}")
+    if n_periods < n_partitions:
+        raise ValueError(f"need at least {n_partitions} periods, got {n_periods}")
+
+    stats = _partition_stats(performance, n_partitions)
+    splits = combinations(range(n_partitions), n_partitions // 2)
+    with task_map(_split_logits, stats, workers) as run:
+        logits = [logit for chunk in run(_chunked(splits, chunk_size)) for logit in chunk]
+    overfit = sum(1 for logit in logits if logit <= 0.0)
+    return BacktestOverfitting(
+        pbo=overfit / len(logits), n_splits=len(logits), logits=tuple(logits)
+    )
+
+
+_PartitionStats = tuple[tuple[tuple[float, ...], tuple[float, ...]], ...]
+
+
+def _partition_stats(
+    performance: Sequence[Sequence[float]], n_partitions: int
+) -> tuple[tuple[int, ...], _PartitionStats]:
+    """Per-partition period counts and, per trial, per-partition sums / squared sums."""
+    n_periods = len(performance[0])
+    bounds = [round(k * n_periods / n_partitions) for k in range(n_partitions + 1)]
+    counts = tuple(bounds[k + 1] - bounds[k] for k in range(n_partitions))
+    per_trial = tuple(
+        (
+            tuple(math.fsum(row[bounds[k] : bounds[k + 1]]) for k in range(n_partitions)),
+            tuple(
+                math.fsum(value * value for value in row[bounds[k] : bounds[k + 1]])
+                for k in range(n_partitions)
+            ),
+        )
+        for row in performance
+    )
+    return counts, per_trial
+
+
+def _split_logits(
+    stats: tuple[tuple[int, ...], _PartitionStats],
+    splits: Sequence[tuple[int, ...]],
+) -> list[float]:
+    counts, per_trial = stats
+    n_trials = len(per_trial)
+    n_periods = sum(counts)
+    totals = [(math.fsum(sums), math.fsum(squares)) for sums, squares in per_trial]
+    logits: list[float] = []
+    for in_sample in splits:
+        is_count = sum(map(counts.__getitem__, in_sample))
+        oos_count = n_periods - is_count
+        is_sums = [
+            (sum(map(sums.__getitem__, in_sample)), sum(map(squares.__getitem__, in_sample)))
+            for sums, squares in per_trial
+        ]
+        # Zero-variance blocks score 0 so every trial stays rankable.
+        is_sharpe = [sums_sharpe(is_count, total, total_sq) or 0.0 for total, total_sq in is_sums]
+        # Out-of-sample sums are the trial totals minus the in-sample sums.
+        oos_sharpe = [
+            sums_sharpe(oos_count, total - is_total, total_sq - is_total_sq) or 0.0
+            for (total, total_sq), (is_total, is_total_sq) in zip(totals, is_sums, strict=True)
+        ]
+        chosen = max(range(n_trials), key=is_sharpe.__getitem__)
+        chosen_oos = oos_sharpe[chosen]
+        rank = 1 + sum(1 for value in oos_sharpe if value < chosen_oos)
+        omega = rank / (n_trials + 1)
+        logits.append(math.log(omega / (1.0 - omega)))
+    return logits
+
+
+def _chunked(splits: Iterator[tuple[int, ...]], chunk_size: int) -> Iterator[list[tuple[int, ...]]]:
+    while chunk := list(islice(splits, chunk_size)):
+        yield chunk
+
+
+__all__ = [
+    "BacktestOverfitting",
+    "deflated_sharpe_from_panel",
+    "deflated_sharpe_ratio",
+    "expected_max_sharpe",
+    "probability_of_backtest_overfitting",
+]
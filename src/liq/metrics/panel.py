@@ -5,25 +5,32 @@ function writes it to ``metrics_panel.csv`` (long format: ``field,value``)
 with every field present even when a value is unavailable.
 
 Inference statistics (bootstrap CI, clustered t-stats, deflated Sharpe,
-PBO / null percentile) are computed by the caller — the statistics module
-lives in ``liq-validation``, which depends on this package — and passed in
-via :class:`InferenceInputs`.
+PBO / null percentile) are passed in via :class:`InferenceInputs`. Callers
+either compute them with ``liq-validation`` (which depends on this package)
+or with :func:`liq.metrics.inference.compute_inference_inputs`.
 
 Conventions: returns are fractional per-trade / per-day values; Sharpe is
 per-period (not annualized); ``tail_loss_95``/``tail_loss_99`` are the 5th /
 1st percentiles of daily returns; skew and excess kurtosis are moment
 estimators of daily returns; contributions are the largest single day /
 event P&L divided by the total P&L of the corresponding series.
+
+The numeric passes run on the active :mod:`liq.metrics.backend` kernels.
 """
 
 from __future__ import annotations
 
 import csv
 import math
-from collections.abc import Mapping, Sequence
+from collections.abc import Hashable, Iterable, Mapping, Sequence
 from dataclasses import dataclass, fields
 from pathlib import Path
 
+from liq.metrics.backend import get_backend
+from liq.metrics.estimators import quantile
+from liq.metrics.instrumentation import stage, traced
+from liq.metrics.validation import as_sequence
+
 METRICS_PANEL_FIELDS = (
     "n_trades",
     "n_days",
@@ -106,25 +113,37 @@ class MetricsPanel:
     cost_stress: Mapping[str, float] | None = None
 
 
-def _quantile(sorted_values: list[float], p: float) -> float:
-    """Linear-interpolation quantile of pre-sorted values."""
-    index = p * (len(sorted_values) - 1)
-    lo = math.floor(index)
-    hi = math.ceil(index)
-    if lo == hi:
-        return sorted_values[lo]
-    return sorted_values[lo] + (sorted_values[hi] - sorted_values[lo]) * (index - lo)
+@dataclass(frozen=True)
+class EventCodes:
+    """Trade events factorized to dense integer codes.
+
+    ``codes[i]`` is the position of trade ``i``'s event in ``labels``. Build
+    it once with :func:`factorize_events` and pass it as ``trade_events`` to
+    every panel computed over the same trades (e.g. cost-stress variants)
+    to skip re-hashing the event ids.
+    """
+
+    codes: Sequence[int]
+    labels: tuple[Hashable, ...]
+
+    def __len__(self) -> int:
+        return len(self.codes)
 
+    @property
+    def n_events(self) -> int:
+        return len(self.labels)
 
-def _max_drawdown(daily_returns: Sequence[float]) -> float:
-    equity = 1.0
-    peak = 1.0
-    max_dd = 0.0
-    for r in daily_returns:
-        equity *= 1.0 + r
-        peak = max(peak, equity)
-        max_dd = max(max_dd, (peak - equity) / peak)
-    return max_dd
+    def segment_sums(self, values: Iterable[float]) -> list[float]:
+        """Per-event sums of ``values`` (aligned with the trades), indexed by code."""
+        return get_backend().segment_sums(self.codes, self.n_events, as_sequence(values))
+
+
+def factorize_events(events: Iterable[Hashable]) -> EventCodes:
+    """Map event ids to dense codes in order of first appearance."""
+    events = events if isinstance(events, Sequence) else list(events)
+    labels = tuple(dict.fromkeys(events))
+    lookup = {label: code for code, label in enumerate(labels)}
+    return EventCodes(codes=list(map(lookup.__getitem__, events)), labels=labels)
 
 
 def _contribution(largest: float, total: float) -> float | None:
@@ -133,12 +152,13 @@ def _contribution(largest: float, total: float) -> float | None:
     return largest / total
 
 
+@traced("metrics_panel")
 def compute_metrics_panel(
     *,
     trade_returns_net: Sequence[float],
     trade_returns_gross: Sequence[float],
     daily_returns: Sequence[float],
-    trade_events: Sequence[str] | None = None,
+    trade_events: Sequence[str] | EventCodes | None = None,
     benchmark_daily_returns: Sequence[float] | None = None,
     inference: InferenceInputs | None = None,
     cost_stress: Mapping[str, float] | None = None,
@@ -150,7 +170,8 @@ def compute_metrics_panel(
         trade_returns_net: Fractional net return per trade.
         trade_returns_gross: Fractional gross return per trade (same order).
         daily_returns: Fractional net daily portfolio returns.
-        trade_events: Optional event id per trade (event-anchored arms).
+        trade_events: Optional event id per trade (event-anchored arms), or
+            an :class:`EventCodes` factorization of them.
         benchmark_daily_returns: Optional matched benchmark (SPY or beta
             twin) daily returns for alpha/beta attribution.
         inference: Caller-computed inference statistics.
@@ -158,85 +179,87 @@ def compute_metrics_panel(
         portfolio_incremental_sharpe: Incremental Sharpe vs the plan of
             record's portfolio.
     """
-    if len(trade_returns_net) == 0:
-        raise ValueError("trade returns must not be empty")
-    if len(trade_returns_net) != len(trade_returns_gross):
-        raise ValueError(
-            "net and gross trade returns must have equal length, got "
-            f"{len(trade_returns_net)} and {len(trade_returns_gross)}"
-        )
-    if len(daily_returns) == 0:
-        raise ValueError("daily returns must not be empty")
-    if trade_events is not None and len(trade_events) != len(trade_returns_net):
-        raise ValueError(
-            "trade_events must align with trade returns, got "
-            f"{len(trade_events)} events for {len(trade_returns_net)} trades"
-        )
-    if benchmark_daily_returns is not None and len(benchmark_daily_returns) != len(daily_returns):
-        raise ValueError(
-            "benchmark daily returns must align with daily returns, got "
-            f"{len(benchmark_daily_returns)} and {len(daily_returns)}"
-        )
+    with stage("metrics_panel.validate"):
+        if len(trade_returns_net) == 0:
+            raise ValueError("trade returns must not be empty")
+        if len(trade_returns_net) != len(trade_returns_gross):
+            raise ValueError(
+                "net and gross trade returns must have equal length, got "
+                f"{len(trade_returns_net)} and {len(trade_returns_gross)}"
+            )
+        if len(daily_returns) == 0:
+            raise ValueError("daily returns must not be empty")
+        if trade_events is not None and len(trade_events) != len(trade_returns_net):
+            raise ValueError(
+                "trade_events must align with trade returns, got "
+                f"{len(trade_events)} events for {len(trade_returns_net)} trades"
+            )
+        if benchmark_daily_returns is not None and len(benchmark_daily_returns) != len(
+            daily_returns
+        ):
+            raise ValueError(
+                "benchmark daily returns must align with daily returns, got "
+                f"{len(benchmark_daily_returns)} and {len(daily_returns)}"
+            )
 
     n_trades = len(trade_returns_net)
     n_days = len(daily_returns)
-    wins = sum(1 for r in trade_returns_net if r > 0)
-    gross_profit = sum(r for r in trade_returns_net if r > 0)
-    gross_loss = -sum(r for r in trade_returns_net if r < 0)
-    profit_factor = gross_profit / gross_loss if gross_loss > 0 else math.inf
-    mean_trade = sum(trade_returns_net) / n_trades
-
-    mean_daily = sum(daily_returns) / n_days
-    m2 = sum((r - mean_daily) ** 2 for r in daily_returns) / n_days
-    m3 = sum((r - mean_daily) ** 3 for r in daily_returns) / n_days
-    m4 = sum((r - mean_daily) ** 4 for r in daily_returns) / n_days
-    skew = m3 / m2**1.5 if m2 > 0 else 0.0
-    excess_kurtosis = m4 / m2**2 - 3.0 if m2 > 0 else 0.0
-
-    sharpe: float | None = None
-    if n_days >= 2:
-        sample_var = sum((r - mean_daily) ** 2 for r in daily_returns) / (n_days - 1)
-        if sample_var > 0:
-            sharpe = mean_daily / math.sqrt(sample_var)
-
-    sorted_daily = sorted(daily_returns)
-    day_contribution = _contribution(max(daily_returns), sum(daily_returns))
+    backend = get_backend()
+    with stage("metrics_panel.trades", count=n_trades):
+        net = backend.as_array(trade_returns_net)
+        wins, gross_profit, gross_loss, net_total = backend.trade_summary(net)
+        profit_factor = gross_profit / gross_loss if gross_loss > 0 else math.inf
+        mean_trade = net_total / n_trades
+
+    with stage("metrics_panel.moments", count=n_days):
+        daily = backend.as_array(daily_returns)
+        mean_daily, m2, m3, m4 = backend.central_moments(daily)
+        skew = m3 / m2**1.5 if m2 > 0 else 0.0
+        excess_kurtosis = m4 / m2**2 - 3.0 if m2 > 0 else 0.0
+
+        sharpe = backend.sharpe_ratios([daily])[0]
+
+    with stage("metrics_panel.sort", count=n_days):
+        sorted_daily = backend.sorted_values(daily)
+        day_contribution = _contribution(backend.largest(daily), backend.total(daily))
+
+    with stage("metrics_panel.drawdown", count=n_days):
+        drawdown = backend.compounded_max_drawdown(daily)
 
     event_contribution: float | None = None
     if trade_events is not None:
-        event_pnl: dict[str, float] = {}
-        for event, r in zip(trade_events, trade_returns_net, strict=True):
-            event_pnl[event] = event_pnl.get(event, 0.0) + r
-        event_contribution = _contribution(max(event_pnl.values()), sum(trade_returns_net))
+        with stage("metrics_panel.events", count=n_trades):
+            if not isinstance(trade_events, EventCodes):
+                trade_events = factorize_events(trade_events)
+            event_pnl = trade_events.segment_sums(net)
+            event_contribution = _contribution(max(event_pnl), net_total)
 
     alpha: float | None = None
     beta: float | None = None
     if benchmark_daily_returns is not None and n_days >= 2:
-        mean_bench = sum(benchmark_daily_returns) / n_days
-        cov = sum(
-            (a - mean_daily) * (b - mean_bench)
-            for a, b in zip(daily_returns, benchmark_daily_returns, strict=True)
-        ) / (n_days - 1)
-        var_bench = sum((b - mean_bench) ** 2 for b in benchmark_daily_returns) / (n_days - 1)
-        if var_bench > 0:
-            beta = cov / var_bench
-            alpha = mean_daily - beta * mean_bench
+        with stage("metrics_panel.benchmark", count=n_days):
+            mean_bench, cov, var_bench = backend.covariance(
+                daily, mean_daily, backend.as_array(benchmark_daily_returns)
+            )
+            if var_bench > 0:
+                beta = cov / var_bench
+                alpha = mean_daily - beta * mean_bench
 
     inf = inference or InferenceInputs()
     return MetricsPanel(
         n_trades=n_trades,
         n_days=n_days,
-        gross_return=sum(trade_returns_gross),
-        net_return=sum(trade_returns_net),
+        gross_return=backend.total(trade_returns_gross),
+        net_return=net_total,
         net_bps_per_trade=mean_trade * 10_000,
         profit_factor=profit_factor,
         win_rate=wins / n_trades,
         mean_trade_return=mean_trade,
         skew=skew,
         excess_kurtosis=excess_kurtosis,
-        max_drawdown=_max_drawdown(daily_returns),
-        tail_loss_95=_quantile(sorted_daily, 0.05),
-        tail_loss_99=_quantile(sorted_daily, 0.01),
+        max_drawdown=drawdown,
+        tail_loss_95=quantile(sorted_daily, 0.05),
+        tail_loss_99=quantile(sorted_daily, 0.01),
         max_single_day_contribution=day_contribution,
         max_single_event_contribution=event_contribution,
         sharpe=sharpe,
@@ -256,6 +279,7 @@ def compute_metrics_panel(
     )
 
 
+@traced("metrics_panel.write_csv")
 def write_metrics_panel_csv(panel: MetricsPanel, path: Path) -> None:
     """Write the panel as ``field,value`` rows; None values emit empty."""
     path.parent.mkdir(parents=True, exist_ok=True)
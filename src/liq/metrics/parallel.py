@@ -0,0 +1,67 @@
+"""Process-pool fan-out shared by the resampling engines.
+
+The bootstrap, PBO and null-percentile engines all split their work into
+seeded tasks that read one large, read-only job (columns, partition sums,
+trade units). :func:`task_map` ships that job to each worker once, through
+the pool initializer, instead of pickling it with every task. Tasks then
+carry only a seed and a count (or a chunk of splits), and results do not
+depend on the number of workers. Workers run on the caller's active
+:mod:`liq.metrics.backend`, so pooled and in-process runs use the same
+kernels.
+"""
+
+from __future__ import annotations
+
+import os
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+from typing import Any, TypeVar
+
+from liq.metrics.backend import ENV_VAR, get_backend
+
+Job = TypeVar("Job")
+Task = TypeVar("Task")
+Result = TypeVar("Result")
+
+
+@contextmanager
+def task_map(
+    function: Callable[[Job, Task], Result], job: Job, workers: int | None
+) -> Iterator[Callable[[Iterable[Task]], Iterable[Result]]]:
+    """Yield a ``map`` of ``function(job, task)`` over tasks, in task order.
+
+    ``workers`` of ``None`` or ``1`` maps in-process (lazily); otherwise the
+    pool lives until the ``with`` block exits, so callers can submit tasks
+    in several waves. ``function`` must be a module-level function when
+    ``workers`` is set.
+    """
+    if workers is None or workers <= 1:
+        yield lambda tasks: (function(job, task) for task in tasks)
+        return
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        initializer=_init_worker,
+        initargs=(function, job, get_backend().name),
+    ) as pool:
+        yield lambda tasks: pool.map(_run_worker_task, tasks)
+
+
+_WORKER: tuple[Callable[[Any, Any], Any], Any] | None = None
+
+
+def _init_worker(  # pragma: no cover - runs in child process
+    function: Callable[[Any, Any], Any], job: Any, backend: str
+) -> None:
+    global _WORKER
+    _WORKER = (function, job)
+    os.environ[ENV_VAR] = backend
+
+
+def _run_worker_task(task: Any) -> Any:  # pragma: no cover - runs in child process
+    assert _WORKER is not None
+    function, job = _WORKER
+    return function(job, task)
+
+
+__all__ = ["task_map"]
@@ -7,10 +7,28 @@ from equity curves with regime labels.
 from __future__ import annotations
 
 import math
-from collections import defaultdict
+from collections.abc import Iterable, Mapping
 from dataclasses import dataclass, field
 from datetime import datetime
 from decimal import Decimal
+from functools import cached_property
+from itertools import groupby
+from typing import TYPE_CHECKING, Any
+
+from liq.metrics.backend import get_backend
+from liq.metrics.instrumentation import stage, traced
+from liq.metrics.resample import (
+    FREQUENCIES,
+    PERIODS_PER_YEAR,
+    Frequency,
+    ResampledEquityCurve,
+)
+
+if TYPE_CHECKING:
+    from liq.metrics.mapped_curve import MappedEquityCurve
+
+# Regime name of the whole-curve metrics; reserved in regime-label space.
+AGGREGATE = "aggregate"
 
 
 @dataclass(frozen=True)
@@ -25,12 +43,41 @@ class RegimeMetrics:
     win_rate: float | None  # None if < 2 observations
 
 
+@dataclass(frozen=True)
+class RegimeSegment:
+    """One contiguous run of bars sharing a regime label."""
+
+    regime: str
+    start: int  # index of the first bar in the equity curve
+    end: int  # index of the last bar (inclusive)
+    start_time: datetime
+    end_time: datetime
+    total_return: float
+    max_drawdown: float  # Negative value, as in RegimeMetrics
+
+    @property
+    def num_bars(self) -> int:
+        return self.end - self.start + 1
+
+
 @dataclass(frozen=True)
 class PerformanceReport:
     """Aggregate + regime-stratified performance."""
 
     aggregate: RegimeMetrics
     by_regime: dict[str, RegimeMetrics] = field(default_factory=dict)
+    segments: tuple[RegimeSegment, ...] = ()
+
+
+@dataclass(frozen=True)
+class FrequencyMetrics:
+    """Metrics of a curve resampled to one calendar frequency, plus annualized figures."""
+
+    frequency: str
+    periods_per_year: int
+    metrics: RegimeMetrics  # per-period metrics on the resampled curve
+    annualized_return: float | None  # None without a full period or on total loss
+    annualized_sharpe: float | None
 
 
 @dataclass(frozen=True)
@@ -43,6 +90,85 @@ class ComparisonResult:
     outperforms_per_regime: dict[str, bool] = field(default_factory=dict)
 
 
+@dataclass(frozen=True)
+class RegimeDelta:
+    """Candidate minus baseline for one regime (``None`` where either side is missing)."""
+
+    total_return_delta: float | None
+    sharpe_delta: float | None
+    outperforms: bool | None  # same rule as ComparisonResult; None if neither has data
+
+
+@dataclass(frozen=True, eq=False)
+class ComparisonMatrix:
+    """Candidates × baselines × regimes table of performance deltas.
+
+    ``total_return_deltas[i][j][k]`` and ``sharpe_deltas[i][j][k]`` hold
+    candidate ``i`` minus baseline ``j`` in ``regimes[k]`` as backend-native
+    arrays (a NumPy array, or nested lists on the python backend), NaN where
+    either side lacks the regime or a Sharpe ratio. ``candidate_coverage`` and
+    ``baseline_coverage`` flag which reports have each regime.
+    :class:`RegimeDelta` cells are only built on access (:meth:`get`,
+    :attr:`deltas`, :meth:`rows`).
+    """
+
+    candidates: tuple[str, ...]
+    baselines: tuple[str, ...]
+    regimes: tuple[str, ...]  # "aggregate" first, then sorted regime labels
+    total_return_deltas: Any
+    sharpe_deltas: Any
+    candidate_coverage: tuple[tuple[bool, ...], ...]
+    baseline_coverage: tuple[tuple[bool, ...], ...]
+
+    def get(self, candidate: str, baseline: str, regime: str) -> RegimeDelta:
+        """Delta for one (candidate, baseline, regime) cell."""
+        i, j, k = self._positions(candidate, baseline, regime)
+        return self._cell(i, j, k)
+
+    @cached_property
+    def deltas(self) -> dict[tuple[str, str, str], RegimeDelta]:
+        """Every cell, keyed by ``(candidate, baseline, regime)``."""
+        return {
+            (candidate, baseline, regime): self._cell(i, j, k)
+            for i, candidate in enumerate(self.candidates)
+            for j, baseline in enumerate(self.baselines)
+            for k, regime in enumerate(self.regimes)
+        }
+
+    def rows(self) -> list[dict[str, str | float | bool | None]]:
+        """Long-format rows (one per cell) for CSV / dataframe export."""
+        return [
+            {
+                "candidate": candidate,
+                "baseline": baseline,
+                "regime": regime,
+                "total_return_delta": delta.total_return_delta,
+                "sharpe_delta": delta.sharpe_delta,
+                "outperforms": delta.outperforms,
+            }
+            for (candidate, baseline, regime), delta in self.deltas.items()
+        ]
+
+    def _positions(self, candidate: str, baseline: str, regime: str) -> tuple[int, int, int]:
+        lookup = self._lookup
+        return lookup[0][candidate], lookup[1][baseline], lookup[2][regime]
+
+    @cached_property
+    def _lookup(self) -> tuple[dict[str, int], ...]:
+        return tuple(
+            {name: position for position, name in enumerate(axis)}
+            for axis in (self.candidates, self.baselines, self.regimes)
+        )
+
+    def _cell(self, i: int, j: int, k: int) -> RegimeDelta:
+        return _regime_delta(
+            self.candidate_coverage[i][k],
+            self.baseline_coverage[j][k],
+            float(self.total_return_deltas[i][j][k]),
+            float(self.sharpe_deltas[i][j][k]),
+        )
+
+
 class PerformanceAnalyzer:
     """Stateless regime-stratified performance analysis.
 
@@ -50,6 +176,7 @@ class PerformanceAnalyzer:
     and aggregate metrics.
     """
 
+    @traced("performance.analyze")
     def analyze(
         self,
         equity_curve: list[tuple[datetime, Decimal]],
@@ -59,7 +186,7 @@ class PerformanceAnalyzer:
         if not equity_curve:
             return PerformanceReport(
                 aggregate=RegimeMetrics(
-                    regime="aggregate",
+                    regime=AGGREGATE,
                     total_return=0.0,
                     sharpe_ratio=None,
                     max_drawdown=0.0,
@@ -69,33 +196,93 @@ class PerformanceAnalyzer:
                 by_regime={},
             )
 
-        by_regime = self.analyze_by_regime(equity_curve, regime_labels)
-        aggregate = self._compute_aggregate(equity_curve)
+        with stage("performance.by_regime", count=len(equity_curve)):
+            by_regime, segments = _scan_regime_segments(equity_curve, regime_labels)
+        with stage("performance.aggregate", count=len(equity_curve)):
+            aggregate = self._compute_aggregate(equity_curve)
 
-        return PerformanceReport(aggregate=aggregate, by_regime=by_regime)
+        return PerformanceReport(aggregate=aggregate, by_regime=by_regime, segments=segments)
 
     def analyze_by_regime(
         self,
         equity_curve: list[tuple[datetime, Decimal]],
         regime_labels: list[tuple[datetime, str]],
     ) -> dict[str, RegimeMetrics]:
-        """Compute per-regime metrics."""
-        if not equity_curve:
-            return {}
-
-        # Build timestamp → regime lookup
-        label_map: dict[datetime, str] = dict(regime_labels)
+        """Compute per-regime metrics.
 
-        # Bin equity values by regime
-        regime_values: dict[str, list[Decimal]] = defaultdict(list)
-        for ts, value in equity_curve:
-            regime = label_map.get(ts, "unknown")
-            regime_values[regime].append(value)
+        Bars are split into contiguous same-label segments; bar returns are
+        only taken within a segment, so a regime's metrics never include the
+        move across the bars where another regime was active. A regime's
+        total return and drawdown follow its segments chained end to end.
+        """
+        return _scan_regime_segments(equity_curve, regime_labels)[0]
 
-        result: dict[str, RegimeMetrics] = {}
-        for regime, values in regime_values.items():
-            result[regime] = self._compute_regime_metrics(regime, values)
+    def analyze_segments(
+        self,
+        equity_curve: list[tuple[datetime, Decimal]],
+        regime_labels: list[tuple[datetime, str]],
+    ) -> tuple[RegimeSegment, ...]:
+        """Contiguous regime segments in curve order, with per-segment return and drawdown."""
+        return _scan_regime_segments(equity_curve, regime_labels)[1]
+
+    def analyze_chunks(
+        self, chunks: Iterable[Iterable[float]], *, regime: str = AGGREGATE
+    ) -> RegimeMetrics:
+        """Aggregate metrics over a curve delivered as consecutive value windows.
+
+        Matches the aggregate of :meth:`analyze` while holding only one window
+        and a few running statistics (Welford moments, peak, win count).
+        """
+        accumulator = _CurveAccumulator()
+        for chunk in chunks:
+            accumulator.update(chunk)
+        return accumulator.result(regime)
+
+    def analyze_mapped(
+        self, curve: MappedEquityCurve, *, chunk_size: int = 1 << 20
+    ) -> PerformanceReport:
+        """Aggregate report for a memory-mapped curve, walked in fixed windows."""
+        return PerformanceReport(
+            aggregate=self.analyze_chunks(curve.iter_value_chunks(chunk_size)), by_regime={}
+        )
 
+    def analyze_frequencies(
+        self,
+        equity_curve: list[tuple[datetime, Decimal]] | ResampledEquityCurve,
+        frequencies: Iterable[Frequency] = FREQUENCIES,
+    ) -> dict[str, FrequencyMetrics]:
+        """Annualized metrics of the curve at several calendar frequencies.
+
+        A raw curve is resampled to all ``frequencies`` in one pass; pass a
+        :class:`~liq.metrics.resample.ResampledEquityCurve` to reuse earlier
+        resampling. Sharpe is annualized by ``sqrt(periods_per_year)`` and
+        total return is compounded to a yearly rate.
+        """
+        frequencies = tuple(frequencies)
+        if not isinstance(equity_curve, ResampledEquityCurve):
+            equity_curve = ResampledEquityCurve.from_equity_curve(equity_curve, frequencies)
+
+        result: dict[str, FrequencyMetrics] = {}
+        for frequency in frequencies:
+            metrics = self._compute_aggregate(equity_curve.curve(frequency))
+            periods_per_year = PERIODS_PER_YEAR[frequency]
+            n_periods = metrics.num_bars - 1
+            growth = 1.0 + metrics.total_return
+            result[frequency] = FrequencyMetrics(
+                frequency=frequency,
+                periods_per_year=periods_per_year,
+                metrics=metrics,
+                annualized_return=(
+                    growth ** (periods_per_year / n_periods) - 1.0
+                    if n_periods > 0 and growth > 0
+                    else None
+                ),
+                annualized_sharpe=(
+                    metrics.sharpe_ratio * math.sqrt(periods_per_year)
+                    if metrics.sharpe_ratio is not None
+                    else None
+                ),
+            )
         return result
 
     def compare(
@@ -129,10 +316,56 @@ class PerformanceAnalyzer:
             outperforms_per_regime=outperforms_per_regime,
         )
 
+    def compare_matrix(
+        self,
+        candidates: Mapping[str, PerformanceReport],
+        baselines: Mapping[str, PerformanceReport],
+    ) -> ComparisonMatrix:
+        """Compare every candidate against every baseline in every regime.
+
+        The regime axis is built once from all reports and each report is
+        flattened once into aligned ``total_return`` / ``sharpe`` vectors
+        (NaN where a regime or Sharpe is missing). The candidates × baselines
+        × regimes differences are then one backend kernel call per metric,
+        kept as arrays in the result; no per-cell objects are built here.
+
+        Raises:
+            ValueError: If a report has a regime labelled ``"aggregate"``,
+                which would collide with the whole-curve row.
+        """
+        labels: set[str] = set()
+        for report in (*candidates.values(), *baselines.values()):
+            labels.update(report.by_regime)
+        if AGGREGATE in labels:
+            raise ValueError(f"regime label {AGGREGATE!r} is reserved for the whole-curve row")
+        regimes = (AGGREGATE, *sorted(labels))
+
+        def vector(report: PerformanceReport) -> list[RegimeMetrics | None]:
+            return [report.aggregate, *(report.by_regime.get(r) for r in regimes[1:])]
+
+        candidate_vectors = [vector(report) for report in candidates.values()]
+        baseline_vectors = [vector(report) for report in baselines.values()]
+        backend = get_backend()
+        return ComparisonMatrix(
+            candidates=tuple(candidates),
+            baselines=tuple(baselines),
+            regimes=regimes,
+            total_return_deltas=backend.pairwise_differences(
+                [_metric_vector(v, "total_return") for v in candidate_vectors],
+                [_metric_vector(v, "total_return") for v in baseline_vectors],
+            ),
+            sharpe_deltas=backend.pairwise_differences(
+                [_metric_vector(v, "sharpe_ratio") for v in candidate_vectors],
+                [_metric_vector(v, "sharpe_ratio") for v in baseline_vectors],
+            ),
+            candidate_coverage=tuple(_coverage(v) for v in candidate_vectors),
+            baseline_coverage=tuple(_coverage(v) for v in baseline_vectors),
+        )
+
     def _compute_aggregate(self, equity_curve: list[tuple[datetime, Decimal]]) -> RegimeMetrics:
         """Compute aggregate metrics over entire equity curve."""
         values = [float(v) for _, v in equity_curve]
-        return self._compute_regime_metrics("aggregate", [Decimal(str(v)) for v in values])
+        return self._compute_regime_metrics(AGGREGATE, [Decimal(str(v)) for v in values])
 
     def _compute_regime_metrics(self, regime: str, values: list[Decimal]) -> RegimeMetrics:
         """Compute metrics for a single regime's equity values."""
@@ -165,30 +398,10 @@ class PerformanceAnalyzer:
             (float_values[-1] - float_values[0]) / float_values[0] if float_values[0] != 0 else 0.0
         )
 
-        # Per-bar returns
-        returns = [
-            (float_values[i] - float_values[i - 1]) / float_values[i - 1]
-            if float_values[i - 1] != 0
-            else 0.0
-            for i in range(1, n)
-        ]
-
-        # Sharpe ratio (annualized not applied here — raw per-bar Sharpe)
-        sharpe: float | None = None
-        if len(returns) >= 2:
-            mean_ret = sum(returns) / len(returns)
-            var = sum((r - mean_ret) ** 2 for r in returns) / (len(returns) - 1)
-            std = math.sqrt(var) if var > 0 else 0.0
-            sharpe = mean_ret / std if std > 0 else None
-
-        # Max drawdown
-        max_dd = self._max_drawdown(float_values)
-
-        # Win rate
-        win_rate: float | None = None
-        if returns:
-            wins = sum(1 for r in returns if r > 0)
-            win_rate = wins / len(returns)
+        # Raw per-bar Sharpe; analyze_frequencies() reports annualized figures
+        backend = get_backend()
+        sharpe, win_rate = backend.sharpe_and_win_rate(backend.bar_returns(float_values))
+        max_dd = 0.0 - backend.max_drawdown(float_values)  # 0.0 - x keeps flat curves at +0.0
 
         return RegimeMetrics(
             regime=regime,
@@ -199,20 +412,146 @@ class PerformanceAnalyzer:
             win_rate=win_rate,
         )
 
-    @staticmethod
-    def _max_drawdown(values: list[float]) -> float:
-        """Compute maximum drawdown as a negative fraction."""
-        if len(values) < 2:
-            return 0.0
 
-        peak = values[0]
-        max_dd = 0.0
+def _scan_regime_segments(
+    equity_curve: list[tuple[datetime, Decimal]],
+    regime_labels: list[tuple[datetime, str]],
+) -> tuple[dict[str, RegimeMetrics], tuple[RegimeSegment, ...]]:
+    """Run-length encode regime labels, then score segments and regimes on the backend.
+
+    Bar returns are taken once over the whole curve; each regime selects the
+    returns inside its segments and chains them from a unit level.
+    """
+    label_map: dict[datetime, str] = dict(regime_labels)
+    values = [float(value) for _, value in equity_curve]
+    backend = get_backend()
+    curve = backend.as_array(values)
+    returns = backend.bar_returns(curve)
+
+    segments: list[RegimeSegment] = []
+    spans: dict[str, list[tuple[int, int]]] = {}
+    start = 0
+    for regime, run in groupby(label_map.get(ts, "unknown") for ts, _ in equity_curve):
+        end = start + sum(1 for _ in run) - 1
+        first = values[start]
+        segments.append(
+            RegimeSegment(
+                regime=regime,
+                start=start,
+                end=end,
+                start_time=equity_curve[start][0],
+                end_time=equity_curve[end][0],
+                total_return=(values[end] - first) / first if first != 0 else 0.0,
+                max_drawdown=0.0 - backend.max_drawdown(curve[start : end + 1]),
+            )
+        )
+        spans.setdefault(regime, []).append((start, end))
+        start = end + 1
+
+    by_regime: dict[str, RegimeMetrics] = {}
+    for regime, ranges in spans.items():
+        # Return i is the move from bar i to bar i + 1, so a segment owns
+        # returns start..end-1 and never the move into the next segment.
+        selectors = bytearray(len(values) - 1)
+        for first_bar, last_bar in ranges:
+            selectors[first_bar:last_bar] = b"\x01" * (last_bar - first_bar)
+        regime_returns = backend.select(returns, bytes(selectors))
+        sharpe, win_rate = backend.sharpe_and_win_rate(regime_returns)
+        by_regime[regime] = RegimeMetrics(
+            regime=regime,
+            total_return=backend.compounded_return(regime_returns) if len(regime_returns) else 0.0,
+            sharpe_ratio=sharpe,
+            max_drawdown=0.0 - backend.compounded_max_drawdown(regime_returns),
+            num_bars=sum(last_bar - first_bar + 1 for first_bar, last_bar in ranges),
+            win_rate=win_rate,
+        )
+    return by_regime, tuple(segments)
 
-        for v in values[1:]:
-            if v > peak:
-                peak = v
-            dd = (v - peak) / peak if peak > 0 else 0.0
-            if dd < max_dd:
-                max_dd = dd
 
-        return max_dd
+def _metric_vector(vector: list[RegimeMetrics | None], name: str) -> list[float]:
+    """One metric along the regime axis; NaN where the regime or value is missing."""
+    values = [getattr(metrics, name) if metrics is not None else None for metrics in vector]
+    return [math.nan if value is None else value for value in values]
+
+
+def _coverage(vector: list[RegimeMetrics | None]) -> tuple[bool, ...]:
+    return tuple(metrics is not None for metrics in vector)
+
+
+def _regime_delta(
+    has_cand: bool, has_base: bool, return_delta: float, sharpe_delta: float
+) -> RegimeDelta:
+    if not (has_cand and has_base):
+        # One-sided data follows compare(): candidate-only wins, baseline-only loses.
+        return RegimeDelta(
+            total_return_delta=None,
+            sharpe_delta=None,
+            outperforms=None if not (has_cand or has_base) else has_cand,
+        )
+    return RegimeDelta(
+        total_return_delta=return_delta,
+        sharpe_delta=None if math.isnan(sharpe_delta) else sharpe_delta,
+        outperforms=return_delta > 0,
+    )
+
+
+class _CurveAccumulator:
+    """Running aggregate-metric state over consecutive equity values."""
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.first: float | None = None
+        self.last: float | None = None
+        self.peak = 0.0
+        self.worst = 0.0
+        self.wins = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+
+    def update(self, values: Iterable[float]) -> None:
+        count, prev, peak, worst = self.count, self.last, self.peak, self.worst
+        wins, mean, m2 = self.wins, self.mean, self.m2
+        for value in values:
+            if prev is None:
+                self.first = value
+                peak = value
+            else:
+                r = (value - prev) / prev if prev != 0 else 0.0
+                n_returns = count  # returns seen so far, including this one
+                delta = r - mean
+                mean += delta / n_returns
+                m2 += delta * (r - mean)
+                if r > 0:
+                    wins += 1
+                if value > peak:
+                    peak = value
+                elif peak > 0 and (peak - value) / peak > worst:
+                    worst = (peak - value) / peak
+            prev = value
+            count += 1
+        self.count, self.last, self.peak, self.worst = count, prev, peak, worst
+        self.wins, self.mean, self.m2 = wins, mean, m2
+
+    def result(self, regime: str) -> RegimeMetrics:
+        if self.count < 2 or self.first is None or self.last is None:
+            return RegimeMetrics(
+                regime=regime,
+                total_return=0.0,
+                sharpe_ratio=None,
+                max_drawdown=0.0,
+                num_bars=self.count,
+                win_rate=None,
+            )
+        n_returns = self.count - 1
+        sharpe: float | None = None
+        if n_returns >= 2:
+            var = self.m2 / (n_returns - 1)
+            sharpe = self.mean / math.sqrt(var) if var > 0 else None
+        return RegimeMetrics(
+            regime=regime,
+            total_return=(self.last - self.first) / self.first if self.first != 0 else 0.0,
+            sharpe_ratio=sharpe,
+            max_drawdown=0.0 - self.worst,
+            num_bars=self.count,
+            win_rate=self.wins / n_returns,
+        )
@@ -0,0 +1,128 @@
+"""Calendar resampling of equity curves.
+
+Intraday (e.g. minute-bar) equity curves are downsampled to daily, weekly
+(ISO week) and monthly curves in a single pass over timestamp-sorted bars:
+each calendar bucket keeps its last value, and the first bar of the curve is
+kept as the opening value so the first period's return is not lost.
+
+:class:`ResampledEquityCurve` holds the resampled curves so several analyses
+(or several frequencies) reuse one resampling pass; see
+:meth:`liq.metrics.performance.PerformanceAnalyzer.analyze_frequencies`.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+from datetime import date, datetime
+from decimal import Decimal
+from typing import Literal
+
+Frequency = Literal["daily", "weekly", "monthly"]
+
+PERIODS_PER_YEAR: dict[str, int] = {"daily": 252, "weekly": 52, "monthly": 12}
+FREQUENCIES: tuple[Frequency, ...] = ("daily", "weekly", "monthly")
+
+EquityCurve = list[tuple[datetime, Decimal]]
+
+
+def _bucket_key(frequency: str, day: date) -> object:
+    if frequency == "daily":
+        return day
+    if frequency == "weekly":
+        iso = day.isocalendar()
+        return (iso.year, iso.week)
+    return (day.year, day.month)
+
+
+def resample_equity_curve(
+    equity_curve: Iterable[tuple[datetime, Decimal]],
+    frequencies: Iterable[Frequency] = FREQUENCIES,
+) -> dict[Frequency, EquityCurve]:
+    """Downsample a timestamp-sorted curve to several calendar frequencies at once.
+
+    Buckets follow each timestamp's own calendar date (convert to the
+    reporting timezone first). Bucket keys are only recomputed when the date
+    changes, so intraday bars cost one ``date()`` call and a list store each.
+
+    Raises:
+        ValueError: If a frequency is unknown or timestamps are not sorted.
+    """
+    frequencies = tuple(dict.fromkeys(frequencies))
+    for frequency in frequencies:
+        if frequency not in PERIODS_PER_YEAR:
+            raise ValueError(
+                f"unknown frequency {frequency!r}; expected one of {sorted(PERIODS_PER_YEAR)}"
+            )
+    curves: dict[Frequency, EquityCurve] = {frequency: [] for frequency in frequencies}
+    outputs = list(curves.values())
+    last_keys: list[object] = [None] * len(frequencies)
+    first: tuple[datetime, Decimal] | None = None
+    prev_ts: datetime | None = None
+    prev_day: date | None = None
+
+    for point in equity_curve:
+        ts = point[0]
+        if prev_ts is not None and ts < prev_ts:
+            raise ValueError(f"equity curve timestamps must be sorted ({ts} after {prev_ts})")
+        prev_ts = ts
+        day = ts.date()
+        if day == prev_day:
+            # Same calendar day implies the same bucket at every frequency.
+            for out in outputs:
+                out[-1] = point
+            continue
+        prev_day = day
+        if first is None:
+            first = point
+        for i, frequency in enumerate(frequencies):
+            key = _bucket_key(frequency, day)
+            if key == last_keys[i]:
+                outputs[i][-1] = point
+            else:
+                outputs[i].append(point)
+                last_keys[i] = key
+
+    if first is not None:
+        for out in outputs:
+            if out[0] is not first:
+                out.insert(0, first)  # opening value of the first bucket
+    return curves
+
+
+@dataclass(frozen=True)
+class ResampledEquityCurve:
+    """Cached calendar resamplings of one equity curve."""
+
+    curves: dict[Frequency, EquityCurve] = field(default_factory=dict)
+
+    @classmethod
+    def from_equity_curve(
+        cls,
+        equity_curve: Iterable[tuple[datetime, Decimal]],
+        frequencies: Iterable[Frequency] = FREQUENCIES,
+    ) -> ResampledEquityCurve:
+        """Resample ``equity_curve`` to every frequency in one pass."""
+        return cls(curves=resample_equity_curve(equity_curve, frequencies))
+
+    @property
+    def frequencies(self) -> tuple[Frequency, ...]:
+        return tuple(self.curves)
+
+    def curve(self, frequency: Frequency) -> EquityCurve:
+        """The resampled curve at ``frequency``."""
+        try:
+            return self.curves[frequency]
+        except KeyError:
+            raise ValueError(
+                f"frequency {frequency!r} was not resampled; available: {list(self.curves)}"
+            ) from None
+
+
+__all__ = [
+    "FREQUENCIES",
+    "PERIODS_PER_YEAR",
+    "Frequency",
+    "ResampledEquityCurve",
+    "resample_equity_curve",
+]
@@ -3,8 +3,97 @@
 from __future__ import annotations
 
 import math
-from collections.abc import Sequence
+from collections.abc import Callable, Sequence
 from dataclasses import asdict, dataclass
+from itertools import repeat
+from operator import mul
+
+from liq.metrics.backend import get_backend
+from liq.metrics.bootstrap import (
+    ConfidenceInterval,
+    ResampleMethod,
+    bootstrap_column_sums,
+    percentile_interval,
+)
+from liq.metrics.estimators import sums_sharpe
+from liq.metrics.validation import ValidationMode, all_finite
+
+# Byte translation tables between 0/1 decision bytes, ASCII binary digits, and
+# 0/1 selector bytes for ``itertools.compress``.
+_DIGITS_FROM_DECISIONS = bytes.maketrans(b"\x00\x01", b"01")
+_SELECTORS_FROM_DIGITS = bytes.maketrans(b"01", b"\x00\x01")
+
+
+@dataclass(frozen=True, slots=True)
+class PackedDecisions:
+    """Binary decisions stored one bit per event.
+
+    Bit ``i`` of ``bits`` is the decision for event ``i``. Trade counts are a
+    popcount and mask algebra (``&``, ``~``) runs word-parallel on the
+    underlying integer, so a 10M-event decision vector costs ~1.25 MB.
+    """
+
+    bits: int
+    length: int
+
+    def __post_init__(self) -> None:
+        if self.length < 0:
+            raise ValueError("length must be non-negative")
+        if self.bits < 0 or self.bits.bit_length() > self.length:
+            raise ValueError("bits must fit within length")
+
+    def __len__(self) -> int:
+        return self.length
+
+    @property
+    def trade_count(self) -> int:
+        """Number of events with a decision of 1."""
+
+        return self.bits.bit_count()
+
+    @classmethod
+    def from_bytes(cls, data: bytes, length: int) -> PackedDecisions:
+        """Build from little-endian packed bytes (``numpy.packbits(..., bitorder="little")``)."""
+
+        if len(data) != (length + 7) // 8:
+            raise ValueError(f"expected {(length + 7) // 8} bytes for {length} decisions")
+        bits = int.from_bytes(data, "little") & ((1 << length) - 1)
+        return cls(bits=bits, length=length)
+
+    def to_bytes(self) -> bytes:
+        """Return little-endian packed bytes, the inverse of :meth:`from_bytes`."""
+
+        return self.bits.to_bytes((self.length + 7) // 8, "little")
+
+    def unpack(self) -> tuple[int, ...]:
+        """Return the decisions as a tuple of 0/1 ints."""
+
+        return tuple(_selectors(self.bits, self.length))
+
+
+def pack_decisions(
+    values: Sequence[int] | PackedDecisions, *, name: str = "decisions"
+) -> PackedDecisions:
+    """Validate binary decisions and pack them one bit per event."""
+
+    if isinstance(values, PackedDecisions):
+        return values
+    try:
+        # ``bytes()`` of any other buffer (NumPy, array.array) copies its raw
+        # memory, several bytes per element, so only these take the fast path.
+        if not isinstance(values, (list, tuple, bytes, bytearray)):
+            raise TypeError
+        raw = bytes(values)
+    except (TypeError, ValueError):
+        # Non-int or out-of-range elements: defer to the element-wise check.
+        raw = bytes(int(value) for value in _binary_decisions(values, name=name))
+    else:
+        if bool in set(map(type, values)):
+            raise ValueError(f"{name} must be binary")
+    if raw.translate(None, b"\x00\x01"):
+        raise ValueError(f"{name} must be binary")
+    bits = int(raw.translate(_DIGITS_FROM_DECISIONS)[::-1], 2) if raw else 0
+    return PackedDecisions(bits=bits, length=len(raw))
 
 
 @dataclass(frozen=True, slots=True)
@@ -33,83 +122,316 @@ class SelectorEconomics:
 
 def compute_selector_economics(
     *,
-    reference_decision: Sequence[int],
-    candidate_decision: Sequence[int],
+    reference_decision: Sequence[int] | PackedDecisions,
+    candidate_decision: Sequence[int] | PackedDecisions,
     net_outcomes: Sequence[float],
     gross_outcomes: Sequence[float],
+    validate: ValidationMode = "full",
 ) -> SelectorEconomics:
-    """Compare fixed candidate/reference decisions over aligned event outcomes."""
-
-    reference = _binary_decisions(reference_decision, name="reference_decision")
-    candidate = _binary_decisions(candidate_decision, name="candidate_decision")
-    net = _finite_outcomes(net_outcomes, name="net_outcomes")
-    gross = _finite_outcomes(gross_outcomes, name="gross_outcomes")
-    lengths = {len(reference), len(candidate), len(net), len(gross)}
-    if len(lengths) != 1 or not reference:
-        raise ValueError("selector decisions and outcomes must be non-empty and align")
+    """Compare fixed candidate/reference decisions over aligned event outcomes.
 
-    removed = tuple(r == 1 and c == 0 for r, c in zip(reference, candidate, strict=True))
-    added = tuple(r == 0 and c == 1 for r, c in zip(reference, candidate, strict=True))
-    avoided_loss = -sum(
-        value for value, flag in zip(net, removed, strict=True) if flag and value < 0
-    )
-    missed_profit = sum(
-        value for value, flag in zip(net, removed, strict=True) if flag and value > 0
+    Decisions may be passed pre-packed (see :func:`pack_decisions`) so large
+    candidate sweeps keep one bit per event per candidate in memory.
+    ``validate`` controls the finiteness check on outcomes (see
+    :mod:`liq.metrics.validation`).
+    """
+
+    accumulator = SelectorEconomicsAccumulator()
+    accumulator.update(
+        reference_decision=reference_decision,
+        candidate_decision=candidate_decision,
+        net_outcomes=net_outcomes,
+        gross_outcomes=gross_outcomes,
+        validate=validate,
     )
-    added_net = sum(value for value, flag in zip(net, added, strict=True) if flag)
-    reference_returns = tuple(
-        value * decision for value, decision in zip(net, reference, strict=True)
+    if not accumulator.event_count:
+        raise ValueError("selector decisions and outcomes must be non-empty and align")
+    return accumulator.result()
+
+
+class SelectorEconomicsAccumulator:
+    """Incremental selector economics over streamed, aligned event chunks.
+
+    Keeps running sums and per-policy return moments (count, mean, sum of
+    squared deviations merged with Chan's parallel update), so memory stays
+    constant however many events are ingested. The Sharpe ratios match
+    :func:`compute_selector_economics` over the concatenated chunks.
+    """
+
+    def __init__(self) -> None:
+        self.event_count = 0
+        self._reference_trades = 0
+        self._candidate_trades = 0
+        self._avoided_loss = 0.0
+        self._missed_profit = 0.0
+        self._added_net = 0.0
+        self._profit_pool = 0.0
+        self._reference_total = 0.0
+        self._candidate_total = 0.0
+        self._reference_moments = (0.0, 0.0)
+        self._candidate_moments = (0.0, 0.0)
+
+    def update(
+        self,
+        *,
+        reference_decision: Sequence[int] | PackedDecisions,
+        candidate_decision: Sequence[int] | PackedDecisions,
+        net_outcomes: Sequence[float],
+        gross_outcomes: Sequence[float],
+        validate: ValidationMode = "full",
+    ) -> None:
+        """Ingest one chunk of aligned decisions and outcomes."""
+
+        reference = pack_decisions(reference_decision, name="reference_decision")
+        candidate = pack_decisions(candidate_decision, name="candidate_decision")
+        net = _finite_outcomes(net_outcomes, name="net_outcomes", validate=validate)
+        gross = _finite_outcomes(gross_outcomes, name="gross_outcomes", validate=validate)
+        if len({reference.length, candidate.length, len(net), len(gross)}) != 1:
+            raise ValueError("selector decisions and outcomes must align")
+        n = len(net)
+        if not n:
+            return
+
+        backend = get_backend()
+        negative = _sign_mask(net, float.__lt__)
+        positive = _sign_mask(net, float.__gt__)
+        removed = reference.bits & ~candidate.bits
+        added = candidate.bits & ~reference.bits
+        net_array = backend.as_array(net)
+        reference_total, reference_mean, reference_m2 = backend.masked_moments(
+            net_array, _selectors(reference.bits, n)
+        )
+        candidate_total, candidate_mean, candidate_m2 = backend.masked_moments(
+            net_array, _selectors(candidate.bits, n)
+        )
+
+        self._reference_moments = _merge_moments(
+            self.event_count, self._reference_moments, n, (reference_mean, reference_m2)
+        )
+        self._candidate_moments = _merge_moments(
+            self.event_count, self._candidate_moments, n, (candidate_mean, candidate_m2)
+        )
+        self.event_count += n
+        self._reference_trades += reference.trade_count
+        self._candidate_trades += candidate.trade_count
+        self._avoided_loss -= backend.masked_sum(net_array, _selectors(removed & negative, n))
+        self._missed_profit += backend.masked_sum(net_array, _selectors(removed & positive, n))
+        self._added_net += backend.masked_sum(net_array, _selectors(added, n))
+        gross_pool = reference.bits & _sign_mask(gross, float.__gt__)
+        self._profit_pool += backend.masked_sum(backend.as_array(gross), _selectors(gross_pool, n))
+        self._reference_total += reference_total
+        self._candidate_total += candidate_total
+
+    def merge(self, other: SelectorEconomicsAccumulator) -> None:
+        """Fold another accumulator (e.g. from a parallel worker) into this one."""
+
+        self._reference_moments = _merge_moments(
+            self.event_count,
+            self._reference_moments,
+            other.event_count,
+            other._reference_moments,
+        )
+        self._candidate_moments = _merge_moments(
+            self.event_count,
+            self._candidate_moments,
+            other.event_count,
+            other._candidate_moments,
+        )
+        self.event_count += other.event_count
+        self._reference_trades += other._reference_trades
+        self._candidate_trades += other._candidate_trades
+        self._avoided_loss += other._avoided_loss
+        self._missed_profit += other._missed_profit
+        self._added_net += other._added_net
+        self._profit_pool += other._profit_pool
+        self._reference_total += other._reference_total
+        self._candidate_total += other._candidate_total
+
+    def result(self) -> SelectorEconomics:
+        """Return economics over every event ingested so far."""
+
+        if not self.event_count:
+            raise ValueError("no selector events have been accumulated")
+        reference_sharpe = _moments_sharpe(self.event_count, self._reference_moments)
+        candidate_sharpe = _moments_sharpe(self.event_count, self._candidate_moments)
+        sharpe_delta = (
+            candidate_sharpe - reference_sharpe
+            if candidate_sharpe is not None and reference_sharpe is not None
+            else None
+        )
+        profit_pool = self._profit_pool
+        return SelectorEconomics(
+            reference_trade_count=self._reference_trades,
+            candidate_trade_count=self._candidate_trades,
+            equal_trade_count=self._reference_trades == self._candidate_trades,
+            avoided_loss=self._avoided_loss,
+            missed_profit=self._missed_profit,
+            avoided_loss_minus_missed_profit=self._avoided_loss - self._missed_profit,
+            added_net_pnl=self._added_net,
+            net_pnl_delta=self._candidate_total - self._reference_total,
+            base_gross_profit_pool=profit_pool,
+            missed_profit_fraction=self._missed_profit / profit_pool if profit_pool > 0 else None,
+            reference_sharpe=reference_sharpe,
+            candidate_sharpe=candidate_sharpe,
+            sharpe_delta=sharpe_delta,
+        )
+
+
+@dataclass(frozen=True, slots=True)
+class SelectorBootstrap:
+    """Bootstrap confidence intervals for the headline selector deltas."""
+
+    net_pnl_delta: ConfidenceInterval
+    sharpe_delta: ConfidenceInterval
+    avoided_loss_minus_missed_profit: ConfidenceInterval
+    n_resamples: int
+    confidence: float
+    method: ResampleMethod
+
+
+def bootstrap_selector_economics(
+    *,
+    reference_decision: Sequence[int] | PackedDecisions,
+    candidate_decision: Sequence[int] | PackedDecisions,
+    net_outcomes: Sequence[float],
+    gross_outcomes: Sequence[float],
+    n_resamples: int = 10_000,
+    confidence: float = 0.95,
+    method: ResampleMethod = "iid",
+    block_length: int = 1,
+    seed: int = 0,
+    chunk_size: int = 1_000,
+    workers: int | None = None,
+    validate: ValidationMode = "full",
+) -> SelectorBootstrap:
+    """Percentile bootstrap CIs for net P&L, Sharpe and avoided-loss deltas.
+
+    Events are resampled jointly (iid or block, see
+    :func:`liq.metrics.bootstrap.resample_indices`). Decisions are packed and
+    outcomes validated once; the six per-event contribution columns built
+    from them are reduced per chunk of resamples by
+    :func:`liq.metrics.bootstrap.bootstrap_column_sums`, so each replicate is
+    a few sums from the backend instead of a full
+    :func:`compute_selector_economics` call.
+    """
+
+    reference = pack_decisions(reference_decision, name="reference_decision")
+    candidate = pack_decisions(candidate_decision, name="candidate_decision")
+    net = _finite_outcomes(net_outcomes, name="net_outcomes", validate=validate)
+    gross = _finite_outcomes(gross_outcomes, name="gross_outcomes", validate=validate)
+    point = compute_selector_economics(
+        reference_decision=reference,
+        candidate_decision=candidate,
+        net_outcomes=net,
+        gross_outcomes=gross,
+        validate="off",  # checked above
     )
-    candidate_returns = tuple(
-        value * decision for value, decision in zip(net, candidate, strict=True)
+    n = len(net)
+    reference_returns = tuple(map(mul, net, _selectors(reference.bits, n)))
+    candidate_returns = tuple(map(mul, net, _selectors(candidate.bits, n)))
+    removed = _selectors(reference.bits & ~candidate.bits, n)
+    columns = (
+        tuple(c - r for r, c in zip(reference_returns, candidate_returns, strict=True)),
+        tuple(-value * flag for value, flag in zip(net, removed, strict=True)),
+        reference_returns,
+        tuple(value * value for value in reference_returns),
+        candidate_returns,
+        tuple(value * value for value in candidate_returns),
     )
-    reference_sharpe = _sharpe(reference_returns)
-    candidate_sharpe = _sharpe(candidate_returns)
-    sharpe_delta = (
-        candidate_sharpe - reference_sharpe
-        if candidate_sharpe is not None and reference_sharpe is not None
-        else None
+    sums = bootstrap_column_sums(
+        columns,
+        n_resamples=n_resamples,
+        method=method,
+        block_length=block_length,
+        seed=seed,
+        chunk_size=chunk_size,
+        workers=workers,
     )
-    profit_pool = sum(
-        value for value, decision in zip(gross, reference, strict=True) if decision and value > 0
+    pnl, sharpe, avoided = zip(*(_selector_replicate(n, row) for row in sums), strict=True)
+    return SelectorBootstrap(
+        net_pnl_delta=percentile_interval(point.net_pnl_delta, pnl, confidence=confidence),
+        sharpe_delta=percentile_interval(point.sharpe_delta, sharpe, confidence=confidence),
+        avoided_loss_minus_missed_profit=percentile_interval(
+            point.avoided_loss_minus_missed_profit, avoided, confidence=confidence
+        ),
+        n_resamples=n_resamples,
+        confidence=confidence,
+        method=method,
     )
-    return SelectorEconomics(
-        reference_trade_count=sum(reference),
-        candidate_trade_count=sum(candidate),
-        equal_trade_count=sum(reference) == sum(candidate),
-        avoided_loss=avoided_loss,
-        missed_profit=missed_profit,
-        avoided_loss_minus_missed_profit=avoided_loss - missed_profit,
-        added_net_pnl=added_net,
-        net_pnl_delta=sum(candidate_returns) - sum(reference_returns),
-        base_gross_profit_pool=profit_pool,
-        missed_profit_fraction=missed_profit / profit_pool if profit_pool > 0 else None,
-        reference_sharpe=reference_sharpe,
-        candidate_sharpe=candidate_sharpe,
-        sharpe_delta=sharpe_delta,
+
+
+def _selector_replicate(count: int, sums: Sequence[float]) -> tuple[float | None, ...]:
+    pnl, avoided, ref, ref_sq, cand, cand_sq = sums
+    ref_sharpe = sums_sharpe(count, ref, ref_sq)
+    cand_sharpe = sums_sharpe(count, cand, cand_sq)
+    sharpe = (
+        cand_sharpe - ref_sharpe if cand_sharpe is not None and ref_sharpe is not None else None
     )
+    return pnl, sharpe, avoided
 
 
 def _binary_decisions(values: Sequence[int], *, name: str) -> tuple[int, ...]:
     normalized = tuple(values)
-    if any(isinstance(value, bool) or value not in (0, 1) for value in normalized):
+    try:
+        binary = bool not in set(map(type, normalized)) and set(normalized) <= {0, 1}
+    except TypeError:  # unhashable elements
+        binary = False
+    if not binary:
         raise ValueError(f"{name} must be binary")
     return normalized
 
 
-def _finite_outcomes(values: Sequence[float], *, name: str) -> tuple[float, ...]:
-    normalized = tuple(float(value) for value in values)
-    if not all(math.isfinite(value) for value in normalized):
+def _finite_outcomes(
+    values: Sequence[float], *, name: str, validate: ValidationMode = "full"
+) -> tuple[float, ...]:
+    normalized = tuple(map(float, values))
+    if not all_finite(normalized, validate):
         raise ValueError(f"{name} must be finite")
     return normalized
 
 
-def _sharpe(values: Sequence[float]) -> float | None:
-    if len(values) < 2:
+def _selectors(bits: int, length: int) -> bytes:
+    """Unpack a bitmask into 0/1 selector bytes, event 0 first."""
+
+    if not length:
+        return b""
+    return format(bits, f"0{length}b").encode("ascii")[::-1].translate(_SELECTORS_FROM_DIGITS)
+
+
+def _sign_mask(values: tuple[float, ...], compare: Callable[[float, float], bool]) -> int:
+    """Bitmask of events whose value compares true against zero."""
+
+    flags = bytes(map(compare, values, repeat(0.0)))
+    return int(flags.translate(_DIGITS_FROM_DECISIONS)[::-1], 2) if flags else 0
+
+
+def _merge_moments(
+    count_a: int, moments_a: tuple[float, float], count_b: int, moments_b: tuple[float, float]
+) -> tuple[float, float]:
+    if not count_a:
+        return moments_b
+    if not count_b:
+        return moments_a
+    count = count_a + count_b
+    delta = moments_b[0] - moments_a[0]
+    mean = moments_a[0] + delta * count_b / count
+    m2 = moments_a[1] + moments_b[1] + delta**2 * count_a * count_b / count
+    return mean, m2
+
+
+def _moments_sharpe(count: int, moments: tuple[float, float]) -> float | None:
+    if count < 2:
         return None
-    mean = sum(values) / len(values)
-    variance = sum((value - mean) ** 2 for value in values) / (len(values) - 1)
-    return mean / math.sqrt(variance) if variance > 0 else None
+    variance = moments[1] / (count - 1)
+    return moments[0] / math.sqrt(variance) if variance > 0 else None
 
 
-__all__ = ["SelectorEconomics", "compute_selector_economics"]
+__all__ = [
+    "PackedDecisions",
+    "SelectorBootstrap",
+    "SelectorEconomics",
+    "SelectorEconomicsAccumulator",
+    "bootstrap_selector_economics",
+    "compute_selector_economics",
+    "pack_decisions",
+]
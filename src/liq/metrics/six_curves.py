@@ -13,7 +13,9 @@ comparisons are honest by construction:
   comparator for any levered book (leverage is beta plus financing cost,
   never alpha; a levered curve that beats ``a`` but not ``a3`` shows no excess)
 
-Pure Decimal arithmetic; orchestration and IO live in ``liq-runner``.
+Pure Decimal arithmetic (compounding runs through the active
+:mod:`liq.metrics.backend`, whose ``compound`` kernel is exact Decimal on
+every built-in backend); orchestration and IO live in ``liq-runner``.
 """
 
 from __future__ import annotations
@@ -22,6 +24,8 @@ from dataclasses import dataclass, field
 from datetime import date
 from decimal import Decimal
 
+from liq.metrics.backend import get_backend
+from liq.metrics.instrumentation import stage, traced
 from liq.metrics.tax_curves import (
     CurveFResult,
     OpenTaxPosition,
@@ -30,7 +34,6 @@ from liq.metrics.tax_curves import (
     compute_curve_f,
 )
 
-_CENT = Decimal("0.01")
 _ONE = Decimal("1")
 
 
@@ -70,15 +73,6 @@ class SixCurveResult:
     f: CurveFResult
 
 
-def _compound(start: Decimal, returns: tuple[Decimal, ...]) -> tuple[Decimal, ...]:
-    nav = start
-    series: list[Decimal] = []
-    for r in returns:
-        nav = nav * (_ONE + r)
-        series.append(nav.quantize(_CENT))
-    return tuple(series)
-
-
 def _validate(inputs: SixCurveInputs) -> tuple[Decimal, ...]:
     n = len(inputs.dates)
     if n == 0:
@@ -103,23 +97,36 @@ def _validate(inputs: SixCurveInputs) -> tuple[Decimal, ...]:
     return financing
 
 
+@traced("six_curves")
 def compute_six_curves(inputs: SixCurveInputs) -> SixCurveResult:
     """Compute the full curve set from aligned per-period inputs."""
-    financing = _validate(inputs)
+    n_periods = len(inputs.dates)
+    with stage("six_curves.validate", count=n_periods):
+        financing = _validate(inputs)
     w = inputs.sleeve_weight
     core_w = _ONE - w
 
-    blended = tuple(
-        core_w * a + w * b
-        for a, b in zip(inputs.baseline_returns, inputs.overlay_returns, strict=True)
-    )
-    shortfall = tuple(c - cost for c, cost in zip(blended, inputs.measured_costs, strict=True))
-    levered = tuple(
-        inputs.leverage * a - (inputs.leverage - _ONE) * fin
-        for a, fin in zip(inputs.baseline_returns, financing, strict=True)
-    )
-
-    curve_e = _compound(inputs.starting_capital, shortfall)
+    with stage("six_curves.returns", count=n_periods):
+        blended = tuple(
+            core_w * a + w * b
+            for a, b in zip(inputs.baseline_returns, inputs.overlay_returns, strict=True)
+        )
+        shortfall = tuple(c - cost for c, cost in zip(blended, inputs.measured_costs, strict=True))
+        levered = tuple(
+            inputs.leverage * a - (inputs.leverage - _ONE) * fin
+            for a, fin in zip(inputs.baseline_returns, financing, strict=True)
+        )
+
+    compound = get_backend().compound
+    with stage("six_curves.compound", count=n_periods):
+        curve_e = compound(inputs.starting_capital, shortfall)
+        curves = {
+            "a": compound(inputs.starting_capital, inputs.baseline_returns),
+            "b": compound(inputs.starting_capital, inputs.overlay_returns),
+            "c": compound(inputs.starting_capital, blended),
+            "d": compound(inputs.starting_capital * w, inputs.overlay_returns),
+            "a3": compound(inputs.starting_capital, levered),
+        }
     curve_f = compute_curve_f(
         pre_tax_nav=curve_e[-1],
         realized_events=inputs.tax_events,
@@ -131,11 +138,11 @@ def compute_six_curves(inputs: SixCurveInputs) -> SixCurveResult:
 
     return SixCurveResult(
         dates=inputs.dates,
-        a=_compound(inputs.starting_capital, inputs.baseline_returns),
-        b=_compound(inputs.starting_capital, inputs.overlay_returns),
-        c=_compound(inputs.starting_capital, blended),
-        d=_compound(inputs.starting_capital * w, inputs.overlay_returns),
+        a=curves["a"],
+        b=curves["b"],
+        c=curves["c"],
+        d=curves["d"],
         e=curve_e,
-        a3=_compound(inputs.starting_capital, levered),
+        a3=curves["a3"],
         f=curve_f,
     )
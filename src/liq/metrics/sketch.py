@@ -0,0 +1,105 @@
+"""Mergeable streaming quantile sketch.
+
+:class:`QuantileSketch` is a compact KLL-style sketch (Karnin, Lang &
+Liberty 2016). Values enter level 0. When a level outgrows its capacity it is
+sorted and every other item (random offset) is promoted to the next level
+with twice the weight. Capacities shrink geometrically towards the lower
+levels, so memory stays ``O(k)`` whatever the stream length.
+
+Until the first compaction the sketch holds every value, and
+:meth:`QuantileSketch.quantile` matches the panel's linear-interpolation
+quantile exactly. After that it returns a stored value whose weighted rank
+is within roughly ``1 / k`` of the requested one. Sketches with the same
+``k`` merge level by level, so per-book or per-worker sketches can be
+combined.
+"""
+
+from __future__ import annotations
+
+import random
+from collections.abc import Iterable
+from itertools import accumulate
+
+from liq.metrics.estimators import quantile
+
+_SHRINK = 2.0 / 3.0
+
+
+class QuantileSketch:
+    """Streaming, mergeable approximate quantiles over floats."""
+
+    def __init__(self, k: int = 512, *, seed: int | None = 0) -> None:
+        if k < 8:
+            raise ValueError(f"k must be at least 8, got {k}")
+        self.k = k
+        self.count = 0
+        self._levels: list[list[float]] = [[]]
+        self._rng = random.Random(seed)
+
+    @property
+    def is_exact(self) -> bool:
+        """True while no value has been compacted away."""
+        return len(self._levels) == 1
+
+    def update(self, value: float) -> None:
+        """Add one value."""
+        level0 = self._levels[0]
+        level0.append(value)
+        self.count += 1
+        if len(level0) > self._capacity(0):
+            self._compress()
+
+    def extend(self, values: Iterable[float]) -> None:
+        """Add many values."""
+        for value in values:
+            self.update(value)
+
+    def merge(self, other: QuantileSketch) -> None:
+        """Fold ``other`` (built with the same ``k``) into this sketch."""
+        if other.k != self.k:
+            raise ValueError(f"cannot merge sketches with k={self.k} and k={other.k}")
+        while len(self._levels) < len(other._levels):
+            self._levels.append([])
+        for level, items in zip(self._levels, other._levels, strict=False):
+            level.extend(items)
+        self.count += other.count
+        self._compress()
+
+    def quantile(self, p: float) -> float:
+        """Approximate ``p``-quantile (exact until the first compaction)."""
+        if not 0.0 <= p <= 1.0:
+            raise ValueError(f"quantile level must be in [0, 1], got {p}")
+        if self.count == 0:
+            raise ValueError("quantile of an empty sketch")
+        if self.is_exact:
+            return quantile(sorted(self._levels[0]), p)
+        weighted = sorted(
+            (value, 1 << height) for height, items in enumerate(self._levels) for value in items
+        )
+        cumulative = list(accumulate(weight for _, weight in weighted))
+        target = p * (cumulative[-1] - 1)
+        for (value, _), rank in zip(weighted, cumulative, strict=True):
+            if rank > target:
+                return value
+        return weighted[-1][0]  # pragma: no cover - target < total weight
+
+    def _capacity(self, height: int) -> int:
+        depth = len(self._levels) - 1 - height
+        return max(2, int(self.k * _SHRINK**depth))
+
+    def _compress(self) -> None:
+        height = 0
+        while height < len(self._levels):
+            items = self._levels[height]
+            if len(items) > self._capacity(height):
+                if height + 1 == len(self._levels):
+                    self._levels.append([])
+                items.sort()
+                # An odd leftover stays at this level with its own weight.
+                keep = [items.pop()] if len(items) % 2 else []
+                self._levels[height + 1].extend(items[self._rng.randrange(2) :: 2])
+                self._levels[height] = keep
+            height += 1
+
+
+__all__ = ["QuantileSketch"]
@@ -13,6 +13,8 @@ from datetime import date
 from decimal import ROUND_HALF_UP, Decimal
 from typing import Literal
 
+from liq.metrics.instrumentation import stage, traced
+
 DOLLAR = Decimal("0.01")
 
 EventCharacter = Literal[
@@ -166,6 +168,7 @@ def terminal_open_position_tax(
     raise ValueError(f"unknown terminal assumption: {policy.terminal_assumption}")
 
 
+@traced("curve_f")
 def compute_curve_f(
     *,
     pre_tax_nav: Decimal,
@@ -176,15 +179,17 @@ def compute_curve_f(
     period_end: date | None = None,
 ) -> CurveFResult:
     """Compute F1 realized, F2 liquidation-adjusted, and F3 terminal-policy NAV."""
-    f1_tax = realized_tax(
-        realized_events,
-        policy,
-        period_start=period_start,
-        period_end=period_end,
-    )
-    mtm_tax = mark_to_market_tax(open_positions, policy)
-    f2_tax = _money(f1_tax + mtm_tax)
-    f3_tax = _money(f1_tax + terminal_open_position_tax(open_positions, policy))
+    with stage("curve_f.realized_tax", count=len(realized_events)):
+        f1_tax = realized_tax(
+            realized_events,
+            policy,
+            period_start=period_start,
+            period_end=period_end,
+        )
+    with stage("curve_f.open_positions", count=len(open_positions)):
+        mtm_tax = mark_to_market_tax(open_positions, policy)
+        f2_tax = _money(f1_tax + mtm_tax)
+        f3_tax = _money(f1_tax + terminal_open_position_tax(open_positions, policy))
 
     nav = _money(pre_tax_nav)
     return CurveFResult(
@@ -0,0 +1,131 @@
+"""Bulk input validation shared by the metric entry points.
+
+Per-element ``isinstance`` loops used to cost more than the metrics they
+guarded. The checks here work per *type*, not per element:
+
+* Typed arrays (``array.array``, ``memoryview``, anything with a NumPy-style
+  ``dtype``) are validated from their type code / dtype alone.
+* Python sequences are reduced to the set of element types in one C-level
+  pass (``set(map(type, values))``); each distinct type is then checked once.
+  Only when a bad type is present does a Python loop run, to report the
+  index of the first offender.
+* Finiteness is one C-level ``sum``: a finite total proves every element is
+  finite (any ``nan`` / ``inf`` poisons it). Only a non-finite total, which
+  may also be overflow of large finite values, falls back to an element scan.
+
+Entry points take ``validate="full" | "sample" | "off"``. ``"sample"`` checks
+an evenly strided subset of at most :data:`SAMPLE_SIZE` elements (cheap
+spot-checks for trusted pipelines); ``"off"`` skips validation entirely, and
+invalid input then fails or misbehaves downstream.
+"""
+
+from __future__ import annotations
+
+import math
+from array import array
+from collections.abc import Iterable, Sequence
+from typing import Any, Literal, cast
+
+ValidationMode = Literal["full", "sample", "off"]
+
+VALIDATION_MODES: tuple[ValidationMode, ...] = ("full", "sample", "off")
+SAMPLE_SIZE = 1024
+
+# Element type implied by a typed container's code: struct format characters
+# for array / memoryview, NumPy dtype kinds otherwise.
+_FLOAT_CODES = frozenset("efd")
+_INT_CODES = frozenset("bBhHiIlLqQnN")
+_KIND_TYPES: dict[str, type] = {"f": float, "i": int, "u": int, "b": bool}
+
+
+def as_sequence(values: Iterable[Any]) -> Sequence[Any]:
+    """``values`` itself when it supports ``len`` and indexing, else a list."""
+    if isinstance(values, (list, tuple, array, memoryview)):
+        return values
+    if hasattr(values, "dtype"):  # NumPy-style array
+        return cast("Sequence[Any]", values)
+    return list(values)
+
+
+def element_type(values: Sequence[Any]) -> type | None:
+    """Python type every element of a typed array converts to; None for plain sequences."""
+    if isinstance(values, (array, memoryview)):
+        code = values.typecode if isinstance(values, array) else values.format[-1:]
+        if code in _FLOAT_CODES:
+            return float
+        if code in _INT_CODES:
+            return int
+        return None
+    kind = getattr(getattr(values, "dtype", None), "kind", None)
+    return _KIND_TYPES.get(kind) if isinstance(kind, str) else None
+
+
+def stride(values: Sequence[Any], mode: ValidationMode) -> int:
+    """Step between checked elements under ``mode``; 0 means check nothing."""
+    if mode == "full":
+        return 1
+    if mode == "sample":
+        return max(1, len(values) // SAMPLE_SIZE)
+    if mode == "off":
+        return 0
+    raise ValueError(f"validate must be one of {VALIDATION_MODES}, got {mode!r}")
+
+
+def sample(values: Sequence[Any], mode: ValidationMode) -> Sequence[Any]:
+    """The elements ``mode`` asks to check."""
+    step = stride(values, mode)
+    if step == 1:
+        return values
+    return values[::step] if step else ()
+
+
+def check_types(
+    values: Sequence[Any],
+    accepted: type | tuple[type, ...],
+    *,
+    message: str,
+    rejected: type | tuple[type, ...] = (),
+    mode: ValidationMode = "full",
+) -> None:
+    """Raise ``TypeError(message)`` unless every checked element is ``accepted``.
+
+    ``message`` is formatted with ``type`` (the offending type name) and
+    ``index``. Subclasses of ``rejected`` fail even if they are also
+    ``accepted`` (e.g. ``bool`` is an ``int``).
+    """
+    step = stride(values, mode)
+    if not step or not len(values):
+        return
+    implied = element_type(values)
+    checked = values if step == 1 or implied is not None else values[::step]
+    types = {implied} if implied is not None else set(map(type, checked))
+    bad = {t for t in types if not issubclass(t, accepted) or issubclass(t, rejected)}
+    if not bad:
+        return
+    if implied is not None:
+        raise TypeError(message.format(type=implied.__name__, index=0))
+    for position, value in enumerate(checked):
+        if type(value) in bad:
+            raise TypeError(message.format(type=type(value).__name__, index=position * step))
+
+
+def all_finite(values: Sequence[float], mode: ValidationMode = "full") -> bool:
+    """True when every checked element is finite."""
+    checked = sample(values, mode)
+    total = cast(Any, checked).sum() if hasattr(checked, "dtype") else sum(checked, 0.0)
+    if math.isfinite(total):
+        return True
+    return all(map(math.isfinite, checked))
+
+
+__all__ = [
+    "SAMPLE_SIZE",
+    "VALIDATION_MODES",
+    "ValidationMode",
+    "all_finite",
+    "as_sequence",
+    "check_types",
+    "element_type",
+    "sample",
+    "stride",
+]
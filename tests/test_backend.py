@@ -0,0 +1,357 @@
+"""Tests for the compute backend registry and cross-backend parity."""
+
+from __future__ import annotations
+
+import random
+from array import array
+from dataclasses import asdict
+from datetime import UTC, datetime, timedelta
+from decimal import Decimal
+
+import pytest
+
+from liq.metrics import backend as backend_module
+from liq.metrics.backend import (
+    ENV_VAR,
+    Backend,
+    available_backends,
+    get_backend,
+    register_backend,
+    use_backend,
+)
+from liq.metrics.cost_stress import CostScenario, compute_cost_stress, uniform_cost_scenarios
+from liq.metrics.drawdown import compounded_equity, max_drawdown
+from liq.metrics.panel import compute_metrics_panel, factorize_events
+from liq.metrics.performance import PerformanceAnalyzer
+from liq.metrics.prediction import summarize_classification, summarize_regression
+from liq.metrics.selector import compute_selector_economics
+from liq.metrics.six_curves import SixCurveInputs, compute_six_curves
+from liq.metrics.tax_curves import TaxPolicy, TaxRates
+
+RNG = random.Random(7)
+NET = [RNG.gauss(0.0005, 0.01) for _ in range(400)]
+GROSS = [r + 0.0002 for r in NET]
+DAILY = [RNG.gauss(0.0003, 0.008) for _ in range(120)]
+BENCH = [0.6 * r + RNG.gauss(0.0, 0.004) for r in DAILY]
+EVENTS = [f"e{RNG.randrange(37)}" for _ in NET]
+
+
+def _approx(value: object) -> object:
+    if isinstance(value, dict):
+        return {k: _approx(v) for k, v in value.items()}
+    if isinstance(value, float):
+        return pytest.approx(value, rel=1e-9, abs=1e-12)
+    return value
+
+
+@pytest.fixture
+def numpy_backend() -> Backend:
+    pytest.importorskip("numpy")
+    return get_backend("numpy")
+
+
+@pytest.fixture
+def clean_registry(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(backend_module, "_FACTORIES", dict(backend_module._FACTORIES))
+    monkeypatch.setattr(backend_module, "_INSTANCES", {})
+    monkeypatch.delenv(ENV_VAR, raising=False)
+
+
+def _missing() -> Backend:
+    raise ImportError("not installed")
+
+
+class TestRegistry:
+    def test_python_backend_is_always_available(self) -> None:
+        assert "python" in available_backends()
+        assert get_backend("python").name == "python"
+        assert get_backend(" Python ") is get_backend("python")
+
+    def test_env_var_selects_backend(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setenv(ENV_VAR, "python")
+        assert get_backend().name == "python"
+
+    def test_unknown_backend_raises(self) -> None:
+        with pytest.raises(ValueError, match="unknown backend 'fortran'"):
+            get_backend("fortran")
+
+    @pytest.mark.usefixtures("clean_registry")
+    def test_default_is_the_reference_even_with_numpy_installed(self) -> None:
+        register_backend("numpy", Backend)
+        assert get_backend().name == "python"
+        assert get_backend("auto") is get_backend("numpy")
+
+    @pytest.mark.usefixtures("clean_registry")
+    def test_auto_falls_back_to_python(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        register_backend("numpy", _missing)
+        monkeypatch.setenv(ENV_VAR, "auto")
+        assert get_backend().name == "python"
+        assert "numpy" not in available_backends()
+
+    @pytest.mark.usefixtures("clean_registry")
+    def test_explicit_unavailable_backend_raises(self) -> None:
+        register_backend("numpy", _missing)
+        with pytest.raises(ImportError):
+            get_backend("numpy")
+
+    def test_use_backend_overrides_env(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setenv(ENV_VAR, "fortran")
+        custom = Backend()
+        with use_backend(custom) as active:
+            assert active is custom
+            assert get_backend() is custom
+            with use_backend("python"):
+                assert get_backend() is get_backend("python")
+            assert get_backend() is custom
+
+    @pytest.mark.usefixtures("clean_registry")
+    def test_registered_backend_is_dispatched(self) -> None:
+        calls: list[int] = []
+
+        class Counting(Backend):
+            name = "counting"
+
+            def central_moments(self, values):  # type: ignore[no-untyped-def]
+                calls.append(len(values))
+                return super().central_moments(values)
+
+        register_backend("counting", Counting)
+        with use_backend("counting"):
+            compute_metrics_panel(
+                trade_returns_net=NET, trade_returns_gross=GROSS, daily_returns=DAILY
+            )
+        assert calls == [len(DAILY)]
+
+
+class TestKernelParity:
+    def test_drawdown_and_segments(self, numpy_backend: Backend) -> None:
+        reference = get_backend("python")
+        curve = [1.0, 1.2, 0.9, 1.3, 0.0, 0.5, 1.4]
+        codes = factorize_events(EVENTS)
+        for kernel, args in [
+            ("max_drawdown", (curve,)),
+            ("max_drawdown", ([],)),
+            ("compounded_max_drawdown", (DAILY,)),
+            ("segment_sums", (codes.codes, codes.n_events, NET)),
+            ("bar_returns", (curve,)),
+            ("compounded_return", (DAILY,)),
+            ("select", (curve, b"\x01\x00\x01\x01")),
+            ("scenario_gross_losses", (NET, [GROSS, DAILY * 4], [[1.0, 0.0], [0.5, 2.0]])),
+        ]:
+            expected = getattr(reference, kernel)(*args)
+            actual = getattr(numpy_backend, kernel)(*args)
+            if hasattr(actual, "tolist"):
+                actual = actual.tolist()
+            assert actual == pytest.approx(expected), kernel
+        with pytest.raises(ValueError, match="equal length"):
+            numpy_backend.segment_sums([0, 1], 2, [1.0])
+
+    def test_null_draw_kernels(self, numpy_backend: Backend) -> None:
+        reference = get_backend("python")
+        values = NET[:30]
+        codes = [i % 7 for i in range(30)]
+        flips = random.Random(3).randbytes(4 * 30)
+        keys = random.Random(4).randbytes(8 * 4 * 30)
+        for draw in ("sign_flip_rows", "permuted_rows"):
+            noise = flips if draw == "sign_flip_rows" else keys
+            expected = getattr(reference, draw)(values, noise)
+            actual = getattr(numpy_backend, draw)(values, noise)
+            assert actual.tolist() == expected, draw
+            daily = numpy_backend.row_segment_sums(actual, codes, 7)
+            expected_daily = reference.row_segment_sums(expected, codes, 7)
+            assert daily.tolist() == [pytest.approx(row) for row in expected_daily], draw
+            assert numpy_backend.sharpe_ratios(daily) == pytest.approx(
+                reference.sharpe_ratios(expected_daily)
+            )
+        assert numpy_backend.sharpe_ratios([[1.0], [2.0]]) == [None, None]
+        assert numpy_backend.sharpe_ratios([[1.0, 1.0]]) == reference.sharpe_ratios([[1.0, 1.0]])
+
+    def test_masked_kernels_accept_short_selectors(self, numpy_backend: Backend) -> None:
+        reference = get_backend("python")
+        selectors = b"\x01\x00\x01"
+        assert numpy_backend.masked_sum(NET[:5], selectors) == pytest.approx(
+            reference.masked_sum(NET[:5], selectors)
+        )
+        assert numpy_backend.masked_moments(NET[:5], selectors) == pytest.approx(
+            reference.masked_moments(NET[:5], selectors)
+        )
+
+    def test_jit_loops_match_reference(self) -> None:
+        np = pytest.importorskip("numpy")
+
+        curve = [1.0, 1.2, 0.9, 1.3, 0.5]
+        assert backend_module._drawdown_loop(np.asarray(curve)) == pytest.approx(
+            get_backend("python").max_drawdown(curve)
+        )
+        assert backend_module._segment_loop(
+            np.asarray([0, 1, 0]), 2, np.asarray([1.0, 2.0, 3.0])
+        ) == [4.0, 2.0]
+
+    def test_results_are_python_types(self, numpy_backend: Backend) -> None:
+        with use_backend(numpy_backend):
+            panel = compute_metrics_panel(
+                trade_returns_net=NET,
+                trade_returns_gross=GROSS,
+                daily_returns=DAILY,
+                trade_events=EVENTS,
+            )
+        assert all(value is None or type(value) in (int, float) for value in asdict(panel).values())
+
+
+class TestNumbaParity:
+    @pytest.fixture
+    def numba_backend(self) -> Backend:
+        pytest.importorskip("numba")
+        return get_backend("numba")
+
+    def test_jit_kernels_match_reference(self, numba_backend: Backend) -> None:
+        reference = get_backend("python")
+        codes = factorize_events(EVENTS)
+        curve = [1.0, 1.2, 0.9, 1.3, 0.0, 0.5, 1.4]
+        assert numba_backend.max_drawdown(curve) == pytest.approx(reference.max_drawdown(curve))
+        assert numba_backend.max_drawdown([]) == 0.0
+        assert numba_backend.segment_sums(codes.codes, codes.n_events, NET) == pytest.approx(
+            reference.segment_sums(codes.codes, codes.n_events, NET)
+        )
+        with pytest.raises(ValueError, match="equal length"):
+            numba_backend.segment_sums([0, 1], 2, [1.0])
+
+    def test_metrics_panel(self, numba_backend: Backend) -> None:
+        def run() -> dict[str, object]:
+            return asdict(
+                compute_metrics_panel(
+                    trade_returns_net=NET,
+                    trade_returns_gross=GROSS,
+                    daily_returns=DAILY,
+                    trade_events=EVENTS,
+                )
+            )
+
+        with use_backend("python"):
+            expected = run()
+        with use_backend(numba_backend):
+            assert run() == _approx(expected)
+
+
+class TestEndToEndParity:
+    def _both(self, numpy_backend: Backend, fn):  # type: ignore[no-untyped-def]
+        with use_backend("python"):
+            expected = fn()
+        with use_backend(numpy_backend):
+            actual = fn()
+        return expected, actual
+
+    def test_metrics_panel(self, numpy_backend: Backend) -> None:
+        def run() -> dict[str, object]:
+            return asdict(
+                compute_metrics_panel(
+                    trade_returns_net=array("d", NET),
+                    trade_returns_gross=GROSS,
+                    daily_returns=DAILY,
+                    trade_events=EVENTS,
+                    benchmark_daily_returns=BENCH,
+                )
+            )
+
+        expected, actual = self._both(numpy_backend, run)
+        assert actual == _approx(expected)
+
+    def test_performance_analyzer(self, numpy_backend: Backend) -> None:
+        start = datetime(2024, 1, 1, tzinfo=UTC)
+        value = 100.0
+        curve = []
+        for i in range(300):
+            value *= 1.0 + RNG.gauss(0.0002, 0.01)
+            curve.append((start + timedelta(hours=i), Decimal(repr(round(value, 4)))))
+        labels = [(ts, "bull" if i % 70 < 40 else "bear") for i, (ts, _) in enumerate(curve)]
+
+        def run() -> list[dict[str, object]]:
+            report = PerformanceAnalyzer().analyze(curve, labels)
+            return [asdict(report.aggregate)] + [asdict(m) for m in report.by_regime.values()]
+
+        expected, actual = self._both(numpy_backend, run)
+        assert actual == [_approx(row) for row in expected]
+
+    def test_prediction(self, numpy_backend: Backend) -> None:
+        y_true = [RNG.randrange(4) for _ in range(300)]
+        y_pred = [y if RNG.random() < 0.6 else RNG.randrange(5) for y in y_true]
+        targets = [RNG.gauss(0.0, 1.0) for _ in range(300)]
+        preds = [t + RNG.gauss(0.0, 0.5) for t in targets]
+        log_var = [RNG.uniform(-2.0, 0.5) for _ in targets]
+
+        def run() -> tuple[dict[str, float], dict[str, float]]:
+            return (
+                summarize_classification(y_true, y_pred),
+                summarize_regression(targets, preds, log_var, coverage_sigmas=(1, 2, 3)),
+            )
+
+        expected, actual = self._both(numpy_backend, run)
+        assert actual == tuple(_approx(part) for part in expected)
+
+    def test_selector(self, numpy_backend: Backend) -> None:
+        reference = [int(RNG.random() < 0.5) for _ in NET]
+        candidate = [int(RNG.random() < 0.4) for _ in NET]
+
+        def run() -> dict[str, object]:
+            return compute_selector_economics(
+                reference_decision=reference,
+                candidate_decision=candidate,
+                net_outcomes=NET,
+                gross_outcomes=GROSS,
+            ).as_dict()
+
+        expected, actual = self._both(numpy_backend, run)
+        assert actual == _approx(expected)
+
+    def test_cost_stress(self, numpy_backend: Backend) -> None:
+        costs = [[abs(r) * 0.1 for r in NET], [0.0002] * len(NET), [abs(r) * 0.05 for r in GROSS]]
+        scenarios = {
+            **uniform_cost_scenarios([0.5, 1.0, 2.0]),
+            "skewed": CostScenario(2.0, 0.5, 3.0),
+        }
+
+        def run() -> dict[str, dict[str, object]]:
+            results = compute_cost_stress(
+                trade_returns_gross=GROSS,
+                commission=costs[0],
+                spread=costs[1],
+                impact=costs[2],
+                scenarios=scenarios,
+            )
+            return {scenario_id: asdict(result) for scenario_id, result in results.items()}
+
+        expected, actual = self._both(numpy_backend, run)
+        assert actual == _approx(expected)
+
+    def test_six_curves_are_exact(self, numpy_backend: Backend) -> None:
+        n = 50
+        returns = tuple(Decimal(f"{RNG.gauss(0.0002, 0.01):.6f}") for _ in range(n))
+        inputs = SixCurveInputs(
+            dates=tuple(datetime(2024, 1, 1).date() + timedelta(days=i) for i in range(n)),
+            starting_capital=Decimal("1000000"),
+            baseline_returns=returns,
+            overlay_returns=tuple(reversed(returns)),
+            sleeve_weight=Decimal("0.25"),
+            measured_costs=(Decimal("0.0001"),) * n,
+            tax_policy=TaxPolicy(
+                rates=TaxRates(
+                    short_term=Decimal("0.37"),
+                    long_term=Decimal("0.2"),
+                    qualified_dividend=Decimal("0.2"),
+                    nonqualified_dividend=Decimal("0.37"),
+                )
+            ),
+        )
+        expected, actual = self._both(numpy_backend, lambda: compute_six_curves(inputs))
+        assert actual == expected
+
+
+def test_reference_kernels_share_the_drawdown_and_event_engines() -> None:
+    reference = Backend()
+    assert reference.max_drawdown(DAILY) == max_drawdown(DAILY)
+    assert reference.compounded_max_drawdown(DAILY) == max_drawdown(compounded_equity(DAILY))
+    codes = factorize_events(EVENTS)
+    with use_backend("python"):
+        assert codes.segment_sums(iter(NET)) == reference.segment_sums(
+            codes.codes, codes.n_events, NET
+        )
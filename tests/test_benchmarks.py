@@ -0,0 +1,94 @@
+"""Smoke test: the offline benchmark runner still imports and runs."""
+
+from __future__ import annotations
+
+import importlib
+import json
+import math
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parents[1]
+
+
+def test_runner_times_a_case_and_writes_baseline(tmp_path: Path) -> None:
+    baseline = tmp_path / "baselines.json"
+    env = {**os.environ, "PYTHONPATH": str(ROOT / "src")}
+    command = [sys.executable, "-m", "benchmarks", "-k", "classification", "--max-size", "1000"]
+    subprocess.run(
+        [*command, "--repeat", "1", "--baseline", str(baseline), "--update-baseline"],
+        cwd=ROOT,
+        env=env,
+        check=True,
+        capture_output=True,
+    )
+    results = json.loads(baseline.read_text())["results"]
+    assert list(results) == ["summarize_classification[1000]"]
+
+    # A baseline far faster than reality is flagged and fails --check.
+    baseline.write_text(json.dumps({"results": {"summarize_classification[1000]": 1e-12}}))
+    proc = subprocess.run(
+        [*command, "--repeat", "1", "--baseline", str(baseline), "--check"],
+        cwd=ROOT,
+        env=env,
+        capture_output=True,
+        text=True,
+    )
+    assert proc.returncode == 1
+    assert "REGRESSION" in proc.stdout
+
+
+def test_fit_exponent_recovers_synthetic_growth(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.syspath_prepend(str(ROOT))
+    fit_exponent = importlib.import_module("benchmarks.scaling").fit_exponent
+    sizes = [1_000, 4_000, 16_000, 64_000]
+    assert fit_exponent(sizes, [2e-6 * n for n in sizes]) == pytest.approx(1.0)
+    assert fit_exponent(sizes, [3e-9 * n * n for n in sizes]) == pytest.approx(2.0)
+    n_log_n = fit_exponent(sizes, [n * math.log(n) for n in sizes])
+    assert n_log_n is not None and 1.0 < n_log_n < 1.25
+    assert fit_exponent(sizes, [0.5] * 4) == pytest.approx(0.0)
+    assert fit_exponent([1_000], [1.0]) is None
+    assert fit_exponent([1_000, 1_000], [1.0, 2.0]) is None
+    assert fit_exponent(sizes, [0.0, 0.0, 0.0, 1.0]) is None  # zero timings are dropped
+
+
+def test_scaling_report_structure(tmp_path: Path) -> None:
+    # Wall-clock exponents are too noisy for the unit suite; only the shape
+    # of the report is checked here.
+    report_path = tmp_path / "scaling.json"
+    env = {**os.environ, "PYTHONPATH": str(ROOT / "src")}
+    subprocess.run(
+        [
+            sys.executable,
+            "-m",
+            "benchmarks.scaling",
+            "-k",
+            "classification",
+            "--min-size",
+            "500",
+            "--max-size",
+            "2000",
+            "--factor",
+            "2",
+            "--repeat",
+            "1",
+            "--json",
+            str(report_path),
+        ],
+        cwd=ROOT,
+        env=env,
+        check=True,
+        capture_output=True,
+    )
+    report = json.loads(report_path.read_text())
+    assert report["threshold"] == 1.25
+    entry = report["cases"]["summarize_classification"]
+    assert entry["sizes"] == [500, 1000, 2000]
+    assert len(entry["seconds"]) == len(entry["peak_bytes"]) == 3
+    assert isinstance(entry["time_exponent"], float)
+    assert isinstance(entry["memory_exponent"], float)
+    assert isinstance(entry["superlinear"], bool)
@@ -0,0 +1,119 @@
+"""Tests for the seeded bootstrap resampling engine."""
+
+from __future__ import annotations
+
+import random
+from collections.abc import Sequence
+
+import pytest
+
+from liq.metrics.backend import use_backend
+from liq.metrics.bootstrap import (
+    ConfidenceInterval,
+    bootstrap_column_sums,
+    bootstrap_replicates,
+    percentile_interval,
+    resample_indices,
+)
+
+
+def _mean(columns: Sequence[Sequence[float]], indices: Sequence[int]) -> tuple[float | None, ...]:
+    return (sum(map(columns[0].__getitem__, indices)) / len(indices),)
+
+
+class TestResampleIndices:
+    @pytest.mark.parametrize("method", ["iid", "circular", "stationary"])
+    def test_draws_full_length_in_range(self, method: str) -> None:
+        indices = resample_indices(50, method=method, block_length=7, rng=random.Random(3))  # type: ignore[arg-type]
+        assert len(indices) == 50
+        assert all(0 <= index < 50 for index in indices)
+
+    def test_circular_blocks_are_contiguous_and_wrap(self) -> None:
+        indices = resample_indices(10, method="circular", block_length=4, rng=random.Random(1))
+        for start in range(0, 8, 4):
+            block = indices[start : start + 4]
+            assert all((b - a) % 10 == 1 for a, b in zip(block, block[1:], strict=False))
+
+    def test_rejects_bad_arguments(self) -> None:
+        rng = random.Random(0)
+        with pytest.raises(ValueError, match="positive"):
+            resample_indices(0, rng=rng)
+        with pytest.raises(ValueError, match="block_length"):
+            resample_indices(5, method="circular", block_length=0, rng=rng)
+        with pytest.raises(ValueError, match="method"):
+            resample_indices(5, method="jackknife", block_length=2, rng=rng)  # type: ignore[arg-type]
+        with pytest.raises(ValueError, match="method"):
+            resample_indices(5, method="jackknife", rng=rng)  # type: ignore[arg-type]
+
+
+class TestBootstrapReplicates:
+    def test_seeded_and_chunk_invariant_across_workers(self) -> None:
+        values = tuple(float(i % 7) for i in range(40))
+        kwargs = {"n_resamples": 30, "seed": 5, "chunk_size": 8, "method": "stationary"}
+        serial = bootstrap_replicates((values,), _mean, block_length=3, **kwargs)  # type: ignore[arg-type]
+        again = bootstrap_replicates((values,), _mean, block_length=3, **kwargs)  # type: ignore[arg-type]
+        pooled = bootstrap_replicates((values,), _mean, block_length=3, workers=2, **kwargs)  # type: ignore[arg-type]
+        assert len(serial) == 30
+        assert serial == again == pooled
+
+    def test_rejects_misaligned_columns_and_counts(self) -> None:
+        with pytest.raises(ValueError, match="align"):
+            bootstrap_replicates(((1.0,), (1.0, 2.0)), _mean, n_resamples=5)
+        with pytest.raises(ValueError, match="n_resamples"):
+            bootstrap_replicates(((1.0,),), _mean, n_resamples=0)
+        with pytest.raises(ValueError, match="chunk_size"):
+            bootstrap_replicates(((1.0,),), _mean, n_resamples=1, chunk_size=0)
+
+
+class TestBootstrapColumnSums:
+    COLUMNS = (
+        tuple(float(i % 7) for i in range(40)),
+        tuple(float(i % 5) - 2.0 for i in range(40)),
+    )
+    KWARGS = {"n_resamples": 30, "seed": 5, "chunk_size": 8, "method": "circular"}
+
+    def test_matches_per_resample_gathers(self) -> None:
+        def totals(
+            columns: Sequence[Sequence[float]], indices: Sequence[int]
+        ) -> tuple[float | None, ...]:
+            return tuple(sum(map(column.__getitem__, indices)) for column in columns)
+
+        expected = bootstrap_replicates(self.COLUMNS, totals, block_length=3, **self.KWARGS)  # type: ignore[arg-type]
+        with use_backend("python"):
+            sums = bootstrap_column_sums(self.COLUMNS, block_length=3, **self.KWARGS)  # type: ignore[arg-type]
+        assert [tuple(row) for row in sums] == expected
+
+    def test_numpy_index_matrix_matches_reference(self) -> None:
+        pytest.importorskip("numpy")
+        with use_backend("python"):
+            expected = bootstrap_column_sums(self.COLUMNS, block_length=3, **self.KWARGS)  # type: ignore[arg-type]
+        with use_backend("numpy"):
+            actual = bootstrap_column_sums(self.COLUMNS, block_length=3, **self.KWARGS)  # type: ignore[arg-type]
+            pooled = bootstrap_column_sums(
+                self.COLUMNS,
+                block_length=3,
+                workers=2,
+                **self.KWARGS,  # type: ignore[arg-type]
+            )
+        assert actual == pooled
+        assert actual == [pytest.approx(row) for row in expected]
+
+    def test_rejects_misaligned_columns(self) -> None:
+        with pytest.raises(ValueError, match="align"):
+            bootstrap_column_sums(((1.0,), (1.0, 2.0)), n_resamples=5)
+
+
+class TestPercentileInterval:
+    def test_interpolates_tails_and_skips_undefined(self) -> None:
+        replicates = [float(i) for i in range(101)] + [None]
+        interval = percentile_interval(50.0, replicates, confidence=0.9)
+        assert interval.estimate == 50.0
+        assert interval.low == pytest.approx(5.0)
+        assert interval.high == pytest.approx(95.0)
+
+    def test_all_undefined_replicates_give_open_interval(self) -> None:
+        assert percentile_interval(None, [None, None]) == ConfidenceInterval(None, None, None)
+
+    def test_rejects_invalid_confidence(self) -> None:
+        with pytest.raises(ValueError, match="confidence"):
+            percentile_interval(0.0, [0.0], confidence=1.0)
@@ -0,0 +1,124 @@
+"""Tests for the columnar (Arrow / buffer-protocol) panel adapter."""
+
+from __future__ import annotations
+
+import struct
+from array import array
+
+import pytest
+
+from liq.metrics.columnar import (
+    compute_metrics_panel_columnar,
+    compute_metrics_panel_from_tables,
+    event_codes,
+    float_column,
+)
+from liq.metrics.panel import compute_metrics_panel
+
+TRADES_NET = [0.01, -0.005, 0.02, -0.01, 0.004]
+TRADES_GROSS = [0.012, -0.003, 0.022, -0.008, 0.005]
+EVENTS = ["a", "b", "a", "c", "b"]
+DAILY = [0.01, -0.005, 0.02, -0.01, 0.004]
+BENCH = [0.008, -0.004, 0.015, -0.008, 0.003]
+
+
+def _expected() -> object:
+    return compute_metrics_panel(
+        trade_returns_net=TRADES_NET,
+        trade_returns_gross=TRADES_GROSS,
+        daily_returns=DAILY,
+        trade_events=EVENTS,
+        benchmark_daily_returns=BENCH,
+    )
+
+
+class TestBufferColumns:
+    def test_float_column_views_without_copy(self) -> None:
+        values = array("d", DAILY)
+        view = float_column(values)
+        assert isinstance(view, memoryview)
+        values[0] = 1.0
+        assert view[0] == 1.0
+        assert list(float_column(struct.pack("<3d", 1.0, 2.0, 3.0))) == [1.0, 2.0, 3.0]
+        assert float_column(DAILY) is DAILY
+
+    def test_float_column_rejects_non_float_buffers(self) -> None:
+        with pytest.raises(TypeError, match="float64"):
+            float_column(array("i", [1, 2]), name="daily_returns")
+
+    def test_event_codes(self) -> None:
+        codes = event_codes(EVENTS)
+        assert list(codes.codes) == [0, 1, 0, 2, 1]
+        assert codes.labels == ("a", "b", "c")
+        buffer_codes = event_codes(array("q", [3, 0, 3]))
+        assert list(buffer_codes.codes) == [3, 0, 3]
+        assert buffer_codes.n_events == 4
+        assert buffer_codes.segment_sums([1.0, 2.0, 3.0]) == [2.0, 0.0, 0.0, 4.0]
+        with pytest.raises(TypeError, match="integer codes"):
+            event_codes(array("d", [1.0]))
+        with pytest.raises(ValueError, match=r"codes must be in \[0, 3\), got -1\.\.2"):
+            event_codes(array("q", [2, -1, 0]))
+
+    def test_panel_matches_list_inputs(self) -> None:
+        panel = compute_metrics_panel_columnar(
+            trade_returns_net=array("d", TRADES_NET),
+            trade_returns_gross=array("d", TRADES_GROSS),
+            daily_returns=array("d", DAILY),
+            trade_events=array("b", [0, 1, 0, 2, 1]),
+            benchmark_daily_returns=array("d", BENCH),
+        )
+        assert panel == _expected()
+
+    def test_panel_from_column_mapping(self) -> None:
+        panel = compute_metrics_panel_from_tables(
+            {"net_return": TRADES_NET, "gross_return": TRADES_GROSS, "event": EVENTS},
+            {"return": DAILY, "spy": BENCH},
+            event_column="event",
+            benchmark_column="spy",
+        )
+        assert panel == _expected()
+
+    def test_misaligned_events_raise(self) -> None:
+        with pytest.raises(ValueError, match="align"):
+            compute_metrics_panel_columnar(
+                trade_returns_net=TRADES_NET,
+                trade_returns_gross=TRADES_GROSS,
+                daily_returns=DAILY,
+                trade_events=EVENTS[:2],
+            )
+
+
+class TestArrowColumns:
+    def test_arrow_table_with_dictionary_events(self) -> None:
+        pa = pytest.importorskip("pyarrow")
+        trades = pa.table(
+            {
+                "net_return": pa.chunked_array([TRADES_NET[:2], TRADES_NET[2:]]),
+                "gross_return": TRADES_GROSS,
+                "event": pa.array(EVENTS).dictionary_encode(),
+            }
+        )
+        daily = pa.table({"return": DAILY, "spy": BENCH})
+
+        panel = compute_metrics_panel_from_tables(
+            trades, daily, event_column="event", benchmark_column="spy"
+        )
+
+        assert panel == _expected()
+
+    def test_arrow_slices_and_nulls(self) -> None:
+        pa = pytest.importorskip("pyarrow")
+        assert list(float_column(pa.array(DAILY).slice(1, 2))) == DAILY[1:3]
+        with pytest.raises(ValueError, match="null"):
+            float_column(pa.array([1.0, None]))
+        with pytest.raises(TypeError, match="Arrow float64"):
+            float_column(pa.array([1, 2]))
+        codes = event_codes(pa.array(EVENTS))
+        assert (list(codes.codes), codes.labels) == ([0, 1, 0, 2, 1], ("a", "b", "c"))
+        encoded = event_codes(pa.array(EVENTS).dictionary_encode())
+        assert encoded.labels == ("a", "b", "c")
+        corrupt = pa.DictionaryArray.from_arrays(
+            pa.array([0, 5], pa.int32()), pa.array(["a"]), safe=False
+        )
+        with pytest.raises(ValueError, match="codes must be in"):
+            event_codes(corrupt)
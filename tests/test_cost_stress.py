@@ -0,0 +1,133 @@
+"""Tests for the cost-stress scenario engine."""
+
+from __future__ import annotations
+
+import math
+import random
+import statistics
+
+import pytest
+
+from liq.metrics.cost_stress import (
+    CostScenario,
+    compute_cost_stress,
+    cost_stress_net_returns,
+    uniform_cost_scenarios,
+)
+from liq.metrics.panel import compute_metrics_panel
+
+GROSS = [0.012, -0.003, 0.022, -0.008]
+COMMISSION = [0.001, 0.001, 0.001, 0.001]
+SPREAD = [0.0005, 0.0005, 0.0005, 0.0005]
+IMPACT = [0.0005, 0.0005, 0.0005, 0.0005]
+
+
+def _stress(scenarios: dict[str, CostScenario]) -> dict:
+    return compute_cost_stress(
+        trade_returns_gross=GROSS,
+        commission=COMMISSION,
+        spread=SPREAD,
+        impact=IMPACT,
+        scenarios=scenarios,
+    )
+
+
+def test_each_scenario_matches_direct_recomputation() -> None:
+    rng = random.Random(8)
+    gross = [rng.gauss(0.002, 0.01) for _ in range(200)]
+    costs = [[abs(rng.gauss(0.0005, 0.0002)) for _ in range(200)] for _ in range(3)]
+    scenarios = {"base": CostScenario(), "skewed": CostScenario(2.0, 0.5, 3.0)}
+
+    results = compute_cost_stress(
+        trade_returns_gross=gross,
+        commission=costs[0],
+        spread=costs[1],
+        impact=costs[2],
+        scenarios=scenarios,
+    )
+
+    for scenario_id, scenario in scenarios.items():
+        net = [
+            g - scenario.commission * c - scenario.spread * s - scenario.impact * i
+            for g, c, s, i in zip(gross, *costs, strict=True)
+        ]
+        result = results[scenario_id]
+        assert result.net_return == pytest.approx(sum(net), abs=1e-12)
+        assert result.sharpe == pytest.approx(statistics.mean(net) / statistics.stdev(net))
+        assert result.profit_factor == pytest.approx(
+            sum(v for v in net if v > 0) / -sum(v for v in net if v < 0)
+        )
+
+
+def test_profit_factor_from_sorted_breakevens_matches_rescan() -> None:
+    rng = random.Random(3)
+    gross = [rng.gauss(0.001, 0.01) for _ in range(300)]
+    # Rebates (negative costs) and zero costs exercise every breakeven branch.
+    costs = [[rng.choice((0.0, -0.0005, rng.uniform(0.0, 0.002))) for _ in range(300)]]
+    costs += [[rng.uniform(0.0, 0.001) for _ in range(300)] for _ in range(2)]
+    scenarios = uniform_cost_scenarios([0.0, 0.5, 1.0, 2.0, 5.0, 20.0])
+    scenarios["mixed"] = CostScenario(1.5, 0.0, 4.0)
+    scenarios["mixed_x2"] = CostScenario(3.0, 0.0, 8.0)
+
+    results = compute_cost_stress(
+        trade_returns_gross=gross,
+        commission=costs[0],
+        spread=costs[1],
+        impact=costs[2],
+        scenarios=scenarios,
+    )
+
+    for scenario_id, scenario in scenarios.items():
+        net = [
+            g - scenario.commission * c - scenario.spread * s - scenario.impact * i
+            for g, c, s, i in zip(gross, *costs, strict=True)
+        ]
+        expected = sum(v for v in net if v > 0) / -sum(v for v in net if v < 0)
+        assert results[scenario_id].profit_factor == pytest.approx(expected, rel=1e-9)
+
+
+def test_base_scenario_feeds_metrics_panel() -> None:
+    results = _stress(uniform_cost_scenarios([1, 3]))
+    net = [g - 0.002 for g in GROSS]
+    assert set(results) == {"cost_x1", "cost_x3"}
+    assert results["cost_x1"].net_return == pytest.approx(sum(net))
+    assert results["cost_x3"].net_return == pytest.approx(sum(GROSS) - 0.024)
+
+    panel = compute_metrics_panel(
+        trade_returns_net=net,
+        trade_returns_gross=GROSS,
+        daily_returns=net,
+        cost_stress=cost_stress_net_returns(results),
+    )
+    assert panel.cost_stress == {
+        "cost_x1": results["cost_x1"].net_return,
+        "cost_x3": results["cost_x3"].net_return,
+    }
+
+
+def test_no_losing_trades_and_constant_returns() -> None:
+    results = compute_cost_stress(
+        trade_returns_gross=[0.01, 0.01],
+        commission=[0.001, 0.001],
+        spread=[0.0, 0.0],
+        impact=[0.0, 0.0],
+        scenarios={"free": CostScenario.uniform(0.0), "base": CostScenario()},
+    )
+    assert math.isinf(results["free"].profit_factor)
+    assert results["free"].sharpe is None
+    assert results["base"].net_return == pytest.approx(0.018)
+
+
+def test_misaligned_or_empty_inputs_raise() -> None:
+    with pytest.raises(ValueError, match="spread"):
+        compute_cost_stress(
+            trade_returns_gross=GROSS,
+            commission=COMMISSION,
+            spread=SPREAD[:2],
+            impact=IMPACT,
+            scenarios={},
+        )
+    with pytest.raises(ValueError, match="empty"):
+        compute_cost_stress(
+            trade_returns_gross=[], commission=[], spread=[], impact=[], scenarios={}
+        )
@@ -0,0 +1,93 @@
+"""Tests for the range-query curve index."""
+
+from __future__ import annotations
+
+import random
+from datetime import UTC, datetime, timedelta
+from decimal import Decimal
+
+import pytest
+
+from liq.metrics.curve_index import CurveIndex
+from liq.metrics.performance import PerformanceAnalyzer
+
+START = datetime(2024, 1, 1, tzinfo=UTC)
+
+
+def _curve(values: list[float]) -> list[tuple[datetime, Decimal]]:
+    return [(START + timedelta(hours=i), Decimal(repr(v))) for i, v in enumerate(values)]
+
+
+def _random_curve(n: int, seed: int) -> list[tuple[datetime, Decimal]]:
+    rng = random.Random(seed)
+    value = 100.0
+    values = []
+    for _ in range(n):
+        value *= 1.0 + rng.gauss(0.0, 0.02)
+        values.append(value)
+    return _curve(values)
+
+
+def test_range_metrics_match_analyzer_on_slices() -> None:
+    curve = _random_curve(97, seed=7)
+    index = CurveIndex.from_equity_curve(curve)
+    analyzer = PerformanceAnalyzer()
+    rng = random.Random(1)
+    pairs = [
+        (0, 96),
+        (5, 5),
+        (5, 6),
+        (10, 12),
+        *((rng.randrange(97), rng.randrange(97)) for _ in range(50)),
+    ]
+    for a, b in pairs:
+        start, end = min(a, b), max(a, b)
+        expected = analyzer.analyze(curve[start : end + 1], []).aggregate
+        got = index.range_metrics(start, end, regime="aggregate")
+        assert got.num_bars == expected.num_bars
+        assert got.total_return == pytest.approx(expected.total_return, rel=1e-12, abs=1e-15)
+        assert got.max_drawdown == pytest.approx(expected.max_drawdown, rel=1e-12, abs=1e-15)
+        assert got.win_rate == expected.win_rate
+        if expected.sharpe_ratio is None:
+            assert got.sharpe_ratio is None
+        else:
+            assert got.sharpe_ratio == pytest.approx(expected.sharpe_ratio, rel=1e-9)
+
+
+def test_datetime_bounds_are_inclusive() -> None:
+    curve = _curve([100, 110, 99, 120, 90])
+    index = CurveIndex.from_equity_curve(curve)
+
+    assert index.bar_range(curve[1][0], curve[3][0]) == range(1, 4)
+    assert index.bar_range(curve[1][0] + timedelta(minutes=1)) == range(2, 5)
+    metrics = index.metrics(curve[1][0], curve[3][0])
+    assert metrics.regime == "range"
+    assert metrics.total_return == pytest.approx(120 / 110 - 1)
+    assert metrics.max_drawdown == pytest.approx(-11 / 110)
+    assert index.metrics().max_drawdown == pytest.approx(-30 / 120)
+    empty = index.metrics(START - timedelta(days=2), START - timedelta(days=1))
+    assert empty.num_bars == 0
+    assert empty.sharpe_ratio is None
+
+
+def test_flat_stretch_has_no_sharpe() -> None:
+    values = [100, 103, 97, *([105] * 30), 99, 110]
+    index = CurveIndex.from_equity_curve(_curve(values))
+    assert index.sharpe(3, 32) is None
+    assert index.max_drawdown(3, 32) == 0.0
+    assert index.sharpe(0, len(values) - 1) is not None
+
+
+def test_rejects_invalid_input() -> None:
+    with pytest.raises(ValueError, match="empty"):
+        CurveIndex([], [])
+    with pytest.raises(ValueError, match="align"):
+        CurveIndex([START], [1.0, 2.0])
+    with pytest.raises(ValueError, match="positive"):
+        CurveIndex.from_equity_curve(_curve([100, 0, 50]))
+    with pytest.raises(ValueError, match="sorted"):
+        CurveIndex([START, START - timedelta(hours=1)], [1.0, 2.0])
+    index = CurveIndex.from_equity_curve(_curve([100, 101]))
+    assert len(index) == 2
+    with pytest.raises(IndexError):
+        index.total_return(1, 2)
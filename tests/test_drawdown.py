@@ -0,0 +1,60 @@
+"""Tests for the shared drawdown engine."""
+
+from __future__ import annotations
+
+import random
+
+import pytest
+
+from liq.metrics.drawdown import (
+    DrawdownEpisode,
+    analyze_drawdowns,
+    compounded_equity,
+    max_drawdown,
+    underwater_curve,
+)
+
+CURVE = [100.0, 110.0, 99.0, 105.0, 110.0, 120.0, 90.0, 96.0, 130.0, 117.0]
+
+
+class TestAnalyzeDrawdowns:
+    def test_indexes_every_episode(self) -> None:
+        analysis = analyze_drawdowns(CURVE)
+        assert analysis.episodes == (
+            DrawdownEpisode(start=1, trough=2, recovery=4, depth=pytest.approx(0.1), duration=3),
+            DrawdownEpisode(start=5, trough=6, recovery=8, depth=pytest.approx(0.25), duration=3),
+            DrawdownEpisode(start=8, trough=9, recovery=None, depth=pytest.approx(0.1), duration=1),
+        )
+        assert analysis.max_drawdown == pytest.approx(0.25)
+
+    def test_underwater_curve_matches_helper(self) -> None:
+        analysis = analyze_drawdowns(CURVE)
+        assert list(analysis.underwater) == pytest.approx(underwater_curve(CURVE))
+        assert analysis.underwater[6] == pytest.approx(-0.25)
+        assert max(analysis.underwater) == 0.0
+
+    def test_top_k_orders_by_depth(self) -> None:
+        top = analyze_drawdowns(CURVE).top(2)
+        assert [episode.start for episode in top] == [5, 1]
+
+    def test_monotonic_and_empty_curves(self) -> None:
+        assert analyze_drawdowns([1.0, 2.0, 3.0]).episodes == ()
+        empty = analyze_drawdowns([])
+        assert empty.max_drawdown == 0.0
+        assert empty.underwater == ()
+
+    def test_matches_scalar_max_drawdown_on_random_walks(self) -> None:
+        rng = random.Random(6)
+        for _ in range(20):
+            curve = compounded_equity(rng.gauss(0.0, 0.02) for _ in range(200))
+            assert analyze_drawdowns(curve).max_drawdown == pytest.approx(max_drawdown(curve))
+            assert -min(underwater_curve(curve)) == pytest.approx(max_drawdown(curve))
+
+
+class TestHelpers:
+    def test_non_positive_peaks_count_as_flat(self) -> None:
+        assert max_drawdown([0.0, -1.0, -2.0]) == 0.0
+        assert underwater_curve([0.0, -1.0]) == [0.0, 0.0]
+
+    def test_compounded_equity_includes_start(self) -> None:
+        assert compounded_equity([0.1, -0.5], start=2.0) == pytest.approx([2.0, 2.2, 1.1])
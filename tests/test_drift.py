@@ -1,8 +1,11 @@
 """Tests for liq.metrics.drift module."""
 
+import random
+import statistics
+
 import pytest
 
-from liq.metrics.drift import summarize_drift
+from liq.metrics.drift import DriftMonitor, summarize_drift
 
 
 class TestSummarizeDrift:
@@ -95,3 +98,84 @@ class TestSummarizeDrift:
 
         assert isinstance(stats["max"], float)
         assert isinstance(stats["mean"], float)
+
+
+class TestDriftMonitor:
+    """Tests for the streaming DriftMonitor."""
+
+    def test_summary_matches_batch_statistics(self) -> None:
+        rng = random.Random(3)
+        values = [abs(rng.gauss(0.0, 0.2)) for _ in range(1000)]
+        monitor = DriftMonitor(sketch_k=2048)
+        monitor.extend(x for x in values)
+
+        summary = monitor.summary()
+        batch = summarize_drift(values)
+        assert summary["max"] == batch["max"]
+        assert summary["mean"] == pytest.approx(batch["mean"], rel=1e-12)
+        assert summary["count"] == 1000.0
+        assert summary["min"] == min(values)
+        assert summary["variance"] == pytest.approx(statistics.variance(values), rel=1e-9)
+        assert summary["std"] == pytest.approx(statistics.stdev(values), rel=1e-9)
+        assert summary["p50"] == pytest.approx(statistics.median(values))
+        assert set(summary) >= {"p90", "p99"}
+
+    def test_empty_summary_matches_summarize_drift(self) -> None:
+        summary = DriftMonitor(quantiles=(0.999,)).summary()
+        assert {k: summary[k] for k in ("max", "mean")} == summarize_drift([])
+        assert summary["p99.9"] == 0.0
+
+    def test_top_features_keep_each_features_largest_statistic(self) -> None:
+        monitor = DriftMonitor(top_k=2)
+        monitor.extend({"a": 0.1, "b": 0.5, "c": 0.3})
+        monitor.update(0.9, feature="a")
+        monitor.update(0.2, feature="b")
+        monitor.update(0.95, feature="b")
+        monitor.update(0.05, feature="d")
+        monitor.update(1.0)
+
+        assert monitor.top_features() == [("b", 0.95), ("a", 0.9)]
+        assert monitor.count == 8
+        assert monitor.max == 1.0
+
+    def test_merge_matches_single_monitor(self) -> None:
+        rng = random.Random(5)
+        features = {f"f{i}": abs(rng.gauss(0.0, 1.0)) for i in range(5000)}
+        whole = DriftMonitor(top_k=5, sketch_k=256)
+        whole.extend(features)
+        left = DriftMonitor(top_k=5, sketch_k=256)
+        right = DriftMonitor(top_k=5, sketch_k=256, seed=1)
+        items = list(features.items())
+        left.extend(dict(items[:1700]))
+        right.extend(dict(items[1700:]))
+        left.merge(right)
+        left.merge(DriftMonitor(top_k=5, sketch_k=256))
+
+        assert left.count == whole.count
+        assert left.mean == pytest.approx(whole.mean, rel=1e-12)
+        assert left.variance == pytest.approx(whole.variance, rel=1e-9)
+        assert left.top_features() == whole.top_features()
+        assert left.quantile(0.5) == pytest.approx(statistics.median(features.values()), rel=0.05)
+
+    def test_incompatible_merge_leaves_monitor_unchanged(self) -> None:
+        monitor = DriftMonitor(sketch_k=64)
+        monitor.extend({"a": 1.0, "b": 2.0})
+        before = (monitor.summary(), monitor.top_features())
+        other = DriftMonitor(sketch_k=128)
+        other.extend({"c": 5.0, "d": 4.0})
+        with pytest.raises(ValueError, match="sketch_k"):
+            monitor.merge(other)
+        assert (monitor.summary(), monitor.top_features()) == before
+
+    def test_validation_and_arguments(self) -> None:
+        monitor = DriftMonitor()
+        with pytest.raises(TypeError, match="must be numeric"):
+            monitor.extend([0.1, "x"])  # type: ignore[list-item]
+        with pytest.raises(ValueError, match="top_k"):
+            DriftMonitor(top_k=-1)
+        with pytest.raises(ValueError, match="quantiles"):
+            DriftMonitor(quantiles=(1.5,))
+        untracked = DriftMonitor(top_k=0)
+        untracked.update(0.4, feature="a")
+        assert untracked.top_features() == []
+        assert untracked.variance == 0.0
@@ -0,0 +1,113 @@
+"""Tests for windowed drift over a (time × features) matrix."""
+
+from __future__ import annotations
+
+import math
+import random
+
+import pytest
+
+from liq.metrics.drift import summarize_drift
+from liq.metrics.drift_windows import windowed_drift
+from liq.metrics.histograms import FeatureReferences, ReferenceHistogram
+
+RNG = random.Random(5)
+# 600 rows x 3 features; feature "b" shifts after row 400.
+MATRIX = [
+    (RNG.gauss(0.0, 1.0), RNG.gauss(1.5 if t >= 400 else 0.0, 1.0), RNG.uniform(0.0, 1.0))
+    for t in range(600)
+]
+FEATURES = ("a", "b", "c")
+
+
+def _column(index: int, start: int, stop: int) -> list[float]:
+    return [row[index] for row in MATRIX[start:stop]]
+
+
+class TestFixedReference:
+    def test_matches_direct_scoring_of_each_window(self) -> None:
+        windows = windowed_drift(
+            MATRIX, window=50, step=20, features=FEATURES, reference_rows=200, metric="ks"
+        )
+        assert [w.start for w in windows] == list(range(200, 551, 20))
+        references = FeatureReferences.from_columns(
+            {f: _column(i, 0, 200) for i, f in enumerate(FEATURES)}
+        )
+        for w in windows:
+            live = {f: _column(i, w.start, w.stop) for i, f in enumerate(FEATURES)}
+            expected = references.drift_statistics(live, metric="ks")
+            assert w.statistics == pytest.approx(expected)
+            assert w.summary == summarize_drift(list(w.statistics.values()))
+
+    def test_shifted_feature_dominates_late_windows(self) -> None:
+        early, late = windowed_drift(
+            MATRIX, window=200, features=FEATURES, reference_rows=200, bins=5
+        )
+        assert (early.start, late.stop) == (200, 600)
+        assert late.statistics["b"] > 1.0 > 0.1 > early.statistics["b"]
+        assert late.summary["max"] == late.statistics["b"]
+
+    def test_cached_references_score_from_the_first_row(self) -> None:
+        references = FeatureReferences(
+            {i: ReferenceHistogram.from_values(_column(i, 0, 200)) for i in range(3)}
+        )
+        windows = windowed_drift(MATRIX, window=300, reference=references, metric="js")
+        assert [(w.start, w.stop) for w in windows] == [(0, 300), (300, 600)]
+        assert windows[0].statistics[2] == pytest.approx(
+            references[2].compare(_column(2, 0, 300)).js
+        )
+
+
+class TestRollingReference:
+    def test_compares_each_window_with_the_rows_before_it(self) -> None:
+        windows = windowed_drift(
+            MATRIX, window=40, step=30, features=FEATURES, reference_rows=100, rolling=True
+        )
+        for w in windows:
+            edges = ReferenceHistogram.from_values(_column(1, 0, 100)).edges
+            lagged = ReferenceHistogram.from_values(_column(1, w.start - 100, w.start), edges=edges)
+            assert w.statistics["b"] == pytest.approx(
+                lagged.compare(_column(1, w.start, w.stop)).psi
+            )
+
+    def test_rolling_reference_absorbs_a_level_shift(self) -> None:
+        fixed = windowed_drift(MATRIX, window=100, features=FEATURES, reference_rows=200)
+        rolling = windowed_drift(
+            MATRIX, window=100, features=FEATURES, reference_rows=100, rolling=True
+        )
+        assert rolling[-1].statistics["b"] < fixed[-1].statistics["b"]
+
+
+def test_numpy_matrix_matches_rows() -> None:
+    np = pytest.importorskip("numpy")
+    kwargs = {"window": 60, "step": 45, "reference_rows": 150, "rolling": True}
+    assert windowed_drift(np.array(MATRIX), **kwargs) == windowed_drift(MATRIX, **kwargs)
+
+
+def test_too_few_rows_yield_no_windows() -> None:
+    assert windowed_drift(MATRIX[:220], window=50, reference_rows=200) == []
+
+
+def test_invalid_inputs() -> None:
+    with pytest.raises(ValueError, match="metric"):
+        windowed_drift(MATRIX, window=10, reference_rows=100, metric="kl")  # type: ignore[arg-type]
+    with pytest.raises(ValueError, match="window"):
+        windowed_drift(MATRIX, window=0, reference_rows=100)
+    with pytest.raises(ValueError, match="step"):
+        windowed_drift(MATRIX, window=10, step=0, reference_rows=100)
+    with pytest.raises(ValueError, match="reference_rows"):
+        windowed_drift(MATRIX, window=10)
+    with pytest.raises(ValueError, match="rolling"):
+        windowed_drift(MATRIX, window=10, reference=FeatureReferences(), rolling=True)
+    with pytest.raises(ValueError, match="positive"):
+        windowed_drift(MATRIX, window=10, reference_rows=0)
+    with pytest.raises(ValueError, match="feature keys"):
+        windowed_drift(MATRIX, window=10, reference_rows=100, features=("a",))
+    with pytest.raises(ValueError, match="at least 1000 rows"):
+        windowed_drift(MATRIX, window=10, reference_rows=1000)
+    with pytest.raises(KeyError, match="'z'"):
+        windowed_drift(MATRIX, window=10, reference=FeatureReferences(), features=("x", "y", "z"))
+    with pytest.raises(ValueError, match="finite"):
+        windowed_drift([*MATRIX, (0.0, math.nan, 0.0)], window=10, reference_rows=100)
+    with pytest.raises(ValueError):
+        windowed_drift([(1.0, 2.0), (1.0,)], window=1, reference_rows=1)
@@ -0,0 +1,32 @@
+"""Tests for the shared quantile and raw-sum Sharpe estimators."""
+
+from __future__ import annotations
+
+import math
+import statistics
+
+import pytest
+
+from liq.metrics.estimators import quantile, sums_sharpe
+
+
+def test_quantile_interpolates_between_order_statistics() -> None:
+    values = [1.0, 2.0, 4.0, 8.0]
+    assert quantile(values, 0.0) == 1.0
+    assert quantile(values, 1.0) == 8.0
+    assert quantile(values, 0.5) == pytest.approx(3.0)
+    assert quantile(values, 0.25) == pytest.approx(1.75)
+
+
+def test_sums_sharpe_matches_sample_moments() -> None:
+    values = [0.01, -0.02, 0.03, 0.005]
+    expected = statistics.mean(values) / statistics.stdev(values)
+    total = math.fsum(values)
+    total_sq = math.fsum(v * v for v in values)
+    assert sums_sharpe(len(values), total, total_sq) == pytest.approx(expected)
+
+
+def test_sums_sharpe_is_undefined_for_short_or_constant_series() -> None:
+    assert sums_sharpe(1, 0.1, 0.01) is None
+    constant = [0.1] * 10
+    assert sums_sharpe(10, sum(constant), sum(v * v for v in constant)) is None
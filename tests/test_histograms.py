@@ -0,0 +1,155 @@
+"""Tests for histogram-based distribution drift (PSI / KS / JS)."""
+
+from __future__ import annotations
+
+import json
+import math
+import random
+
+import pytest
+
+from liq.metrics.backend import get_backend
+from liq.metrics.drift import DriftMonitor
+from liq.metrics.histograms import (
+    DriftScores,
+    FeatureReferences,
+    ReferenceHistogram,
+    drift_scores,
+    js_distance,
+    ks_distance,
+    population_stability_index,
+)
+
+RNG = random.Random(11)
+REFERENCE = [RNG.gauss(0.0, 1.0) for _ in range(5000)]
+SAME = [RNG.gauss(0.0, 1.0) for _ in range(5000)]
+SHIFTED = [RNG.gauss(0.5, 1.0) for _ in range(5000)]
+
+
+class TestDistances:
+    def test_identical_distributions_have_zero_drift(self) -> None:
+        p = [0.25, 0.25, 0.5]
+        assert population_stability_index(p, p) == 0.0
+        assert ks_distance(p, p) == 0.0
+        assert js_distance(p, p) == 0.0
+
+    def test_known_values(self) -> None:
+        p = [0.5, 0.5]
+        q = [0.9, 0.1]
+        expected_psi = (0.9 - 0.5) * math.log(0.9 / 0.5) + (0.1 - 0.5) * math.log(0.1 / 0.5)
+        assert population_stability_index(p, q) == pytest.approx(expected_psi)
+        assert ks_distance(p, q) == pytest.approx(0.4)
+        assert js_distance([1.0, 0.0], [0.0, 1.0]) == pytest.approx(1.0)
+
+    def test_drift_scores_from_counts(self) -> None:
+        scores = drift_scores([5, 5], [9, 1])
+        assert scores.ks == pytest.approx(0.4)
+        with pytest.raises(ValueError, match="reference histogram"):
+            drift_scores([0, 0], [1, 1])
+
+    def test_empty_bins_are_floored_for_psi(self) -> None:
+        psi = population_stability_index([0.5, 0.5, 0.0], [0.4, 0.4, 0.2], epsilon=1e-4)
+        assert math.isfinite(psi) and psi > 0
+
+
+class TestReferenceHistogram:
+    def test_quantile_bins_hold_equal_reference_mass(self) -> None:
+        hist = ReferenceHistogram.from_values(REFERENCE, bins=10)
+        assert len(hist.counts) == 10
+        assert hist.total == len(REFERENCE)
+        assert max(hist.counts) - min(hist.counts) <= 2
+
+    def test_live_binning_uses_left_open_bins(self) -> None:
+        hist = ReferenceHistogram.from_values([0.0, 1.0, 2.0], edges=(0.0, 1.0))
+        assert hist.counts == (1, 1, 1)
+        assert hist.bin_counts([-5.0, 0.0, 0.5, 1.0, 1.5, 9.0]) == [2, 2, 2]
+
+    def test_shift_is_detected(self) -> None:
+        hist = ReferenceHistogram.from_values(REFERENCE, bins=10)
+        same = hist.compare(SAME)
+        shifted = hist.compare(SHIFTED)
+        assert same.psi < 0.02 and same.ks < 0.05
+        assert shifted.psi > 0.2 and shifted.ks > 0.15
+        assert shifted.js > same.js
+
+    def test_repeated_values_merge_edges(self) -> None:
+        hist = ReferenceHistogram.from_values([1.0] * 50 + [2.0, 3.0], bins=10)
+        assert len(hist.edges) == len(set(hist.edges))
+        assert all(hist.counts)
+        top_heavy = ReferenceHistogram.from_values([0.0] + [1.0] * 20, bins=4)
+        assert all(top_heavy.counts)
+        constant = ReferenceHistogram.from_values([4.0, 4.0, 4.0])
+        assert constant.edges == (4.0,)
+
+    def test_round_trips_through_json(self) -> None:
+        hist = ReferenceHistogram.from_values(REFERENCE, bins=5)
+        restored = ReferenceHistogram.from_dict(json.loads(json.dumps(hist.to_dict())))
+        assert restored == hist
+
+    def test_invalid_inputs(self) -> None:
+        with pytest.raises(ValueError, match="finite"):
+            ReferenceHistogram.from_values([0.0, math.nan])
+        with pytest.raises(ValueError, match="bins"):
+            ReferenceHistogram.from_values(REFERENCE, bins=1)
+        with pytest.raises(ValueError, match="two reference values"):
+            ReferenceHistogram.from_values([1.0])
+        with pytest.raises(ValueError, match="increasing"):
+            ReferenceHistogram(edges=(1.0, 0.0), counts=(1, 1, 1))
+        with pytest.raises(ValueError, match="expected 2 counts"):
+            ReferenceHistogram(edges=(0.0,), counts=(1,))
+        with pytest.raises(ValueError, match="must not be empty"):
+            ReferenceHistogram(edges=(0.0,), counts=(0, 0))
+        hist = ReferenceHistogram(edges=(0.0,), counts=(1, 1))
+        with pytest.raises(ValueError, match="live histogram"):
+            hist.compare([])
+        with pytest.raises(ValueError, match="expected 2 bin counts"):
+            hist.compare_counts([1, 2, 3])
+
+
+class TestFeatureReferences:
+    def test_scores_every_feature_from_cached_references(self) -> None:
+        references = FeatureReferences.from_columns({"a": REFERENCE, "b": REFERENCE}, bins=8)
+        cached = FeatureReferences.from_dict(json.loads(json.dumps(references.to_dict())))
+        assert len(cached) == 2
+        assert cached["a"] == references["a"]
+
+        scores = cached.compare({"a": SAME, "b": SHIFTED})
+        assert isinstance(scores["a"], DriftScores)
+        assert scores["b"].psi > scores["a"].psi
+
+        psi = cached.drift_statistics({"a": SAME, "b": SHIFTED})
+        monitor = DriftMonitor(top_k=1)
+        monitor.extend(psi)
+        assert monitor.top_features() == [("b", psi["b"])]
+        assert cached.drift_statistics({"b": SHIFTED}, metric="ks")["b"] == scores["b"].ks
+
+    def test_non_str_keys_round_trip(self) -> None:
+        hist = ReferenceHistogram(edges=(0.0,), counts=(1, 1))
+        references = FeatureReferences({0: hist, 1: hist, "a": hist, ("a", 2): hist, None: hist})
+        cached = FeatureReferences.from_dict(json.loads(json.dumps(references.to_dict())))
+        assert cached.histograms == references.histograms
+        assert list(cached.histograms) == [0, 1, "a", ("a", 2), None]
+        assert cached[1] == hist
+
+    def test_unserializable_or_colliding_keys(self) -> None:
+        hist = ReferenceHistogram(edges=(0.0,), counts=(1, 1))
+        with pytest.raises(TypeError, match="frozenset"):
+            FeatureReferences({frozenset({1}): hist}).to_dict()
+        with pytest.raises(ValueError, match="collide"):
+            FeatureReferences({1: hist, "1": hist}).to_dict()
+
+    def test_unknown_feature_or_metric(self) -> None:
+        references = FeatureReferences({"a": ReferenceHistogram(edges=(0.0,), counts=(1, 1))})
+        with pytest.raises(KeyError, match="'z'"):
+            references.compare({"z": [1.0]})
+        with pytest.raises(ValueError, match="metric"):
+            references.drift_statistics({"a": [1.0]}, metric="kl")  # type: ignore[arg-type]
+
+
+def test_numpy_binning_matches_reference() -> None:
+    pytest.importorskip("numpy")
+    edges = ReferenceHistogram.from_values(REFERENCE, bins=10).edges
+    live = SHIFTED + list(edges)
+    assert get_backend("numpy").bin_counts(live, edges) == get_backend("python").bin_counts(
+        live, edges
+    )
@@ -0,0 +1,115 @@
+"""Tests for the incremental (live) metrics panel."""
+
+from __future__ import annotations
+
+import math
+import random
+
+import pytest
+
+from liq.metrics.incremental import IncrementalMetricsPanel
+from liq.metrics.panel import InferenceInputs, MetricsPanel, compute_metrics_panel
+
+
+def _assert_panels_match(got: MetricsPanel, expected: MetricsPanel) -> None:
+    for name, value in vars(expected).items():
+        actual = getattr(got, name)
+        if isinstance(value, float) and not math.isinf(value):
+            assert actual == pytest.approx(value, rel=1e-9, abs=1e-12), name
+        else:
+            assert actual == value, name
+
+
+def test_matches_batch_panel_after_every_update() -> None:
+    rng = random.Random(11)
+    net = [rng.gauss(0.001, 0.01) for _ in range(60)]
+    gross = [r + 0.0005 for r in net]
+    events = [f"e{rng.randrange(8)}" for _ in net]
+    daily = [rng.gauss(0.0005, 0.01) for _ in range(40)]
+    bench = [0.6 * r + rng.gauss(0.0, 0.004) for r in daily]
+
+    live = IncrementalMetricsPanel()
+    for i in range(40):
+        live.add_trade(net[i], gross[i], event=events[i])
+        live.add_day(daily[i], benchmark=bench[i])
+        if i >= 1:
+            _assert_panels_match(
+                live.panel(),
+                compute_metrics_panel(
+                    trade_returns_net=net[: i + 1],
+                    trade_returns_gross=gross[: i + 1],
+                    daily_returns=daily[: i + 1],
+                    trade_events=events[: i + 1],
+                    benchmark_daily_returns=bench[: i + 1],
+                ),
+            )
+    live.add_trades(net[40:], gross[40:], events[40:])
+    inference = InferenceInputs(pbo=0.2)
+    _assert_panels_match(
+        live.panel(inference=inference, cost_stress={"cost_x2": 0.01}),
+        compute_metrics_panel(
+            trade_returns_net=net,
+            trade_returns_gross=gross,
+            daily_returns=daily,
+            trade_events=events,
+            benchmark_daily_returns=bench,
+            inference=inference,
+            cost_stress={"cost_x2": 0.01},
+        ),
+    )
+
+
+def test_without_events_or_benchmark() -> None:
+    live = IncrementalMetricsPanel()
+    live.add_trades([0.01, 0.02], [0.011, 0.021])
+    live.add_days([0.01, 0.01, 0.01])
+
+    panel = live.panel()
+    assert math.isinf(panel.profit_factor)
+    assert panel.max_single_event_contribution is None
+    assert panel.benchmark_beta is None
+    assert panel.sharpe is None
+    assert panel.skew == 0.0
+
+
+def test_long_history_uses_sketch_tails() -> None:
+    rng = random.Random(5)
+    daily = [rng.gauss(0.0, 0.01) for _ in range(5_000)]
+    live = IncrementalMetricsPanel(sketch_k=256)
+    live.add_trade(0.01, 0.01)
+    live.add_days(daily)
+
+    expected = compute_metrics_panel(
+        trade_returns_net=[0.01], trade_returns_gross=[0.01], daily_returns=daily
+    )
+    panel = live.panel()
+    assert panel.sharpe == pytest.approx(expected.sharpe, rel=1e-9)
+    assert panel.max_drawdown == pytest.approx(expected.max_drawdown, rel=1e-9)
+    assert panel.tail_loss_95 == pytest.approx(expected.tail_loss_95, abs=0.002)
+
+
+def test_rejects_empty_and_inconsistent_updates() -> None:
+    live = IncrementalMetricsPanel()
+    with pytest.raises(ValueError, match="trade returns"):
+        live.panel()
+    live.add_trade(0.01, 0.01, event="a")
+    with pytest.raises(ValueError, match="daily returns"):
+        live.panel()
+    with pytest.raises(ValueError, match="every update"):
+        live.add_trade(0.01, 0.01)
+    live.add_day(0.01)
+    with pytest.raises(ValueError, match="every update"):
+        live.add_day(0.01, benchmark=0.0)
+
+
+def test_event_heap_stays_bounded_by_live_events() -> None:
+    rng = random.Random(4)
+    live = IncrementalMetricsPanel()
+    pnl = dict.fromkeys("abc", 0.0)
+    for _ in range(5_000):
+        event = rng.choice("abc")
+        net = rng.gauss(0.0, 0.01)
+        pnl[event] += net
+        live.add_trade(net, net, event=event)
+        assert len(live._event_heap) <= 2 * len(pnl) + 16
+    assert live._largest_event_pnl() == pytest.approx(max(pnl.values()))
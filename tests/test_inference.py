@@ -0,0 +1,209 @@
+"""Tests for in-package inference statistics."""
+
+from __future__ import annotations
+
+import math
+import random
+import statistics
+
+import pytest
+
+from liq.metrics.backend import use_backend
+from liq.metrics.inference import (
+    clustered_tstat,
+    compute_inference_inputs,
+    null_percentile,
+    student_t_two_sided_pvalue,
+)
+from liq.metrics.panel import InferenceInputs, compute_metrics_panel
+
+TRADES = [0.01, -0.005, 0.02, -0.01, 0.004, 0.007]
+DAYS = ["d1", "d1", "d2", "d2", "d3", "d3"]
+
+
+class TestStudentT:
+    def test_matches_reference_values(self) -> None:
+        assert student_t_two_sided_pvalue(2.0, 10) == pytest.approx(0.0733880348, abs=1e-9)
+        assert student_t_two_sided_pvalue(-2.228138852, 10) == pytest.approx(0.05, abs=1e-9)
+        assert student_t_two_sided_pvalue(1.0, 1) == pytest.approx(0.5, abs=1e-12)
+        assert student_t_two_sided_pvalue(0.0, 5) == 1.0
+
+    def test_rejects_non_positive_df(self) -> None:
+        with pytest.raises(ValueError, match="degrees"):
+            student_t_two_sided_pvalue(1.0, 0)
+
+
+class TestClusteredTstat:
+    def test_singleton_clusters_reduce_to_classical_t(self) -> None:
+        tstat, pvalue = clustered_tstat(TRADES, list(range(len(TRADES))))
+        expected = statistics.mean(TRADES) / (statistics.stdev(TRADES) / math.sqrt(len(TRADES)))
+        assert tstat == pytest.approx(expected, rel=1e-12)
+        assert pvalue == pytest.approx(student_t_two_sided_pvalue(expected, 5))
+
+    def test_day_clusters_use_cluster_sums(self) -> None:
+        tstat, pvalue = clustered_tstat(TRADES, DAYS)
+        mean = statistics.mean(TRADES)
+        sums = [TRADES[0] + TRADES[1], TRADES[2] + TRADES[3], TRADES[4] + TRADES[5]]
+        variance = 3 / 2 * sum((s - 2 * mean) ** 2 for s in sums) / 36
+        assert tstat == pytest.approx(mean / math.sqrt(variance))
+        assert pvalue is not None and 0.0 < pvalue < 1.0
+
+    def test_single_cluster_is_undefined(self) -> None:
+        assert clustered_tstat(TRADES, ["d"] * len(TRADES)) == (None, None)
+        assert clustered_tstat([], []) == (None, None)
+        assert clustered_tstat([0.01, 0.01], ["a", "b"]) == (None, None)
+
+    def test_misaligned_clusters_raise(self) -> None:
+        with pytest.raises(ValueError, match="align"):
+            clustered_tstat(TRADES, DAYS[:2])
+
+
+class TestComputeInferenceInputs:
+    def test_fills_panel_inference_fields(self) -> None:
+        rng = random.Random(4)
+        trades = [rng.gauss(0.002, 0.01) for _ in range(200)]
+        days = [i // 5 for i in range(200)]
+        events = [i // 2 for i in range(200)]
+
+        inference = compute_inference_inputs(
+            trades,
+            trade_days=days,
+            trade_events=events,
+            n_resamples=300,
+            seed=1,
+            chunk_size=64,
+            base=InferenceInputs(deflated_sharpe=0.4, pbo=0.2),
+        )
+
+        assert inference.mean_trade_return_ci_low is not None
+        assert inference.mean_trade_return_ci_high is not None
+        assert inference.mean_trade_return_ci_low < statistics.mean(trades)
+        assert statistics.mean(trades) < inference.mean_trade_return_ci_high
+        assert inference.day_clustered_tstat == clustered_tstat(trades, days)[0]
+        assert inference.event_clustered_pvalue == clustered_tstat(trades, events)[1]
+        assert inference.deflated_sharpe == 0.4
+        assert inference.pbo == 0.2
+
+        panel = compute_metrics_panel(
+            trade_returns_net=trades,
+            trade_returns_gross=trades,
+            daily_returns=trades,
+            inference=inference,
+        )
+        assert panel.day_clustered_tstat == inference.day_clustered_tstat
+
+    def test_is_reproducible_and_skips_missing_clusters(self) -> None:
+        first = compute_inference_inputs(TRADES, n_resamples=100, method="iid", seed=3)
+        second = compute_inference_inputs(TRADES, n_resamples=100, method="iid", seed=3)
+        assert first == second
+        assert first.day_clustered_tstat is None
+        assert first.event_clustered_tstat is None
+
+    def test_empty_trades_raise(self) -> None:
+        with pytest.raises(ValueError, match="empty"):
+            compute_inference_inputs([])
+
+
+class TestNullPercentile:
+    def _trades(self, drift: float) -> tuple[list[float], list[int], list[int]]:
+        rng = random.Random(12)
+        trades = [rng.gauss(drift, 0.01) for _ in range(240)]
+        days = [i // 4 for i in range(240)]
+        events = [i // 2 for i in range(240)]
+        return trades, days, events
+
+    def test_strong_edge_sits_at_top_of_sign_flip_null(self) -> None:
+        trades, days, events = self._trades(0.01)
+        result = null_percentile(
+            trades, trade_days=days, trade_events=events, n_permutations=300, seed=2
+        )
+        panel = compute_metrics_panel(
+            trade_returns_net=trades,
+            trade_returns_gross=trades,
+            daily_returns=[sum(trades[i : i + 4]) for i in range(0, 240, 4)],
+        )
+        assert result.observed_sharpe == pytest.approx(panel.sharpe)
+        assert result.percentile == 1.0
+        assert result.n_permutations == 300
+        assert result.stopped_early is False
+
+    def test_early_stopping_and_worker_invariance(self) -> None:
+        trades, days, _ = self._trades(0.01)
+        stopped = null_percentile(
+            trades,
+            trade_days=days,
+            method="permutation",
+            n_permutations=5_000,
+            batch_size=100,
+            tolerance=0.05,
+        )
+        assert stopped.stopped_early is True
+        assert stopped.n_permutations < 5_000
+        assert stopped.half_width is not None and stopped.half_width <= 0.05
+
+        serial = null_percentile(trades, trade_days=days, n_permutations=120, batch_size=50)
+        pooled = null_percentile(
+            trades, trade_days=days, n_permutations=120, batch_size=50, workers=2
+        )
+        assert pooled == serial
+
+    def test_extreme_observed_sharpe_does_not_stop_after_one_wave(self) -> None:
+        trades, days, events = self._trades(0.01)
+        result = null_percentile(
+            trades,
+            trade_days=days,
+            trade_events=events,
+            n_permutations=1_000,
+            batch_size=10,
+            tolerance=0.05,
+        )
+        # Every null draw is below the observed Sharpe; the Wilson band at
+        # fraction 1.0 is z^2 / (2 (n + z^2)), which needs 35+ draws at 0.05.
+        assert result.percentile == 1.0
+        assert result.stopped_early is True
+        assert result.n_permutations == 40
+        assert result.half_width == pytest.approx(1.959964**2 / (2 * (40 + 1.959964**2)))
+
+    @pytest.mark.parametrize("method", ["sign_flip", "permutation"])
+    def test_backends_draw_the_same_null(self, method: str) -> None:
+        pytest.importorskip("numpy")
+        trades, days, events = self._trades(0.0005)
+        kwargs = {"trade_days": days, "trade_events": events, "method": method}
+        with use_backend("python"):
+            expected = null_percentile(trades, n_permutations=200, batch_size=64, **kwargs)  # type: ignore[arg-type]
+        with use_backend("numpy"):
+            actual = null_percentile(trades, n_permutations=200, batch_size=64, **kwargs)  # type: ignore[arg-type]
+        assert actual.observed_sharpe == pytest.approx(expected.observed_sharpe)
+        assert actual.percentile == pytest.approx(expected.percentile)
+        assert 0.0 < expected.percentile < 1.0  # type: ignore[operator]
+
+    def test_zero_return_days_enter_the_sharpe(self) -> None:
+        trades, days, _ = self._trades(0.001)
+        padded = null_percentile(trades, trade_days=days, n_days=90, n_permutations=10)
+        unpadded = null_percentile(trades, trade_days=days, n_permutations=10)
+        assert padded.observed_sharpe != unpadded.observed_sharpe
+
+    def test_undefined_observed_sharpe(self) -> None:
+        result = null_percentile([0.01, 0.01], trade_days=["d1", "d2"], n_permutations=10)
+        assert result.percentile is None
+        assert result.n_permutations == 0
+
+    @pytest.mark.parametrize(
+        ("kwargs", "message"),
+        [
+            ({"trade_days": ["d1"]}, "trade_days"),
+            ({"trade_events": ["e1"]}, "trade_events"),
+            ({"method": "bootstrap"}, "method"),
+            ({"n_permutations": 0}, "positive"),
+            ({"n_days": 1}, "n_days"),
+        ],
+    )
+    def test_rejects_invalid_inputs(self, kwargs: dict[str, object], message: str) -> None:
+        inputs: dict[str, object] = {"trade_days": ["d1", "d2"]}
+        inputs.update(kwargs)
+        with pytest.raises(ValueError, match=message):
+            null_percentile([0.01, -0.02], **inputs)  # type: ignore[arg-type]
+
+    def test_empty_trades_raise(self) -> None:
+        with pytest.raises(ValueError, match="empty"):
+            null_percentile([], trade_days=[])
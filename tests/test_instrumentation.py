@@ -0,0 +1,102 @@
+"""Tests for opt-in hot-path instrumentation."""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+from datetime import UTC, date, datetime, timedelta
+from decimal import Decimal
+from pathlib import Path
+
+import pytest
+
+from liq.metrics.instrumentation import Span, instrument, is_enabled, stage, traced
+from liq.metrics.panel import compute_metrics_panel, write_metrics_panel_csv
+from liq.metrics.performance import PerformanceAnalyzer
+from liq.metrics.six_curves import SixCurveInputs, compute_six_curves
+from liq.metrics.tax_curves import TaxPolicy, TaxRates
+
+
+def _panel() -> object:
+    return compute_metrics_panel(
+        trade_returns_net=[0.01, -0.005, 0.02],
+        trade_returns_gross=[0.011, -0.004, 0.021],
+        daily_returns=[0.01, -0.005, 0.02, 0.0],
+        trade_events=["a", "b", "a"],
+        benchmark_daily_returns=[0.008, -0.004, 0.015, 0.001],
+    )
+
+
+def test_disabled_records_nothing() -> None:
+    assert not is_enabled()
+    with stage("anything", count=3) as entered:
+        assert entered is None
+    assert stage("a") is stage("b")  # shared no-op
+
+
+def test_panel_stages_with_counts_and_parents(tmp_path: Path) -> None:
+    exported: list[Sequence[Span]] = []
+    with instrument(exporter=exported.append) as recorder:
+        assert is_enabled()
+        panel = _panel()
+        write_metrics_panel_csv(panel, tmp_path / "metrics_panel.csv")
+    assert not is_enabled()
+
+    names = [span.name for span in recorder.spans]
+    for name in (
+        "metrics_panel.validate",
+        "metrics_panel.trades",
+        "metrics_panel.moments",
+        "metrics_panel.sort",
+        "metrics_panel.drawdown",
+        "metrics_panel.events",
+        "metrics_panel.benchmark",
+        "metrics_panel",
+        "metrics_panel.write_csv",
+    ):
+        assert name in names
+    by_name = {span.name: span for span in recorder.spans}
+    assert by_name["metrics_panel.moments"].attributes == {"count": 4}
+    assert by_name["metrics_panel.events"].parent == "metrics_panel"
+    assert by_name["metrics_panel"].parent is None
+    assert all(span.end_ns >= span.start_ns for span in recorder.spans)
+    assert exported == [recorder.spans]
+    totals = recorder.totals()
+    assert totals["metrics_panel"] >= totals["metrics_panel.moments"]
+
+
+def test_analyzer_and_six_curve_stages() -> None:
+    start = datetime(2024, 1, 1, tzinfo=UTC)
+    curve = [(start + timedelta(hours=i), Decimal(100 + i)) for i in range(5)]
+    inputs = SixCurveInputs(
+        dates=(date(2026, 1, 31), date(2026, 2, 28)),
+        starting_capital=Decimal("1000"),
+        baseline_returns=(Decimal("0.01"), Decimal("0.02")),
+        overlay_returns=(Decimal("0.0"), Decimal("0.01")),
+        sleeve_weight=Decimal("0.5"),
+        measured_costs=(Decimal("0"), Decimal("0")),
+        tax_policy=TaxPolicy(rates=TaxRates.zero()),
+    )
+    with instrument() as recorder:
+        PerformanceAnalyzer().analyze(curve, [])
+        compute_six_curves(inputs)
+
+    parents = {span.name: span.parent for span in recorder.spans}
+    assert parents["performance.by_regime"] == "performance.analyze"
+    assert parents["performance.aggregate"] == "performance.analyze"
+    assert parents["six_curves.compound"] == "six_curves"
+    assert parents["curve_f"] == "six_curves"
+    assert parents["curve_f.realized_tax"] == "curve_f"
+
+
+def test_failed_stage_is_recorded_with_error() -> None:
+    @traced("outer")
+    def boom() -> None:
+        raise RuntimeError("x")
+
+    with instrument() as recorder, pytest.raises(RuntimeError):
+        boom()
+    assert recorder.spans[0].attributes == {"error": "RuntimeError"}
+    with instrument() as recorder, pytest.raises(ValueError):
+        compute_metrics_panel(trade_returns_net=[], trade_returns_gross=[], daily_returns=[0.0])
+    assert recorder.spans[0].name == "metrics_panel.validate"
+    assert recorder.spans[0].attributes["error"] == "ValueError"
@@ -0,0 +1,58 @@
+"""Tests for lazy (PEP 562) loading of the liq.metrics namespace."""
+
+from __future__ import annotations
+
+import ast
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+import liq.metrics
+
+ROOT = Path(__file__).resolve().parents[1]
+
+
+def test_every_public_name_resolves() -> None:
+    for name in liq.metrics.__all__:
+        assert getattr(liq.metrics, name) is not None
+    assert set(liq.metrics.__all__) <= set(dir(liq.metrics))
+    assert liq.metrics.MetricsPanel is liq.metrics.panel.MetricsPanel
+
+
+def test_type_stub_matches_runtime_exports() -> None:
+    stub = ast.parse((ROOT / "src" / "liq" / "metrics" / "__init__.pyi").read_text())
+    imported = {
+        alias.asname or alias.name
+        for node in stub.body
+        if isinstance(node, ast.ImportFrom)
+        for alias in node.names
+    }
+    exported = next(
+        ast.literal_eval(node.value)
+        for node in stub.body
+        if isinstance(node, ast.Assign) and getattr(node.targets[0], "id", None) == "__all__"
+    )
+    assert exported == liq.metrics.__all__
+    assert set(exported) <= imported
+
+
+def test_unknown_attribute_raises() -> None:
+    with pytest.raises(AttributeError, match="no attribute 'missing'"):
+        liq.metrics.missing  # noqa: B018
+    assert not hasattr(liq.metrics, "TYPE_CHECKING")
+
+
+def test_cold_import_loads_only_what_is_used() -> None:
+    code = (
+        "import sys\n"
+        "import liq.metrics\n"
+        "assert [m for m in sys.modules if m.startswith('liq.metrics.')] == []\n"
+        "from liq.metrics import summarize_labels\n"
+        "loaded = sorted(m for m in sys.modules if m.startswith('liq.metrics.'))\n"
+        "assert loaded == ['liq.metrics.labels', 'liq.metrics.validation'], loaded\n"
+    )
+    env = {**os.environ, "PYTHONPATH": str(ROOT / "src")}
+    subprocess.run([sys.executable, "-c", code], env=env, check=True)
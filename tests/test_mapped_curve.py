@@ -0,0 +1,133 @@
+"""Tests for memory-mapped equity curve ingestion."""
+
+from __future__ import annotations
+
+import random
+import struct
+from datetime import UTC, datetime
+from pathlib import Path
+
+import pytest
+
+from liq.metrics.mapped_curve import open_equity_curve
+from liq.metrics.performance import PerformanceAnalyzer
+
+START_NS = 1_700_000_000_000_000_000
+HOUR_NS = 3_600_000_000_000
+
+
+def _values(n: int) -> list[float]:
+    rng = random.Random(21)
+    value = 100.0
+    values = []
+    for _ in range(n):
+        value *= 1.0 + rng.gauss(0.0002, 0.01)
+        values.append(value)
+    return values
+
+
+def _records(values: list[float]) -> bytes:
+    return b"".join(
+        struct.pack("<qd", START_NS + i * HOUR_NS, value) for i, value in enumerate(values)
+    )
+
+
+def _write_npy(path: Path, values: list[float], descr: str = "<M8[ns]") -> None:
+    header = (
+        f"{{'descr': [('ts', '{descr}'), ('value', '<f8')], "
+        f"'fortran_order': False, 'shape': ({len(values)},), }}"
+    )
+    padding = 64 - (10 + len(header) + 1) % 64
+    header_bytes = (header + " " * padding + "\n").encode("latin1")
+    path.write_bytes(
+        b"\x93NUMPY\x01\x00"
+        + len(header_bytes).to_bytes(2, "little")
+        + header_bytes
+        + _records(values)
+    )
+
+
+class TestOpenEquityCurve:
+    def test_raw_records_expose_zero_copy_columns(self, tmp_path: Path) -> None:
+        values = _values(50)
+        path = tmp_path / "curve.bin"
+        path.write_bytes(b"HDR!" + _records(values))
+
+        with open_equity_curve(path, header_bytes=4) as curve:
+            assert len(curve) == 50
+            assert list(curve.values) == values
+            assert curve.timestamps[1] - curve.timestamps[0] == HOUR_NS
+            assert curve.timestamp_at(0) == datetime.fromtimestamp(1_700_000_000, UTC)
+            chunks = [list(chunk) for chunk in curve.iter_value_chunks(16)]
+            assert [len(chunk) for chunk in chunks] == [16, 16, 16, 2]
+
+    def test_npy_structured_array_with_datetime_unit(self, tmp_path: Path) -> None:
+        values = _values(10)
+        path = tmp_path / "curve.npy"
+        _write_npy(path, values)
+
+        with open_equity_curve(path, unit="s") as curve:
+            assert curve.unit == "ns"
+            equity = curve.to_equity_curve()
+        assert [float(v) for _, v in equity] == values
+        assert equity[1][0] - equity[0][0] == (
+            datetime.fromtimestamp(3600, UTC) - datetime.fromtimestamp(0, UTC)
+        )
+
+    @pytest.mark.parametrize("descr", ["<f4", "<i4"])
+    def test_rejects_unsupported_npy_dtypes(self, tmp_path: Path, descr: str) -> None:
+        path = tmp_path / "curve.npy"
+        _write_npy(path, [1.0], descr=descr)
+        with pytest.raises(ValueError, match="structured"):
+            open_equity_curve(path)
+
+    def test_rejects_truncated_or_empty_files(self, tmp_path: Path) -> None:
+        truncated = tmp_path / "truncated.bin"
+        truncated.write_bytes(_records([1.0, 2.0])[:-3])
+        with pytest.raises(ValueError, match="multiple"):
+            open_equity_curve(truncated)
+        empty = tmp_path / "empty.bin"
+        empty.write_bytes(b"")
+        with pytest.raises(ValueError, match="no records"):
+            open_equity_curve(empty)
+        fake = tmp_path / "fake.npy"
+        fake.write_bytes(b"not numpy at all")
+        with pytest.raises(ValueError, match="npy"):
+            open_equity_curve(fake)
+        with pytest.raises(ValueError, match="unit"):
+            open_equity_curve(truncated, unit="d")  # type: ignore[arg-type]
+
+
+class TestChunkedAnalysis:
+    def test_mapped_analysis_matches_in_memory_aggregate(self, tmp_path: Path) -> None:
+        values = _values(1_000)
+        path = tmp_path / "curve.bin"
+        path.write_bytes(_records(values))
+        analyzer = PerformanceAnalyzer()
+
+        with open_equity_curve(path) as curve:
+            mapped = analyzer.analyze_mapped(curve, chunk_size=64)
+            expected = analyzer.analyze(curve.to_equity_curve(), []).aggregate
+
+        assert mapped.by_regime == {}
+        assert mapped.aggregate.num_bars == expected.num_bars
+        assert mapped.aggregate.total_return == pytest.approx(expected.total_return)
+        assert mapped.aggregate.sharpe_ratio == pytest.approx(expected.sharpe_ratio)
+        assert mapped.aggregate.max_drawdown == pytest.approx(expected.max_drawdown)
+        assert mapped.aggregate.win_rate == pytest.approx(expected.win_rate)
+
+    def test_short_curves(self) -> None:
+        analyzer = PerformanceAnalyzer()
+        assert analyzer.analyze_chunks([]).num_bars == 0
+        single = analyzer.analyze_chunks([[100.0]])
+        assert single.num_bars == 1
+        assert single.sharpe_ratio is None
+        flat = analyzer.analyze_chunks([[0.0], [0.0, 0.0]])
+        assert flat.total_return == 0.0
+        assert flat.sharpe_ratio is None
+
+    def test_rejects_non_positive_chunk_size(self, tmp_path: Path) -> None:
+        path = tmp_path / "curve.bin"
+        path.write_bytes(_records([1.0]))
+        with open_equity_curve(path) as curve, pytest.raises(ValueError, match="chunk_size"):
+            next(curve.iter_value_chunks(0))
@@ -0,0 +1,126 @@
+"""Tests for deflated Sharpe and probability of backtest overfitting."""
+
+from __future__ import annotations
+
+import math
+import random
+from statistics import NormalDist
+
+import pytest
+
+from liq.metrics.overfitting import (
+    deflated_sharpe_from_panel,
+    deflated_sharpe_ratio,
+    expected_max_sharpe,
+    probability_of_backtest_overfitting,
+)
+from liq.metrics.panel import compute_metrics_panel
+
+
+class TestDeflatedSharpe:
+    def test_expected_max_sharpe_reference_value(self) -> None:
+        # Bailey & Lopez de Prado: ~2.53 standard deviations for 100 trials.
+        assert expected_max_sharpe(100, 1.0) == pytest.approx(2.5306, abs=1e-4)
+        assert expected_max_sharpe(1, 4.0) == 0.0
+
+    def test_single_trial_normal_returns_is_probabilistic_sharpe(self) -> None:
+        dsr = deflated_sharpe_ratio(
+            sharpe=0.1,
+            n_observations=250,
+            skew=0.0,
+            excess_kurtosis=0.0,
+            n_trials=1,
+            trial_sharpe_variance=0.0,
+        )
+        expected = NormalDist().cdf(0.1 * math.sqrt(249) / math.sqrt(1 + 0.1**2 / 2))
+        assert dsr == pytest.approx(expected)
+
+    def test_more_trials_deflate_more(self) -> None:
+        kwargs = {
+            "sharpe": 0.15,
+            "n_observations": 500,
+            "skew": -0.5,
+            "excess_kurtosis": 3.0,
+            "trial_sharpe_variance": 0.002,
+        }
+        few = deflated_sharpe_ratio(n_trials=5, **kwargs)  # type: ignore[arg-type]
+        many = deflated_sharpe_ratio(n_trials=5_000, **kwargs)  # type: ignore[arg-type]
+        assert few is not None and many is not None
+        assert many < few
+
+    def test_from_panel_uses_panel_moments(self) -> None:
+        rng = random.Random(2)
+        daily = [rng.gauss(0.001, 0.01) for _ in range(300)]
+        panel = compute_metrics_panel(
+            trade_returns_net=daily, trade_returns_gross=daily, daily_returns=daily
+        )
+        assert panel.sharpe is not None
+        assert deflated_sharpe_from_panel(
+            panel, n_trials=20, trial_sharpe_variance=0.001
+        ) == deflated_sharpe_ratio(
+            sharpe=panel.sharpe,
+            n_observations=300,
+            skew=panel.skew,
+            excess_kurtosis=panel.excess_kurtosis,
+            n_trials=20,
+            trial_sharpe_variance=0.001,
+        )
+
+    def test_undefined_inputs(self) -> None:
+        assert (
+            deflated_sharpe_ratio(
+                sharpe=0.1,
+                n_observations=1,
+                skew=0.0,
+                excess_kurtosis=0.0,
+                n_trials=1,
+                trial_sharpe_variance=0.0,
+            )
+            is None
+        )
+        with pytest.raises(ValueError, match="n_trials"):
+            expected_max_sharpe(0, 1.0)
+        with pytest.raises(ValueError, match="variance"):
+            expected_max_sharpe(2, -1.0)
+
+
+class TestProbabilityOfBacktestOverfitting:
+    def test_dominant_trial_is_never_overfit(self) -> None:
+        rng = random.Random(5)
+        matrix = [[rng.gauss(0.0, 1.0) for _ in range(80)] for _ in range(10)]
+        matrix[3] = [value + 2.0 for value in matrix[3]]
+        result = probability_of_backtest_overfitting(matrix, n_partitions=8)
+        assert result.n_splits == 70
+        assert result.pbo == 0.0
+        assert all(logit > 0 for logit in result.logits)
+
+    def test_pure_noise_is_overfit_about_half_the_time(self) -> None:
+        rng = random.Random(9)
+        matrix = [[rng.gauss(0.0, 1.0) for _ in range(120)] for _ in range(30)]
+        result = probability_of_backtest_overfitting(matrix, n_partitions=10)
+        assert result.n_splits == 252
+        assert 0.25 < result.pbo < 0.75
+
+    def test_process_pool_matches_serial(self) -> None:
+        rng = random.Random(1)
+        matrix = [[rng.gauss(0.0, 1.0) for _ in range(40)] for _ in range(6)]
+        serial = probability_of_backtest_overfitting(matrix, n_partitions=6)
+        pooled = probability_of_backtest_overfitting(
+            matrix, n_partitions=6, workers=2, chunk_size=7
+        )
+        assert pooled == serial
+
+    @pytest.mark.parametrize(
+        ("matrix", "partitions", "message"),
+        [
+            ([[0.0] * 20], 4, "two trials"),
+            ([[0.0] * 20, [0.0] * 19], 4, "same periods"),
+            ([[0.0] * 20, [0.0] * 20], 3, "even"),
+            ([[0.0] * 3, [0.0] * 3], 4, "periods"),
+        ],
+    )
+    def test_rejects_invalid_matrices(
+        self, matrix: list[list[float]], partitions: int, message: str
+    ) -> None:
+        with pytest.raises(ValueError, match=message):
+            probability_of_backtest_overfitting(matrix, n_partitions=partitions)
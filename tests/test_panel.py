@@ -11,6 +11,7 @@ from liq.metrics.panel import (
     InferenceInputs,
     MetricsPanel,
     compute_metrics_panel,
+    factorize_events,
     write_metrics_panel_csv,
 )
 
@@ -86,6 +87,19 @@ class TestEventContribution:
         # Event sums: e1 = 0.005, e2 = 0.02, e3 = -0.01; largest / total net.
         assert panel.max_single_event_contribution == pytest.approx(0.02 / 0.015)
 
+    def test_factorized_events_match_strings(self) -> None:
+        events = ["e1", "e1", "e2", "e3"]
+        codes = factorize_events(iter(events))
+        assert list(codes.codes) == [0, 0, 1, 2]
+        assert codes.labels == ("e1", "e2", "e3")
+        assert len(codes) == 4
+        assert codes.segment_sums(TRADES_NET) == pytest.approx([0.005, 0.02, -0.01])
+        assert _panel(trade_events=codes) == _panel(trade_events=events)
+
+    def test_factorized_events_must_align(self) -> None:
+        with pytest.raises(ValueError, match="trade_events"):
+            _panel(trade_events=factorize_events(["e1"]))
+
     def test_without_events_is_none(self) -> None:
         assert _panel().max_single_event_contribution is None
 
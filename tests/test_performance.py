@@ -7,12 +7,15 @@ from decimal import Decimal
 
 import pytest
 
+from liq.metrics.backend import use_backend
 from liq.metrics.performance import (
     ComparisonResult,
     PerformanceAnalyzer,
     PerformanceReport,
     RegimeMetrics,
+    RegimeSegment,
 )
+from liq.metrics.resample import ResampledEquityCurve
 
 
 @pytest.fixture
@@ -161,6 +164,56 @@ class TestPerformanceAnalyzer:
         assert "unknown" in report.by_regime
 
 
+class TestRegimeSegments:
+    """Tests for segment-aware regime stratification."""
+
+    def test_returns_do_not_span_regime_gaps(self, analyzer: PerformanceAnalyzer) -> None:
+        start = datetime(2024, 1, 1, tzinfo=UTC)
+        # bull: 100 → 110, bear: 110 → 55, bull: 55 → 60.5 (+10% each bull stretch)
+        equity = _make_equity_curve(start, [100, 110, 80, 55, 55, 60.5])
+        labels = _make_regime_labels(start, ["bull", "bull", "bear", "bear", "bull", "bull"])
+
+        report = analyzer.analyze(equity, labels)
+
+        bull = report.by_regime["bull"]
+        assert bull.num_bars == 4
+        assert bull.total_return == pytest.approx(1.1 * 1.1 - 1)
+        assert bull.win_rate == 1.0
+        assert bull.max_drawdown == 0.0  # the bear stretch is not bull drawdown
+        assert bull.sharpe_ratio is None  # two identical +10% returns
+        bear = report.by_regime["bear"]
+        assert bear.total_return == pytest.approx(55 / 80 - 1)
+        assert bear.max_drawdown == pytest.approx(55 / 80 - 1)
+
+        assert [(s.regime, s.start, s.end, s.num_bars) for s in report.segments] == [
+            ("bull", 0, 1, 2),
+            ("bear", 2, 3, 2),
+            ("bull", 4, 5, 2),
+        ]
+        assert report.segments[2].total_return == pytest.approx(0.1)
+        assert report.segments[2].start_time == equity[4][0]
+        assert report.segments[1].max_drawdown == pytest.approx(55 / 80 - 1)
+
+    def test_segment_drawdown_chains_across_segments(self, analyzer: PerformanceAnalyzer) -> None:
+        start = datetime(2024, 1, 1, tzinfo=UTC)
+        equity = _make_equity_curve(start, [100, 90, 200, 180, 162])
+        labels = _make_regime_labels(start, ["risk", "risk", "calm", "risk", "risk"])
+
+        segments = analyzer.analyze_segments(equity, labels)
+        risk = analyzer.analyze_by_regime(equity, labels)["risk"]
+
+        assert all(isinstance(s, RegimeSegment) for s in segments)
+        assert [s.max_drawdown for s in segments] == pytest.approx([-0.1, 0.0, -0.1])
+        # Chained risk equity: 1.0 → 0.9 → 0.81, a 19% drawdown.
+        assert risk.max_drawdown == pytest.approx(-0.19)
+        assert risk.total_return == pytest.approx(-0.19)
+        assert risk.sharpe_ratio is None
+
+    def test_empty_curve_has_no_segments(self, analyzer: PerformanceAnalyzer) -> None:
+        assert analyzer.analyze_segments([], []) == ()
+        assert analyzer.analyze_by_regime([], []) == {}
+
+
 class TestPerformanceComparison:
     """Tests for candidate vs baseline comparison."""
 
@@ -211,3 +264,146 @@ class TestPerformanceComparison:
         assert "down" in by_regime
         assert "flat" in by_regime
         assert all(isinstance(v, RegimeMetrics) for v in by_regime.values())
+
+
+class TestComparisonMatrix:
+    """Tests for many-to-many candidate × baseline × regime comparison."""
+
+    def test_matrix_matches_pairwise_compare(self, analyzer: PerformanceAnalyzer) -> None:
+        start = datetime(2024, 1, 1, tzinfo=UTC)
+        labels = _make_regime_labels(start, ["bull", "bull", "bull", "bear", "bear", "bear"])
+        curves = {
+            "fast": [100, 105, 110, 108, 105, 104],
+            "slow": [100, 101, 102, 102.5, 103, 103],
+            "flat": [100, 100, 100, 100, 100, 100],
+        }
+        reports = {
+            name: analyzer.analyze(_make_equity_curve(start, values), labels)
+            for name, values in curves.items()
+        }
+        candidates = {name: reports[name] for name in ("fast", "slow")}
+        baselines = {name: reports[name] for name in ("slow", "flat")}
+
+        matrix = analyzer.compare_matrix(candidates, baselines)
+
+        assert matrix.candidates == ("fast", "slow")
+        assert matrix.baselines == ("slow", "flat")
+        assert matrix.regimes == ("aggregate", "bear", "bull")
+        assert len(matrix.rows()) == 2 * 2 * 3
+        for cand_name, cand in candidates.items():
+            for base_name, base in baselines.items():
+                pairwise = analyzer.compare(cand, base)
+                assert (
+                    matrix.get(cand_name, base_name, "aggregate").outperforms
+                    is pairwise.outperforms_aggregate
+                )
+                for regime, outperforms in pairwise.outperforms_per_regime.items():
+                    delta = matrix.get(cand_name, base_name, regime)
+                    assert delta.outperforms is outperforms
+                    assert delta.total_return_delta == pytest.approx(
+                        cand.by_regime[regime].total_return - base.by_regime[regime].total_return
+                    )
+        bull = matrix.get("fast", "flat", "bull")
+        assert bull.sharpe_delta is None  # flat baseline has no defined Sharpe
+
+    def test_missing_regimes_follow_compare_rules(self, analyzer: PerformanceAnalyzer) -> None:
+        start = datetime(2024, 1, 1, tzinfo=UTC)
+        equity = _make_equity_curve(start, [100, 101, 102, 103])
+        bull = analyzer.analyze(equity, _make_regime_labels(start, ["bull"] * 4))
+        bear = analyzer.analyze(equity, _make_regime_labels(start, ["bear"] * 4))
+
+        matrix = analyzer.compare_matrix({"bull_only": bull}, {"bear_only": bear, "same": bull})
+
+        assert matrix.get("bull_only", "bear_only", "bull").outperforms is True
+        assert matrix.get("bull_only", "bear_only", "bear").outperforms is False
+        assert matrix.get("bull_only", "same", "bear").outperforms is None
+        assert matrix.get("bull_only", "bear_only", "bull").total_return_delta is None
+        assert matrix.get("bull_only", "same", "bull").total_return_delta == 0.0
+
+    def test_aggregate_regime_label_is_rejected(self, analyzer: PerformanceAnalyzer) -> None:
+        start = datetime(2024, 1, 1, tzinfo=UTC)
+        equity = _make_equity_curve(start, [100, 101, 102, 103])
+        report = analyzer.analyze(equity, _make_regime_labels(start, ["aggregate"] * 4))
+        with pytest.raises(ValueError, match="reserved"):
+            analyzer.compare_matrix({"a": report}, {"b": report})
+
+    def test_numpy_backend_matches_reference(self, analyzer: PerformanceAnalyzer) -> None:
+        pytest.importorskip("numpy")
+        start = datetime(2024, 1, 1, tzinfo=UTC)
+        labels = _make_regime_labels(start, ["bull", "bull", "bear", "bear"])
+        reports = {
+            name: analyzer.analyze(_make_equity_curve(start, values), labels)
+            for name, values in {"up": [100, 102, 101, 104], "flat": [100] * 4}.items()
+        }
+        with use_backend("python"):
+            expected = analyzer.compare_matrix(reports, reports)
+        with use_backend("numpy"):
+            matrix = analyzer.compare_matrix(reports, reports)
+            assert matrix.total_return_deltas.shape == (2, 2, 3)
+            assert matrix.deltas == expected.deltas
+            assert matrix.rows() == expected.rows()
+            assert analyzer.compare_matrix(reports, {}).deltas == {}
+            assert analyzer.compare_matrix({}, reports).rows() == []
+
+    def test_cells_are_built_on_access(self, analyzer: PerformanceAnalyzer) -> None:
+        start = datetime(2024, 1, 1, tzinfo=UTC)
+        labels = _make_regime_labels(start, ["bull", "bull", "bear", "bear"])
+        report = analyzer.analyze(_make_equity_curve(start, [100, 102, 101, 104]), labels)
+        with use_backend("python"):
+            matrix = analyzer.compare_matrix({"a": report}, {"b": report})
+        assert "deltas" not in vars(matrix)
+        assert matrix.total_return_deltas == [[[0.0, 0.0, 0.0]]]
+        assert matrix.candidate_coverage == ((True, True, True),)
+        assert matrix.get("a", "b", "bull").outperforms is False
+        assert "deltas" not in vars(matrix)
+        assert len(matrix.deltas) == 3
+        with pytest.raises(KeyError):
+            matrix.get("a", "b", "sideways")
+
+
+class TestFrequencyMetrics:
+    """Tests for annualized per-frequency metrics."""
+
+    def test_annualizes_resampled_curves(self, analyzer: PerformanceAnalyzer) -> None:
+        start = datetime(2024, 1, 1, tzinfo=UTC)
+        daily_values = [100, 101, 100.5, 102, 103, 102.5, 104, 105, 104, 106]
+        # Hourly bars; each day's last bar carries the day's closing value.
+        curve = [
+            (start + timedelta(days=d, hours=h), Decimal(str(value + h / 1000)))
+            for d, value in enumerate(daily_values)
+            for h in range(24)
+        ]
+        daily_curve = [curve[0], *(curve[24 * d + 23] for d in range(len(daily_values)))]
+
+        result = analyzer.analyze_frequencies(curve)
+
+        assert set(result) == {"daily", "weekly", "monthly"}
+        daily = result["daily"]
+        expected = analyzer.analyze(daily_curve, []).aggregate
+        assert daily.periods_per_year == 252
+        assert daily.metrics == expected
+        assert daily.annualized_sharpe == pytest.approx(expected.sharpe_ratio * 252**0.5)
+        assert daily.annualized_return == pytest.approx(
+            (1 + expected.total_return) ** (252 / 10) - 1
+        )
+        monthly = result["monthly"]
+        assert monthly.metrics.num_bars == 2
+        assert monthly.annualized_sharpe is None
+        assert monthly.annualized_return == pytest.approx(
+            (1 + monthly.metrics.total_return) ** 12 - 1
+        )
+
+    def test_reuses_cached_resampling(self, analyzer: PerformanceAnalyzer) -> None:
+        start = datetime(2024, 1, 1, tzinfo=UTC)
+        curve = _make_equity_curve(start, [100, 90, 80], interval_hours=24)
+        resampled = ResampledEquityCurve.from_equity_curve(curve)
+
+        result = analyzer.analyze_frequencies(resampled, ["daily"])
+
+        assert list(result) == ["daily"]
+        assert result["daily"].metrics == analyzer.analyze(curve, []).aggregate
+
+    def test_total_loss_has_no_annualized_return(self, analyzer: PerformanceAnalyzer) -> None:
+        start = datetime(2024, 1, 1, tzinfo=UTC)
+        curve = _make_equity_curve(start, [100, 50, 0], interval_hours=24)
+        assert analyzer.analyze_frequencies(curve, ["daily"])["daily"].annualized_return is None
@@ -0,0 +1,64 @@
+"""Tests for calendar resampling of equity curves."""
+
+from __future__ import annotations
+
+from datetime import UTC, datetime, timedelta
+from decimal import Decimal
+
+import pytest
+
+from liq.metrics.resample import ResampledEquityCurve, resample_equity_curve
+
+
+def _hourly_curve(start: datetime, hours: int) -> list[tuple[datetime, Decimal]]:
+    return [(start + timedelta(hours=i), Decimal(100 + i)) for i in range(hours)]
+
+
+def test_last_value_buckets_with_opening_value() -> None:
+    start = datetime(2024, 1, 29, 12, tzinfo=UTC)  # Monday, ISO week 5
+    curve = _hourly_curve(start, 24 * 8)  # through Tuesday 2024-02-06 11:00
+
+    curves = resample_equity_curve(curve)
+
+    daily = curves["daily"]
+    assert daily[0] == curve[0]
+    assert [ts.date() for ts, _ in daily[1:]] == [
+        (start + timedelta(days=d)).date() for d in range(9)
+    ]
+    assert daily[1] == curve[11]  # 23:00 on the first day
+    assert daily[-1] == curve[-1]
+    # ISO weeks 5 and 6; months January and February.
+    assert curves["weekly"] == [curve[0], curve[24 * 6 + 11], curve[-1]]
+    assert curves["monthly"] == [curve[0], curve[24 * 2 + 11], curve[-1]]
+
+
+def test_single_bar_first_bucket_has_no_duplicate_anchor() -> None:
+    start = datetime(2024, 3, 1, 23, tzinfo=UTC)
+    curve = _hourly_curve(start, 3)
+
+    curves = resample_equity_curve(curve, ["daily"])
+
+    assert curves == {"daily": [curve[0], curve[2]]}
+
+
+def test_empty_curve() -> None:
+    assert resample_equity_curve([], ["daily", "monthly"]) == {"daily": [], "monthly": []}
+
+
+def test_rejects_unsorted_and_unknown_frequency() -> None:
+    start = datetime(2024, 1, 1, tzinfo=UTC)
+    curve = _hourly_curve(start, 3)
+    with pytest.raises(ValueError, match="sorted"):
+        resample_equity_curve([curve[1], curve[0]])
+    with pytest.raises(ValueError, match="unknown frequency"):
+        resample_equity_curve(curve, ["hourly"])  # type: ignore[list-item]
+
+
+def test_resampled_curve_cache() -> None:
+    curve = _hourly_curve(datetime(2024, 1, 1, tzinfo=UTC), 48)
+    resampled = ResampledEquityCurve.from_equity_curve(curve, ["daily", "weekly"])
+
+    assert resampled.frequencies == ("daily", "weekly")
+    assert resampled.curve("daily") is resampled.curves["daily"]
+    with pytest.raises(ValueError, match="not resampled"):
+        resampled.curve("monthly")
@@ -2,9 +2,18 @@
 
 from __future__ import annotations
 
+import random
+from array import array
+
 import pytest
 
-from liq.metrics.selector import compute_selector_economics
+from liq.metrics.selector import (
+    PackedDecisions,
+    SelectorEconomicsAccumulator,
+    bootstrap_selector_economics,
+    compute_selector_economics,
+    pack_decisions,
+)
 
 
 def test_selector_economics_accounts_for_removed_and_added_events() -> None:
@@ -61,3 +70,159 @@ def test_selector_economics_rejects_invalid_inputs(
 
     with pytest.raises(ValueError, match=message):
         compute_selector_economics(**inputs)  # type: ignore[arg-type]
+
+
+def test_pack_decisions_counts_trades_by_popcount() -> None:
+    packed = pack_decisions([1, 0, 1, 1, 0, 0, 0, 0, 1])
+
+    assert packed.length == 9
+    assert packed.trade_count == 4
+    assert packed.unpack() == (1, 0, 1, 1, 0, 0, 0, 0, 1)
+    assert packed.to_bytes() == bytes([0b00001101, 0b00000001])
+    assert PackedDecisions.from_bytes(packed.to_bytes(), 9) == packed
+
+
+def test_pack_decisions_accepts_numpy_and_typed_arrays() -> None:
+    expected = pack_decisions([1, 0, 1, 1])
+    assert pack_decisions(array("q", [1, 0, 1, 1])) == expected
+    np = pytest.importorskip("numpy")
+    assert pack_decisions(np.array([1, 0, 1, 1])) == expected
+    economics = compute_selector_economics(
+        reference_decision=np.array([1, 1, 0]),
+        candidate_decision=np.array([1, 0, 1]),
+        net_outcomes=np.array([0.01, -0.02, 0.03]),
+        gross_outcomes=np.array([0.01, -0.02, 0.03]),
+    )
+    assert economics.candidate_trade_count == 2
+
+
+@pytest.mark.parametrize("values", [(True, 0), (2, 0), (-1, 1), ("1", 0)])
+def test_pack_decisions_rejects_non_binary_values(values: tuple[object, ...]) -> None:
+    with pytest.raises(ValueError, match="binary"):
+        pack_decisions(values)  # type: ignore[arg-type]
+
+
+def test_packed_decisions_validate_their_bit_width() -> None:
+    with pytest.raises(ValueError, match="fit"):
+        PackedDecisions(bits=0b100, length=2)
+    with pytest.raises(ValueError, match="bytes"):
+        PackedDecisions.from_bytes(b"\x01\x00", 3)
+
+
+def test_selector_economics_matches_for_packed_and_sequence_decisions() -> None:
+    rng = random.Random(7)
+    size = 257
+    reference = [rng.randint(0, 1) for _ in range(size)]
+    candidate = [rng.randint(0, 1) for _ in range(size)]
+    net = [rng.gauss(0.0, 0.01) for _ in range(size)]
+    gross = [value + 0.001 for value in net]
+
+    unpacked = compute_selector_economics(
+        reference_decision=reference,
+        candidate_decision=candidate,
+        net_outcomes=net,
+        gross_outcomes=gross,
+    )
+    packed = compute_selector_economics(
+        reference_decision=pack_decisions(reference),
+        candidate_decision=pack_decisions(candidate),
+        net_outcomes=net,
+        gross_outcomes=gross,
+    )
+
+    assert packed == unpacked
+    assert packed.reference_trade_count == sum(reference)
+    removed = [r == 1 and c == 0 for r, c in zip(reference, candidate, strict=True)]
+    expected_avoided = -sum(v for v, flag in zip(net, removed, strict=True) if flag and v < 0)
+    assert packed.avoided_loss == pytest.approx(expected_avoided)
+
+
+def test_accumulator_matches_batch_economics_across_chunks() -> None:
+    rng = random.Random(11)
+    size = 300
+    reference = [rng.randint(0, 1) for _ in range(size)]
+    candidate = [rng.randint(0, 1) for _ in range(size)]
+    net = [rng.gauss(0.0, 0.01) for _ in range(size)]
+    gross = [value + 0.0005 for value in net]
+    batch = compute_selector_economics(
+        reference_decision=reference,
+        candidate_decision=candidate,
+        net_outcomes=net,
+        gross_outcomes=gross,
+    )
+
+    accumulator = SelectorEconomicsAccumulator()
+    worker = SelectorEconomicsAccumulator()
+    for start in range(0, size, 64):
+        target = accumulator if start < 192 else worker
+        target.update(
+            reference_decision=reference[start : start + 64],
+            candidate_decision=pack_decisions(candidate[start : start + 64]),
+            net_outcomes=net[start : start + 64],
+            gross_outcomes=gross[start : start + 64],
+        )
+    accumulator.merge(worker)
+    streamed = accumulator.result()
+
+    assert accumulator.event_count == size
+    for name, expected in batch.as_dict().items():
+        assert streamed.as_dict()[name] == pytest.approx(expected, rel=1e-9, abs=1e-12)
+
+
+def test_accumulator_requires_events_and_aligned_chunks() -> None:
+    accumulator = SelectorEconomicsAccumulator()
+    with pytest.raises(ValueError, match="accumulated"):
+        accumulator.result()
+    with pytest.raises(ValueError, match="align"):
+        accumulator.update(
+            reference_decision=(1, 0),
+            candidate_decision=(1,),
+            net_outcomes=(0.1, 0.2),
+            gross_outcomes=(0.1, 0.2),
+        )
+    accumulator.update(
+        reference_decision=(),
+        candidate_decision=(),
+        net_outcomes=(),
+        gross_outcomes=(),
+    )
+    assert accumulator.event_count == 0
+
+
+def test_bootstrap_selector_economics_brackets_point_estimates() -> None:
+    rng = random.Random(3)
+    size = 120
+    reference = [rng.randint(0, 1) for _ in range(size)]
+    candidate = [rng.randint(0, 1) for _ in range(size)]
+    net = [rng.gauss(0.001, 0.01) for _ in range(size)]
+    kwargs = {
+        "reference_decision": reference,
+        "candidate_decision": candidate,
+        "net_outcomes": net,
+        "gross_outcomes": net,
+    }
+    point = compute_selector_economics(**kwargs)  # type: ignore[arg-type]
+
+    result = bootstrap_selector_economics(
+        **kwargs,  # type: ignore[arg-type]
+        n_resamples=400,
+        method="circular",
+        block_length=4,
+        seed=9,
+        chunk_size=64,
+    )
+
+    assert result.n_resamples == 400
+    for name in ("net_pnl_delta", "sharpe_delta", "avoided_loss_minus_missed_profit"):
+        interval = getattr(result, name)
+        assert interval.estimate == getattr(point, name)
+        assert interval.low is not None and interval.high is not None
+        assert interval.low < interval.estimate < interval.high
+    assert result == bootstrap_selector_economics(
+        **kwargs,  # type: ignore[arg-type]
+        n_resamples=400,
+        method="circular",
+        block_length=4,
+        seed=9,
+        chunk_size=64,
+    )
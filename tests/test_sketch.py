@@ -0,0 +1,67 @@
+"""Tests for the streaming quantile sketch."""
+
+from __future__ import annotations
+
+import bisect
+import random
+
+import pytest
+
+from liq.metrics.estimators import quantile
+from liq.metrics.sketch import QuantileSketch
+
+
+def _rank_error(sorted_values: list[float], value: float, p: float) -> float:
+    return abs(bisect.bisect_right(sorted_values, value) / len(sorted_values) - p)
+
+
+def test_exact_until_compaction() -> None:
+    rng = random.Random(0)
+    values = [rng.gauss(0.0, 0.01) for _ in range(300)]
+    sketch = QuantileSketch(k=512)
+    sketch.extend(values)
+
+    assert sketch.is_exact
+    for p in (0.0, 0.01, 0.05, 0.5, 1.0):
+        assert sketch.quantile(p) == quantile(sorted(values), p)
+
+
+def test_compacted_rank_error_is_bounded() -> None:
+    rng = random.Random(1)
+    values = [rng.gauss(0.0, 1.0) for _ in range(50_000)]
+    sketch = QuantileSketch(k=256)
+    sketch.extend(values)
+    values.sort()
+
+    assert not sketch.is_exact
+    assert sketch.count == 50_000
+    for p in (0.01, 0.05, 0.5, 0.95):
+        assert _rank_error(values, sketch.quantile(p), p) < 0.02
+
+
+def test_merge_matches_single_stream_accuracy() -> None:
+    rng = random.Random(2)
+    parts = [[rng.uniform(-1.0, 1.0) for _ in range(10_000)] for _ in range(4)]
+    merged = QuantileSketch(k=256)
+    for part in parts:
+        sketch = QuantileSketch(k=256, seed=len(part))
+        sketch.extend(part)
+        merged.merge(sketch)
+    values = sorted(v for part in parts for v in part)
+
+    assert merged.count == len(values)
+    for p in (0.05, 0.5):
+        assert _rank_error(values, merged.quantile(p), p) < 0.02
+
+
+def test_invalid_usage() -> None:
+    with pytest.raises(ValueError, match="at least 8"):
+        QuantileSketch(k=4)
+    sketch = QuantileSketch(k=16)
+    with pytest.raises(ValueError, match="empty"):
+        sketch.quantile(0.5)
+    sketch.update(1.0)
+    with pytest.raises(ValueError, match=r"\[0, 1\]"):
+        sketch.quantile(1.5)
+    with pytest.raises(ValueError, match="merge"):
+        sketch.merge(QuantileSketch(k=32))
@@ -0,0 +1,114 @@
+"""Tests for the bulk validation helpers and the ``validate`` modes."""
+
+from __future__ import annotations
+
+import math
+from array import array
+
+import pytest
+
+from liq.metrics.drift import summarize_drift
+from liq.metrics.labels import summarize_labels
+from liq.metrics.prediction import summarize_classification, summarize_regression
+from liq.metrics.selector import compute_selector_economics
+from liq.metrics.validation import (
+    SAMPLE_SIZE,
+    all_finite,
+    as_sequence,
+    check_types,
+    element_type,
+    sample,
+)
+
+MESSAGE = "bad {type} at {index}"
+
+
+class TestCheckTypes:
+    def test_reports_first_offending_index(self) -> None:
+        with pytest.raises(TypeError, match="bad str at 2"):
+            check_types([1, 2.0, "x", None], (int, float), message=MESSAGE)
+        with pytest.raises(TypeError, match="bad bool at 1"):
+            check_types([1, True], int, rejected=bool, message=MESSAGE)
+
+    def test_accepts_subclasses(self) -> None:
+        class Price(float):
+            pass
+
+        check_types([Price(1.0), 2], (int, float), message=MESSAGE)
+
+    def test_typed_arrays_are_checked_by_code(self) -> None:
+        assert element_type(array("d", [1.0])) is float
+        assert element_type(memoryview(array("q", [1]))) is int
+        assert element_type(memoryview(b"ab").cast("c")) is None
+        assert element_type([1.0]) is None
+        check_types(array("i", [1, 2]), int, rejected=bool, message=MESSAGE)
+        with pytest.raises(TypeError, match="bad float at 0"):
+            check_types(array("d", [1.0]), int, message=MESSAGE)
+
+    def test_sample_mode_strides_over_large_inputs(self) -> None:
+        values: list[object] = [1] * (SAMPLE_SIZE * 4)
+        values[1] = "missed"
+        values[8] = "found"
+        assert len(sample(values, "sample")) == SAMPLE_SIZE
+        with pytest.raises(TypeError, match="bad str at 8"):
+            check_types(values, int, message=MESSAGE, mode="sample")
+        check_types(values, int, message=MESSAGE, mode="off")
+
+    def test_unknown_mode_raises(self) -> None:
+        with pytest.raises(ValueError, match="validate must be one of"):
+            check_types([1], int, message=MESSAGE, mode="fast")  # type: ignore[arg-type]
+
+    def test_as_sequence_keeps_sequences(self) -> None:
+        values = array("d", [1.0])
+        assert as_sequence(values) is values
+        assert as_sequence(x for x in (1, 2)) == [1, 2]
+
+
+class TestAllFinite:
+    def test_detects_non_finite_values(self) -> None:
+        assert all_finite([1.0, -2.0])
+        assert all_finite([])
+        assert not all_finite([1.0, math.nan])
+        assert not all_finite([math.inf, -math.inf])
+
+    def test_overflowing_sum_of_finite_values(self) -> None:
+        assert all_finite([1e308, 1e308])
+
+    def test_numpy_arrays_sum_in_bulk(self) -> None:
+        np = pytest.importorskip("numpy")
+        assert all_finite(np.array([1.0, 2.0]))
+        assert not all_finite(np.array([1.0, np.nan]))
+        assert element_type(np.array([1, 2])) is int
+
+
+class TestEntryPointModes:
+    def test_labels_accept_typed_int_arrays(self) -> None:
+        summary = summarize_labels(array("b", [1, -1, 0, 1]))
+        assert summary == {"positive": 2, "negative": 1, "neutral": 1}
+
+    def test_off_skips_checks(self) -> None:
+        assert summarize_labels([0.5, -1.0], validate="off")["positive"] == 1  # type: ignore[list-item]
+        assert summarize_drift([0.5, 1.0], validate="off") == {"max": 1.0, "mean": 0.75}
+        with pytest.raises(TypeError, match="must be numeric"):
+            summarize_drift([0.5, "x"], validate="sample")
+
+    def test_prediction_modes_match_full(self) -> None:
+        y_true = [i % 3 for i in range(5000)]
+        y_pred = [(i * 7) % 3 for i in range(5000)]
+        full = summarize_classification(y_true, y_pred)
+        assert summarize_classification(y_true, y_pred, validate="sample") == full
+        targets = [float(i % 11) for i in range(5000)]
+        assert summarize_regression(targets, targets, validate="off")["corr"] == pytest.approx(1.0)
+        with pytest.raises(TypeError, match="y_log_var must be numeric, got str at 1"):
+            summarize_regression([1.0, 2.0], [1.0, 2.0], [0.0, "x"])
+
+    def test_selector_finiteness_modes(self) -> None:
+        inputs = {
+            "reference_decision": (1, 0, 1),
+            "candidate_decision": (0, 1, 1),
+            "net_outcomes": (0.01, math.nan, 0.02),
+            "gross_outcomes": (0.01, 0.0, 0.02),
+        }
+        with pytest.raises(ValueError, match="net_outcomes must be finite"):
+            compute_selector_economics(**inputs)  # type: ignore[arg-type]
+        compute_selector_economics(**inputs, validate="off")  # type: ignore[arg-type]